@@ -5,12 +5,19 @@ ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
 BUNDLE_DIR="$ROOT/typescript/tmp/bundled"
 OUT="$ROOT/python/src/synesthetic_schemas"
 
-# 1) Bundle all schemas (no network; uses our custom resolver)
+# 1) Bundle all schemas (no network; uses our custom resolver). codegen/py_bundle.py
+#    replaces this once tests/test_py_bundle.py shows it matches ts_bundle.mjs.
 node "$ROOT/codegen/ts_bundle.mjs"
 
-# 2) Clean python package dir and make it importable
-rm -rf "$OUT"
+# 2) Clean previously generated modules and make the package importable.
+#    Hand-written modules (e.g. validation.py) carry no codegen header and are kept.
 mkdir -p "$OUT"
+for f in "$OUT"/*.py; do
+  [[ -e "$f" ]] || continue
+  if head -n 1 "$f" | grep -q '^# generated by datamodel-codegen'; then
+    rm -f "$f"
+  fi
+done
 : > "$OUT/__init__.py"
 : > "$OUT/py.typed"
 
@@ -44,5 +51,27 @@ for schema in "$BUNDLE_DIR"/*.schema.json; do
   echo "generated: $(basename "$out_py")"
 done
 
+# 5) Share identical classes across modules (synesthetic_asset.py, *_bundle.py
+#    import them from the component modules instead of re-declaring them)
+python "$ROOT/codegen/py_dedupe.py" "$OUT"
+
+# 6) Frozen, slotted dataclass twins of leaf models (frozen.py) for long-running
+#    runtimes; FROZEN_MODELS overrides the comma-separated model list
+FROZEN_ARGS=()
+if [[ -n "${FROZEN_MODELS:-}" ]]; then
+  FROZEN_ARGS+=(--models "$FROZEN_MODELS")
+fi
+python "$ROOT/codegen/py_frozen.py" "${FROZEN_ARGS[@]}" "$OUT"
+
+# 7) Lazy package namespace: models are importable from synesthetic_schemas but
+#    each module is only imported on first attribute access
+python "$ROOT/codegen/py_init.py" "$OUT"
+
+# 8) Ship the schema set as package data (synesthetic_schemas.validation loads it
+#    with importlib.resources when there is no source checkout)
+rm -rf "$OUT/schemas"
+mkdir -p "$OUT/schemas"
+cp "$ROOT"/jsonschema/*.schema.json "$OUT/schemas/"
+
 # Ensure py.typed exists for typed package distribution (keep deterministic)
 : > "$OUT/py.typed"
\ No newline at end of file
@@ -0,0 +1,324 @@
+#!/usr/bin/env python
+"""
+Bundle jsonschema/*.schema.json for codegen, without Node.js.
+
+Python port of codegen/ts_bundle.mjs, which runs @apidevtools/json-schema-ref-parser's
+bundle() once per schema. The output is meant to be byte-for-byte what that script
+writes to typescript/tmp/bundled/: tests/test_py_bundle.py compares it with that
+script's output committed under tests/fixtures/ts_bundle/ (`make bundle-goldens`),
+and gen_py.sh keeps running ts_bundle.mjs until those tests pass. All schemas are
+bundled in one process, and each file is read once.
+
+Same algorithm as ref-parser's bundle():
+
+  * crawl: walk the root schema, taking $defs/definitions first, then keys by length
+    (stable). Record every $ref (an "inventory" entry) with its path from the root,
+    depth and indirections. Entries for external files are crawled through, and each
+    $ref object keeps its shallowest entry.
+  * remap: sort the inventory by (file, hash, circular, extended, indirections,
+    depth, distance from $defs, path length). The first entry of each external
+    (file, hash) group is inlined at its location. Later entries to that value, or
+    to a value beneath it, become internal "#/..." refs to that location. Refs into
+    the root file keep their fragment.
+
+Absolute $refs resolve through the shared schema graph's $id -> file map
+(scripts/lib/schema_graph.py), then through the version.json base URL, as
+ts_bundle.mjs does. Nothing touches the network. ref-parser percent-encodes "$" in
+the pointers it writes, and ts_bundle.mjs decodes "%24" again; the port writes the
+decoded form. Numbers are printed like JSON.stringify (1.0 -> 1).
+
+Usage: python codegen/py_bundle.py [--out DIR] [<schema> ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import pathlib
+import sys
+from typing import Any
+from urllib.parse import quote, unquote, urldefrag, urljoin
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.lib.schema_graph import SCHEMA_DIR, SchemaGraph  # noqa: E402
+
+OUT_DIR = ROOT / "typescript" / "tmp" / "bundled"
+
+
+def _base_url() -> str:
+    version = json.loads((ROOT / "version.json").read_text())["schemaVersion"]
+    return f"https://schemas.synesthetic.dev/{version}/"
+
+
+# ---------------------------- pointers ----------------------------
+
+def _join(base: str, tokens: list[str]) -> str:
+    """ref-parser Pointer.join: RFC 6901 escape, then encodeURIComponent."""
+    if "#" not in base:
+        base += "#"
+    for t in tokens:
+        base += "/" + quote(t.replace("~", "~0").replace("/", "~1"), safe="-_.!~*'()")
+    return base
+
+
+def _parse(hash_: str) -> list[str]:
+    """ref-parser Pointer.parse of a '#/a/b' fragment."""
+    parts = hash_.partition("#")[2].split("/")[1:]
+    return [unquote(p).replace("~1", "/").replace("~0", "~") for p in parts]
+
+
+def _split(url: str) -> tuple[str, str]:
+    file, frag = urldefrag(url)
+    return file, "#" + frag if "#" in url else "#"
+
+
+def _is_ref(value: Any) -> bool:
+    return isinstance(value, dict) and isinstance(value.get("$ref"), str) and value["$ref"] != ""
+
+
+class _Entry:
+    __slots__ = (
+        "ref", "parent", "key", "path_from_root", "depth", "file", "hash",
+        "value", "circular", "extended", "external", "indirections",
+    )
+
+    def __init__(self, **kw: Any):
+        for k, v in kw.items():
+            setattr(self, k, v)
+
+
+# ---------------------------- bundler ----------------------------
+
+class Bundler:
+    """Bundles schemas of one directory; file contents are read once and re-parsed per bundle."""
+
+    def __init__(self, schema_dir: pathlib.Path = SCHEMA_DIR, graph: SchemaGraph | None = None):
+        self.schema_dir = schema_dir
+        self.graph = graph if graph is not None else SchemaGraph(schema_dir, None)
+        self.base_url = _base_url()
+        self._text: dict[str, str] = {}
+
+    def _read(self, name: str) -> str:
+        text = self._text.get(name)
+        if text is None:
+            text = self._text[name] = (self.schema_dir / name).read_text(encoding="utf-8")
+        return text
+
+    def _local_name(self, file: str) -> str | None:
+        if file in self.graph.ids:
+            return self.graph.ids[file]
+        if file.startswith(self.base_url):
+            return unquote(file[len(self.base_url):])
+        if file.startswith("file://"):
+            return pathlib.PurePosixPath(unquote(file[len("file://"):])).name
+        return None
+
+    def _doc(self, file: str) -> Any:
+        doc = self._docs.get(file)
+        if doc is None:
+            name = self._local_name(file)
+            if name is None or not (self.schema_dir / name).is_file():
+                raise FileNotFoundError(f"cannot resolve {file} locally")
+            doc = self._docs[file] = json.loads(self._read(name))
+        return doc
+
+    def _resolve(self, url: str) -> tuple[str, Any, int, bool]:
+        """(resolved url, value, indirections, circular), following $refs to $refs."""
+        seen = {url}
+        indirections = 0
+        while True:
+            file, hash_ = _split(url)
+            value = self._doc(file)
+            for token in _parse(hash_):
+                if isinstance(value, list) and token.isdigit() and int(token) < len(value):
+                    value = value[int(token)]
+                elif isinstance(value, dict) and token in value:
+                    value = value[token]
+                else:
+                    raise KeyError(f"cannot resolve {url}")
+            if not (_is_ref(value) and len(value) == 1):
+                return url, value, indirections, False
+            nxt = urljoin(url, value["$ref"])
+            if nxt in seen:
+                return url, value, indirections, True
+            seen.add(nxt)
+            url = nxt
+            indirections += 1
+
+    def bundle(self, name: str) -> Any:
+        """The bundled schema for jsonschema/<name>."""
+        root_url = (self.schema_dir / name).resolve().as_uri()
+        self._docs: dict[str, Any] = {root_url: json.loads(self._read(name))}
+        self._root_file = root_url
+        self._inventory: list[_Entry] = []
+        self._by_ref: dict[tuple[int, Any], _Entry] = {}
+        holder = {"schema": self._docs[root_url]}
+        self._crawl(holder, "schema", root_url + "#", "#", 0)
+        self._remap()
+        return holder["schema"]
+
+    def _crawl(self, parent: Any, key: Any, path: str, path_from_root: str, indirections: int) -> None:
+        obj = parent if key is None else parent[key]
+        if not isinstance(obj, dict | list):
+            return
+        if _is_ref(obj):
+            self._inventory_ref(parent, key, path, path_from_root, indirections)
+            return
+        keys = list(obj) if isinstance(obj, dict) else [str(i) for i in range(len(obj))]
+        keys.sort(key=lambda k: (k not in ("definitions", "$defs"), len(k)))
+        for k in keys:
+            idx = k if isinstance(obj, dict) else int(k)
+            value = obj[idx]
+            if _is_ref(value):
+                self._inventory_ref(obj, idx, path, _join(path_from_root, [k]), indirections)
+            else:
+                self._crawl(obj, idx, _join(path, [k]), _join(path_from_root, [k]), indirections)
+
+    def _inventory_ref(self, parent: Any, key: Any, path: str, path_from_root: str, indirections: int) -> None:
+        ref = parent if key is None else parent[key]
+        target, value, extra, circular = self._resolve(urljoin(path, ref["$ref"]))
+        depth = len(_parse(path_from_root))
+        file, hash_ = _split(target)
+        external = file != self._root_file
+        indirections += extra
+        existing = self._by_ref.get((id(parent), key))
+        if existing is not None:
+            if depth < existing.depth or indirections < existing.indirections:
+                self._inventory.remove(existing)
+            else:
+                return
+        entry = _Entry(
+            ref=ref, parent=parent, key=key, path_from_root=path_from_root, depth=depth,
+            file=file, hash=hash_, value=value, circular=circular,
+            extended=len(ref) > 1, external=external, indirections=indirections,
+        )
+        self._inventory.append(entry)
+        self._by_ref[(id(parent), key)] = entry
+        if existing is None or external:
+            self._crawl(value, None, target, path_from_root, indirections + 1)
+
+    def _remap(self) -> None:
+        def defs_index(p: str) -> int:
+            # as in ref-parser: path_from_root is encoded, so "/$defs" never matches here
+            return max(p.rfind("/definitions"), p.rfind("/$defs"))
+
+        def order(a: _Entry, b: _Entry) -> int:
+            if a.file != b.file:
+                return -1 if a.file < b.file else 1
+            if a.hash != b.hash:
+                return -1 if a.hash < b.hash else 1
+            if a.circular != b.circular:
+                return -1 if a.circular else 1
+            if a.extended != b.extended:
+                return 1 if a.extended else -1
+            if a.indirections != b.indirections:
+                return a.indirections - b.indirections
+            if a.depth != b.depth:
+                return a.depth - b.depth
+            da, db = defs_index(a.path_from_root), defs_index(b.path_from_root)
+            if da != db:
+                return db - da
+            return len(a.path_from_root) - len(b.path_from_root)
+
+        file = hash_ = path_from_root = None
+        for e in sorted(self._inventory, key=functools.cmp_to_key(order)):
+            if not e.external:
+                e.ref["$ref"] = e.hash
+            elif e.file == file and e.hash == hash_:
+                e.ref["$ref"] = path_from_root
+            elif e.file == file and e.hash.startswith(hash_ + "/"):
+                e.ref["$ref"] = _join(path_from_root, _parse(e.hash.replace(hash_, "#", 1)))
+            else:
+                file, hash_, path_from_root = e.file, e.hash, e.path_from_root
+                value = e.value
+                if e.extended and isinstance(value, dict):
+                    merged = {k: v for k, v in e.ref.items() if k != "$ref"}
+                    for k, v in value.items():
+                        merged.setdefault(k, v)
+                    value = merged
+                e.ref = e.parent[e.key] = value
+                if e.circular:
+                    e.ref["$ref"] = e.path_from_root
+        _decode_ref_fragments(self._docs[self._root_file])
+
+
+def _decode_ref_fragments(node: Any) -> None:
+    """ts_bundle.mjs: turn ref-parser's "%24defs" back into "$defs" in internal refs."""
+    if isinstance(node, dict):
+        for k, v in node.items():
+            if k == "$ref" and isinstance(v, str) and v.startswith("#"):
+                node[k] = v.replace("%24", "$")
+            elif isinstance(v, dict | list):
+                _decode_ref_fragments(v)
+    elif isinstance(node, list):
+        for v in node:
+            _decode_ref_fragments(v)
+
+
+# ---------------------------- output ----------------------------
+
+def _js_number(x: float) -> str:
+    """JSON.stringify's rendering of a finite double (shortest round-trip digits)."""
+    if x == int(x) and abs(x) < 1e16:  # beyond this, int() shows more digits than repr
+        return str(int(x))
+    mantissa, _, exp = repr(x).partition("e")
+    if not exp:
+        return mantissa
+    e = int(exp)
+    if e >= 21 or e <= -7:
+        return f"{mantissa}e{'+' if e > 0 else '-'}{abs(e)}"
+    sign, digits = ("-", mantissa[1:]) if x < 0 else ("", mantissa)
+    digits = digits.replace(".", "")
+    if e < 0:
+        return f"{sign}0.{'0' * (-e - 1)}{digits}"
+    digits = digits.ljust(e + 1, "0")
+    return f"{sign}{digits[: e + 1]}.{digits[e + 1 :]}".rstrip(".")
+
+
+def dump(data: Any) -> str:
+    """JSON.stringify(data, null, 2) + newline."""
+    floats: list[str] = []
+
+    def prepare(node: Any) -> Any:
+        if isinstance(node, float):
+            floats.append(_js_number(node))
+            return f"\0float{len(floats) - 1}\0"
+        if isinstance(node, dict):
+            return {k: prepare(v) for k, v in node.items()}
+        if isinstance(node, list):
+            return [prepare(v) for v in node]
+        return node
+
+    text = json.dumps(prepare(data), indent=2, ensure_ascii=False)
+    for i, f in enumerate(floats):
+        text = text.replace(f'"\\u0000float{i}\\u0000"', f, 1)
+    return text + "\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Bundle schemas for codegen (no Node.js)")
+    ap.add_argument("--out", default=str(OUT_DIR), help="Output directory")
+    ap.add_argument("schemas", nargs="*", help="Schema file names (default: all in jsonschema/)")
+    args = ap.parse_args(argv)
+
+    graph = SchemaGraph()
+    bundler = Bundler(SCHEMA_DIR, graph)
+    out_dir = pathlib.Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for name in args.schemas or graph.files:
+        out = out_dir / name
+        out.write_text(dump(bundler.bundle(name)), encoding="utf-8")
+        try:
+            shown = out.resolve().relative_to(ROOT)
+        except ValueError:
+            shown = out
+        print(f"bundled: {name} → {shown}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+"""
+Deduplicate the classes datamodel-codegen emits once per bundled schema.
+
+Every bundled schema inlines its $refs, so e.g. synesthetic_asset.py re-declares
+ModulationItem, Rule, ControlParameter, Shader, Tone, Haptic and their enums. This
+pass rewrites the generated modules in place so each shared class is defined once,
+in the smallest module that declares it, and imported everywhere else:
+
+  * classes are shared only when their name and AST are identical;
+  * a class is shared only if every generated class it references resolves to the
+    same definition in both modules (iterated to a fixed point);
+  * imports left unused by the removal are pruned.
+
+Only files carrying the datamodel-codegen header are touched; the pass is idempotent.
+
+Usage: python codegen/py_dedupe.py [--check] [<package dir>]
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+DEFAULT_PKG = ROOT / "python" / "src" / "synesthetic_schemas"
+HEADER = "# generated by datamodel-codegen"
+LINE_LENGTH = 88  # black default, as used by datamodel-codegen
+
+
+class _Module:
+    def __init__(self, path: pathlib.Path):
+        self.path = path
+        self.name = path.stem
+        self.source = path.read_text(encoding="utf-8")
+        self.tree = ast.parse(self.source)
+        self.classes: dict[str, ast.ClassDef] = {
+            n.name: n for n in self.tree.body if isinstance(n, ast.ClassDef)
+        }
+        self.dumps = {name: ast.dump(node) for name, node in self.classes.items()}
+        self.refs = {name: _names_used(node) & set(self.classes) - {name} for name, node in self.classes.items()}
+
+
+def _names_used(node: ast.AST) -> set[str]:
+    return {n.id for n in ast.walk(node) if isinstance(n, ast.Name)}
+
+
+def load_modules(pkg: pathlib.Path) -> list[_Module]:
+    mods = []
+    for p in sorted(pkg.glob("*.py")):
+        with p.open(encoding="utf-8") as fh:
+            if fh.readline().startswith(HEADER):
+                mods.append(_Module(p))
+    return mods
+
+
+def plan(mods: list[_Module]) -> dict[str, dict[str, str]]:
+    """Return {module: {class: owner module}} for every class to import instead of define."""
+    by_name = {m.name: m for m in mods}
+    groups: dict[tuple[str, str], list[str]] = {}
+    for m in mods:
+        for cls, dump in m.dumps.items():
+            groups.setdefault((cls, dump), []).append(m.name)
+
+    # owner = the smallest module defining the class (then alphabetical)
+    shared: dict[str, dict[str, str]] = {m.name: {} for m in mods}
+    for (cls, _), names in groups.items():
+        if len(names) < 2:
+            continue
+        owner = min(names, key=lambda n: (len(by_name[n].classes), n))
+        for n in names:
+            if n != owner:
+                shared[n][cls] = owner
+
+    def resolve(mod: str, cls: str) -> str:
+        return shared[mod].get(cls, mod)
+
+    # drop shares whose referenced classes would resolve differently (fixed point)
+    changed = True
+    while changed:
+        changed = False
+        for mod, imports in shared.items():
+            for cls, owner in list(imports.items()):
+                refs = by_name[mod].refs[cls]
+                if any(resolve(mod, r) != resolve(owner, r) for r in refs):
+                    del imports[cls]
+                    changed = True
+    return {mod: imports for mod, imports in shared.items() if imports}
+
+
+def _format_import(module: str, names: list[str]) -> list[str]:
+    line = f"from {module} import {', '.join(names)}"
+    if len(line) <= LINE_LENGTH:
+        return [line]
+    return [f"from {module} import ("] + [f"    {n}," for n in names] + [")"]
+
+
+def rewrite(mod: _Module, imports: dict[str, str]) -> str:
+    lines = mod.source.splitlines()
+    body = [n for n in mod.tree.body if not (isinstance(n, ast.ClassDef) and n.name in imports)]
+    header_end = 0
+    while header_end < len(lines) and lines[header_end].startswith("#"):
+        header_end += 1
+
+    used: set[str] = set()
+    for node in body:
+        if not isinstance(node, ast.Import | ast.ImportFrom):
+            used |= _names_used(node)
+
+    # existing imports, pruned; stdlib/third-party grouping is preserved
+    import_lines: list[str] = []
+    group, last_group = 0, None
+    for node in mod.tree.body:
+        if not isinstance(node, ast.ImportFrom):
+            continue
+        if lines[node.lineno - 2] == "":
+            group += 1
+        names = [a.name for a in node.names]
+        if node.module != "__future__":
+            names = [n for n in names if n in used]
+        if not names:
+            continue
+        if last_group is not None and group != last_group:
+            import_lines.append("")
+        import_lines.extend(_format_import("." * node.level + (node.module or ""), names))
+        last_group = group
+    by_owner: dict[str, list[str]] = {}
+    for cls, owner in imports.items():
+        by_owner.setdefault(owner, []).append(cls)
+    if by_owner:
+        import_lines.append("")
+        for owner in sorted(by_owner):
+            import_lines.extend(_format_import(f".{owner}", sorted(by_owner[owner])))
+
+    blocks = []
+    for node in body:
+        if isinstance(node, ast.Import | ast.ImportFrom):
+            continue
+        start = node.lineno - 1
+        if isinstance(node, ast.ClassDef) and node.decorator_list:
+            start = node.decorator_list[0].lineno - 1
+        blocks.append("\n".join(lines[start : node.end_lineno]))
+
+    out = lines[:header_end] + [""] + import_lines
+    text = "\n".join(out) + "\n"
+    if blocks:
+        text += "\n\n" + "\n\n\n".join(blocks) + "\n"
+    return text
+
+
+def dedupe(pkg: pathlib.Path, check: bool = False) -> list[pathlib.Path]:
+    mods = load_modules(pkg)
+    shared = plan(mods)
+    changed = []
+    for mod in mods:
+        imports = shared.get(mod.name)
+        if not imports:
+            continue
+        new = rewrite(mod, imports)
+        if new != mod.source:
+            changed.append(mod.path)
+            if not check:
+                mod.path.write_text(new, encoding="utf-8")
+    return changed
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Share identical classes across generated model modules")
+    ap.add_argument("pkg", nargs="?", default=str(DEFAULT_PKG), help="Generated package directory")
+    ap.add_argument("--check", action="store_true", help="Report modules that would change; do not write")
+    args = ap.parse_args(argv)
+
+    changed = dedupe(pathlib.Path(args.pkg), check=args.check)
+    for p in changed:
+        print(f"{'would dedupe' if args.check else 'deduped'}: {p.name}")
+    return 1 if (args.check and changed) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,275 @@
+#!/usr/bin/env python
+"""
+Emit frozen, slotted dataclass twins of leaf models (synesthetic_schemas/frozen.py).
+
+A long-running runtime that keeps thousands of assets in memory does not need a
+Pydantic instance (``__dict__``, ``__pydantic_fields_set__``, extras, private
+state) per modulation or parameter. For each selected model this writes a
+``@dataclass(frozen=True, slots=True, kw_only=True)`` twin with the same field
+names, plus lossless conversion both ways:
+
+    twin = frozen.ModulationItem.from_model(item)
+    assert twin.to_model() == item    # fields set / unset are preserved too
+
+Lists become tuples; enums are the models' own enum classes; nested models must
+be selected as well (their twins are pulled in automatically). Which fields were
+explicitly set is kept as a small int bitmask (``_set_mask``).
+
+Usage: python codegen/py_frozen.py [--models A,B,...] [<package dir>]
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import pathlib
+import sys
+from enum import Enum
+from types import NoneType, UnionType
+from typing import Annotated, Any, Union, get_args, get_origin
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+DEFAULT_PKG = ROOT / "python" / "src" / "synesthetic_schemas"
+DEFAULT_MODELS = ("ModulationItem", "HapticParameter", "InputParameter", "ControlParameter")
+HEADER = "# generated by codegen/py_frozen.py -- do not edit"
+
+
+class _Emitter:
+    def __init__(self):
+        self.order: list[type] = []  # dependency order: nested twins first
+        self.imports: dict[str, set] = {}  # module -> names (enums, typing)
+        self.typing: set = set()
+
+    def add(self, model: type) -> None:
+        if model in self.order:
+            return
+        for field in model.model_fields.values():
+            for nested in _models_in(field.annotation):
+                self.add(nested)
+        self.order.append(model)
+
+    # -- annotations
+
+    def ann(self, tp: Any) -> str:
+        origin = get_origin(tp)
+        if origin is Annotated:
+            return self.ann(get_args(tp)[0])
+        if origin is Union or origin is UnionType:
+            args = get_args(tp)
+            members = [a for a in args if a is not NoneType]
+            if len(members) == 1 and len(args) == 2:
+                self.typing.add("Optional")
+                return f"Optional[{self.ann(members[0])}]"
+            self.typing.add("Union")
+            return f"Union[{', '.join(self.ann(a) for a in args)}]"
+        if origin is list:
+            (item,) = get_args(tp)
+            return f"tuple[{self.ann(item)}, ...]"
+        if origin is dict:
+            k, v = get_args(tp)
+            return f"dict[{self.ann(k)}, {self.ann(v)}]"
+        if tp is Any:
+            self.typing.add("Any")
+            return "Any"
+        if tp is NoneType:
+            return "None"
+        if isinstance(tp, type):
+            if _is_model(tp):
+                return tp.__name__
+            if issubclass(tp, Enum):
+                self.imports.setdefault(tp.__module__, set()).add(tp.__name__)
+                return tp.__name__
+            if tp.__module__ == "builtins":
+                return tp.__name__
+        raise TypeError(f"unsupported annotation for a frozen twin: {tp!r}")
+
+    def default(self, f: Any) -> str:
+        if f.default_factory is not None:
+            raise TypeError("default_factory fields are not supported in frozen twins")
+        value = f.default
+        if isinstance(value, Enum):
+            self.imports.setdefault(type(value).__module__, set()).add(type(value).__name__)
+            return f"{type(value).__name__}.{value.name}"
+        if isinstance(value, list):
+            return repr(tuple(value))
+        if isinstance(value, dict | set):
+            raise TypeError(f"mutable default {value!r} is not supported in frozen twins")
+        return repr(value)
+
+    # -- conversions (expressions over `v`)
+
+    def to_twin(self, tp: Any, v: str, depth: int = 0) -> str:
+        origin = get_origin(tp)
+        if origin is Annotated:
+            return self.to_twin(get_args(tp)[0], v, depth)
+        if origin is Union or origin is UnionType:
+            members = [a for a in get_args(tp) if a is not NoneType]
+            inner = self.to_twin(members[0], v, depth) if len(members) == 1 else v
+            return v if inner == v else f"None if {v} is None else {inner}"
+        if origin is list:
+            x = f"x{depth}"
+            inner = self.to_twin(get_args(tp)[0], x, depth + 1)
+            return f"tuple({v})" if inner == x else f"tuple({inner} for {x} in {v})"
+        if isinstance(tp, type) and _is_model(tp):
+            return f"{tp.__name__}.from_model({v})"
+        return v
+
+    def to_model(self, tp: Any, v: str, depth: int = 0) -> str:
+        origin = get_origin(tp)
+        if origin is Annotated:
+            return self.to_model(get_args(tp)[0], v, depth)
+        if origin is Union or origin is UnionType:
+            members = [a for a in get_args(tp) if a is not NoneType]
+            inner = self.to_model(members[0], v, depth) if len(members) == 1 else v
+            return v if inner == v else f"None if {v} is None else {inner}"
+        if origin is list:
+            x = f"x{depth}"
+            inner = self.to_model(get_args(tp)[0], x, depth + 1)
+            return f"list({v})" if inner == x else f"[{inner} for {x} in {v}]"
+        if isinstance(tp, type) and _is_model(tp):
+            return f"{v}.to_model()"
+        return v
+
+    # -- output
+
+    def render(self) -> str:
+        classes = [self.render_class(m) for m in self.order]
+        models_by_module: dict[str, list[str]] = {}
+        for m in self.order:
+            models_by_module.setdefault(m.__module__, []).append(m.__name__)
+
+        lines = [
+            HEADER,
+            '"""',
+            "Frozen, slotted twins of leaf models for memory-compact runtimes.",
+            "",
+            "Same field names as the Pydantic models; lists are tuples. Convert with",
+            "``Twin.from_model(model)`` and ``twin.to_model()`` (lossless, including which",
+            "fields were explicitly set).",
+            '"""',
+            "",
+            "from __future__ import annotations",
+            "",
+            "from dataclasses import dataclass, field",
+        ]
+        if self.typing:
+            lines.append(f"from typing import {', '.join(sorted(self.typing))}")
+        lines.append("")
+        # one import per source module: enums as-is, models aliased to _Name
+        rel = {mod: "." + mod.rsplit(".", 1)[-1] for mod in set(self.imports) | set(models_by_module)}
+        for mod in sorted(rel, key=lambda m: rel[m]):
+            names = sorted(self.imports.get(mod, ()))
+            names += [f"{n} as _{n}" for n in sorted(models_by_module.get(mod, ()))]
+            lines.append(_wrap(f"from {rel[mod]} import ", names, "(", ")"))
+        lines += [
+            "",
+            _wrap("__all__ = ", [f"'{m.__name__}'" for m in self.order], "[", "]", always=True),
+            "",
+            "",
+            "def _mask(names: tuple[str, ...], fields_set: set[str]) -> int:",
+            "    return sum(1 << i for i, n in enumerate(names) if n in fields_set)",
+            "",
+            "",
+            "def _unmask(names: tuple[str, ...], mask: int) -> set[str]:",
+            "    return {n for i, n in enumerate(names) if mask >> i & 1}",
+        ]
+        return "\n".join(lines) + "\n\n\n" + "\n\n\n".join(classes) + "\n"
+
+    def render_class(self, model: type) -> str:
+        name = model.__name__
+        fields = model.model_fields
+        names = tuple(fields)
+        out = [
+            "@dataclass(frozen=True, slots=True, kw_only=True)",
+            f"class {name}:",
+            f'    """Frozen twin of :class:`{model.__module__}.{name}`."""',
+            "",
+        ]
+        for fname, f in fields.items():
+            ann = self.ann(f.annotation)
+            if f.is_required():
+                out.append(f"    {fname}: {ann}")
+            else:
+                out.append(f"    {fname}: {ann} = {self.default(f)}")
+        out.append("    _set_mask: int = field(default=0, repr=False, compare=False)")
+        out += [
+            "",
+            "    @classmethod",
+            f"    def from_model(cls, m: _{name}) -> {name}:",
+            "        d = m.__dict__",
+            "        return cls(",
+        ]
+        for fname, f in fields.items():
+            out.append(_kwarg(fname, self.to_twin(f.annotation, f"d[{fname!r}]")))
+        out += [
+            f"            _set_mask=_mask(_{name}_FIELDS, m.model_fields_set),",
+            "        )",
+            "",
+            f"    def to_model(self) -> _{name}:",
+            f"        return _{name}.model_construct(",
+            f"            _fields_set=_unmask(_{name}_FIELDS, self._set_mask),",
+        ]
+        for fname, f in fields.items():
+            out.append(_kwarg(fname, self.to_model(f.annotation, f"self.{fname}")))
+        out += ["        )"]
+        cls_src = "\n".join(out)
+        fields_const = _wrap(f"_{name}_FIELDS = ", [repr(n) for n in names], "(", ")", always=True)
+        return f"{fields_const}\n\n\n{cls_src}"
+
+
+def _is_model(tp: type) -> bool:
+    return hasattr(tp, "model_fields") and hasattr(tp, "model_construct")
+
+
+def _models_in(tp: Any) -> list[type]:
+    if isinstance(tp, type) and _is_model(tp):
+        return [tp]
+    return [m for a in get_args(tp) for m in _models_in(a)]
+
+
+def _kwarg(name: str, expr: str) -> str:
+    line = f"            {name}={expr},"
+    if len(line) <= 88:
+        return line
+    return f"            {name}=(\n                {expr}\n            ),"
+
+
+def _wrap(prefix: str, items: list[str], open_: str, close: str, always: bool = False) -> str:
+    """Black-style: one line if it fits in 88 columns, else one item per line."""
+    one = f"{prefix}{open_ if always else ''}{', '.join(items)}{close if always else ''}"
+    if len(one) <= 88:
+        return one
+    return "\n".join([f"{prefix}{open_}"] + [f"    {i}," for i in items] + [close])
+
+
+def render(pkg_dir: pathlib.Path, models: list[str]) -> str:
+    # resolve names the way the package namespace does (py_init), without
+    # relying on __init__.py having been written yet
+    sys.path.insert(0, str(pkg_dir.parent))
+    sys.path.insert(0, str(ROOT / "codegen"))
+    from py_init import collect
+
+    owners = collect(pkg_dir)
+    em = _Emitter()
+    for name in models:
+        if name not in owners:
+            raise SystemExit(f"unknown model: {name}")
+        module = importlib.import_module(f"{pkg_dir.name}.{owners[name]}")
+        em.add(getattr(module, name))
+    return em.render()
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Emit frozen dataclass twins of leaf models")
+    ap.add_argument("pkg", nargs="?", default=str(DEFAULT_PKG), help="Generated package directory")
+    ap.add_argument("--models", default=",".join(DEFAULT_MODELS), help="Comma-separated model names")
+    args = ap.parse_args(argv)
+    pkg = pathlib.Path(args.pkg).resolve()
+    out = pkg / "frozen.py"
+    out.write_text(render(pkg, [m for m in args.models.split(",") if m]), encoding="utf-8")
+    print(f"generated: {out.name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+"""
+Write the lazy synesthetic_schemas/__init__.py for the generated models.
+
+The package namespace exposes every generated model class (and every submodule
+and subpackage) through a module-level __getattr__, so `import synesthetic_schemas`
+is free and a model module is only imported -- and its Pydantic schemas built --
+on first access. When a class name is declared by more than one module, the module
+named after it wins (e.g. `Control` -> control.py; the asset's container stays at
+synesthetic_asset.Control).
+
+Usage: python codegen/py_init.py [<package dir>]
+"""
+
+from __future__ import annotations
+
+import ast
+import pathlib
+import re
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+DEFAULT_PKG = ROOT / "python" / "src" / "synesthetic_schemas"
+GENERATED = "# generated by datamodel-codegen"
+
+TEMPLATE = '''\
+# generated by codegen/py_init.py -- do not edit
+"""
+Synesthetic schema models.
+
+Model classes and submodules are loaded on first attribute access, so importing
+the package does not import Pydantic or build any model schema.
+"""
+
+from __future__ import annotations
+
+import importlib
+
+# typing is not imported at runtime: it costs more than the rest of this module
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+{type_checking}
+
+_EXPORTS: dict[str, str] = {{
+{exports}
+}}
+
+_SUBMODULES = frozenset({{
+{submodules}
+}})
+
+__all__ = [
+{all}
+]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(f'.{{module}}', __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f'.{{name}}', __name__)
+    else:
+        raise AttributeError(f'module {{__name__!r}} has no attribute {{name!r}}')
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
+'''
+
+
+def _snake(name: str) -> str:
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+def collect(pkg: pathlib.Path) -> dict[str, str]:
+    """Return {class name: defining module} over the generated modules."""
+    owners: dict[str, list[str]] = {}
+    for p in sorted(pkg.glob("*.py")):
+        text = p.read_text(encoding="utf-8")
+        if not text.startswith(GENERATED):
+            continue
+        for node in ast.parse(text).body:
+            if isinstance(node, ast.ClassDef):
+                owners.setdefault(node.name, []).append(p.stem)
+    return {
+        name: (_snake(name) if _snake(name) in mods else mods[0])
+        for name, mods in sorted(owners.items())
+    }
+
+
+def render(pkg: pathlib.Path) -> str:
+    exports = collect(pkg)
+    by_module: dict[str, list[str]] = {}
+    for name, mod in exports.items():
+        by_module.setdefault(mod, []).append(name)
+    submodules = sorted(
+        [p.stem for p in pkg.glob("*.py") if not p.stem.startswith("_")]
+        + [p.parent.name for p in pkg.glob("*/__init__.py") if not p.parent.name.startswith("_")]
+    )
+    lines = []
+    for mod in sorted(by_module):
+        line = f"    from .{mod} import {', '.join(by_module[mod])}"
+        if len(line) > 88:
+            line = "\n".join([f"    from .{mod} import ("] + [f"        {n}," for n in by_module[mod]] + ["    )"])
+        lines.append(line)
+    type_checking = "\n".join(lines)
+    return TEMPLATE.format(
+        type_checking=type_checking,
+        exports="\n".join(f"    '{n}': '{m}'," for n, m in exports.items()),
+        submodules="\n".join(f"    '{m}'," for m in submodules),
+        all="\n".join(f"    '{n}'," for n in exports),
+    )
+
+
+def main(argv: list[str]) -> int:
+    pkg = pathlib.Path(argv[0]) if argv else DEFAULT_PKG
+    (pkg / "__init__.py").write_text(render(pkg), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -11,15 +11,27 @@ const SCHEMA_DIR = path.join(ROOT, "jsonschema");
 const OUT_DIR = path.join(ROOT, "typescript", "tmp", "bundled");
 await fs.mkdir(OUT_DIR, { recursive: true });
 
+// $id → file name from the shared schema graph (scripts/lib/schema_graph.py), when built
+const graphIds = new Map();
+try {
+  const graph = JSON.parse(await fs.readFile(path.join(ROOT, ".cache", "schema_graph.json"), "utf8"));
+  for (const [name, entry] of Object.entries(graph.files ?? {})) {
+    if (entry.id) graphIds.set(entry.id, name);
+  }
+} catch {
+  // no graph yet: fall back to the version prefix below
+}
+
 // Map canonical HTTP $id → local file in jsonschema/
 const BASE = `https://schemas.synesthetic.dev/${schemaVersion()}/`;
 const synIdResolver = {
   order: 1,
   canRead(file) {
-    return typeof file.url === "string" && file.url.startsWith(BASE);
+    return typeof file.url === "string" && (graphIds.has(file.url) || file.url.startsWith(BASE));
   },
   async read(file) {
-    const name = decodeURIComponent(file.url.slice(BASE.length)); // e.g. "control.schema.json"
+    // e.g. "control.schema.json"
+    const name = graphIds.get(file.url) ?? decodeURIComponent(file.url.slice(BASE.length));
     const p = path.join(SCHEMA_DIR, name);
     return fs.readFile(p, "utf8");
   },
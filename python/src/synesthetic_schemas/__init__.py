@@ -0,0 +1,148 @@
+# generated by codegen/py_init.py -- do not edit
+"""
+Synesthetic schema models.
+
+Model classes and submodules are loaded on first attribute access, so importing
+the package does not import Pydantic or build any model schema.
+"""
+
+from __future__ import annotations
+
+import importlib
+
+# typing is not imported at runtime: it costs more than the rest of this module
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+    from .control import (
+        ActionType,
+        AxisType,
+        ComboType,
+        Control,
+        CurveType,
+        DataType,
+        Mapping,
+    )
+    from .control_bundle import ControlBundle, ControlParameter
+    from .haptic import DeviceConfig, DeviceOptionValue, Haptic, HapticParameter
+    from .modulation import Modulation, ModulationItem, ScaleProfile, Type, Waveform
+    from .rule import Rule
+    from .rule_bundle import RuleBundle
+    from .shader import InputParameter, Shader, UniformDef
+    from .synesthetic_asset import SynestheticAsset
+    from .tone import (
+        SynthType,
+        Tone,
+        ToneEffect,
+        ToneMetaInfo,
+        ToneParameter,
+        TonePart,
+        TonePattern,
+        ToneSynth,
+        ToneSynthOptions,
+    )
+
+_EXPORTS: dict[str, str] = {
+    'ActionType': 'control',
+    'AxisType': 'control',
+    'ComboType': 'control',
+    'Control': 'control',
+    'ControlBundle': 'control_bundle',
+    'ControlParameter': 'control_bundle',
+    'CurveType': 'control',
+    'DataType': 'control',
+    'DeviceConfig': 'haptic',
+    'DeviceOptionValue': 'haptic',
+    'Haptic': 'haptic',
+    'HapticParameter': 'haptic',
+    'InputParameter': 'shader',
+    'Mapping': 'control',
+    'Modulation': 'modulation',
+    'ModulationItem': 'modulation',
+    'Rule': 'rule',
+    'RuleBundle': 'rule_bundle',
+    'ScaleProfile': 'modulation',
+    'Shader': 'shader',
+    'SynestheticAsset': 'synesthetic_asset',
+    'SynthType': 'tone',
+    'Tone': 'tone',
+    'ToneEffect': 'tone',
+    'ToneMetaInfo': 'tone',
+    'ToneParameter': 'tone',
+    'TonePart': 'tone',
+    'TonePattern': 'tone',
+    'ToneSynth': 'tone',
+    'ToneSynthOptions': 'tone',
+    'Type': 'modulation',
+    'UniformDef': 'shader',
+    'Waveform': 'modulation',
+}
+
+_SUBMODULES = frozenset({
+    'adapters',
+    'control',
+    'control_bundle',
+    'frozen',
+    'haptic',
+    'modulation',
+    'rule',
+    'rule_bundle',
+    'runtime',
+    'shader',
+    'synesthetic_asset',
+    'tone',
+    'validation',
+})
+
+__all__ = [
+    'ActionType',
+    'AxisType',
+    'ComboType',
+    'Control',
+    'ControlBundle',
+    'ControlParameter',
+    'CurveType',
+    'DataType',
+    'DeviceConfig',
+    'DeviceOptionValue',
+    'Haptic',
+    'HapticParameter',
+    'InputParameter',
+    'Mapping',
+    'Modulation',
+    'ModulationItem',
+    'Rule',
+    'RuleBundle',
+    'ScaleProfile',
+    'Shader',
+    'SynestheticAsset',
+    'SynthType',
+    'Tone',
+    'ToneEffect',
+    'ToneMetaInfo',
+    'ToneParameter',
+    'TonePart',
+    'TonePattern',
+    'ToneSynth',
+    'ToneSynthOptions',
+    'Type',
+    'UniformDef',
+    'Waveform',
+]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
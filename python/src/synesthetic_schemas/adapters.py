@@ -0,0 +1,92 @@
+"""
+Cached batch validators for the generated models.
+
+Hand-written (not generated): codegen leaves this module in place.
+
+One ``TypeAdapter(list[Model])`` is built per model on first use and reused for
+the life of the process, so batches pulled from a database validate in a single
+pydantic-core call; ``validate_batch_json`` hands the raw bytes to the Rust
+parser and skips ``json.loads`` entirely:
+
+    from synesthetic_schemas.adapters import validate_batch_json
+
+    rules = validate_batch_json('Rule', payload)          # payload: b'[{...}, ...]'
+    assets = validate_batch('SynestheticAsset', rows)     # rows: list of dicts
+
+Models are given as classes or by their package-level name (``'Rule'``,
+``'ControlParameter'``, ...). ``warm()`` builds the adapters for the top-level
+models up front, for services that would rather pay at startup.
+"""
+
+from __future__ import annotations
+
+import importlib
+from functools import lru_cache
+from typing import Any, Iterable, Union
+
+from pydantic import BaseModel, TypeAdapter
+
+__all__ = [
+    'TOP_LEVEL_MODELS',
+    'list_adapter',
+    'validate_batch',
+    'validate_batch_json',
+    'warm',
+]
+
+# One per top-level schema in jsonschema/
+TOP_LEVEL_MODELS: tuple[str, ...] = (
+    'Control',
+    'ControlBundle',
+    'Haptic',
+    'Modulation',
+    'RuleBundle',
+    'Shader',
+    'SynestheticAsset',
+    'Tone',
+)
+
+ModelRef = Union[type[BaseModel], str]
+
+
+def _model(model: ModelRef) -> type[BaseModel]:
+    if isinstance(model, str):
+        pkg = importlib.import_module(__package__)
+        try:
+            model = getattr(pkg, model)
+        except AttributeError:
+            raise KeyError(f'unknown model: {model}') from None
+    if not (isinstance(model, type) and issubclass(model, BaseModel)):
+        raise TypeError(f'not a model class: {model!r}')
+    return model
+
+
+@lru_cache(maxsize=None)
+def _adapter(model: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    return TypeAdapter(list[model])
+
+
+def list_adapter(model: ModelRef) -> TypeAdapter[list[Any]]:
+    """Return the process-wide ``TypeAdapter(list[model])``."""
+    return _adapter(_model(model))
+
+
+def validate_batch(model: ModelRef, items: Iterable[Any]) -> list[Any]:
+    """Validate Python objects (usually dicts) into a list of ``model`` instances.
+
+    Raises ``pydantic.ValidationError``; error locations start with the item index.
+    """
+    if not isinstance(items, list):
+        items = list(items)
+    return list_adapter(model).validate_python(items)
+
+
+def validate_batch_json(model: ModelRef, data: Union[bytes, bytearray, str]) -> list[Any]:
+    """Parse and validate a JSON array of ``model`` objects in one pydantic-core call."""
+    return list_adapter(model).validate_json(data)
+
+
+def warm(models: Iterable[ModelRef] = TOP_LEVEL_MODELS) -> None:
+    """Build the adapters for ``models`` now instead of on first use."""
+    for model in models:
+        list_adapter(model)
@@ -3,49 +3,11 @@
 
 from __future__ import annotations
 
-from enum import Enum
 from typing import Any, Optional, Union
 
 from pydantic import BaseModel, Extra, Field, constr
 
-
-class DataType(Enum):
-    float = 'float'
-    int = 'int'
-    bool = 'bool'
-    string = 'string'
-
-
-class ComboType(BaseModel):
-    keys: Optional[list[str]] = Field(None, title='Keys')
-    mouseButtons: Optional[list[str]] = Field(None, title='Mousebuttons')
-    strict: Optional[bool] = Field(False, title='Strict')
-    wheel: Optional[bool] = Field(None, title='Wheel')
-
-
-class AxisType(Enum):
-    mouse_x = 'mouse.x'
-    mouse_y = 'mouse.y'
-    mouse_wheel = 'mouse.wheel'
-
-
-class CurveType(Enum):
-    linear = 'linear'
-    exponential = 'exponential'
-    sine = 'sine'
-    discrete = 'discrete'
-
-
-class ActionType(BaseModel):
-    axis: AxisType
-    curve: Optional[CurveType] = None
-    scale: Optional[float] = Field(1, title='Scale')
-    sensitivity: float = Field(..., title='Sensitivity')
-
-
-class Mapping(BaseModel):
-    action: ActionType
-    combo: ComboType
+from .control import ActionType, AxisType, ComboType, CurveType, DataType, Mapping
 
 
 class ControlParameter(BaseModel):
@@ -0,0 +1,406 @@
+# generated by codegen/py_frozen.py -- do not edit
+"""
+Frozen, slotted twins of leaf models for memory-compact runtimes.
+
+Same field names as the Pydantic models; lists are tuples. Convert with
+``Twin.from_model(model)`` and ``twin.to_model()`` (lossless, including which
+fields were explicitly set).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Optional, Union
+
+from .control import (
+    AxisType,
+    CurveType,
+    DataType,
+    ActionType as _ActionType,
+    ComboType as _ComboType,
+    Mapping as _Mapping,
+)
+from .control_bundle import ControlParameter as _ControlParameter
+from .haptic import HapticParameter as _HapticParameter
+from .modulation import ScaleProfile, Type, Waveform, ModulationItem as _ModulationItem
+from .shader import InputParameter as _InputParameter
+
+__all__ = [
+    'ModulationItem',
+    'HapticParameter',
+    'InputParameter',
+    'ActionType',
+    'ComboType',
+    'Mapping',
+    'ControlParameter',
+]
+
+
+def _mask(names: tuple[str, ...], fields_set: set[str]) -> int:
+    return sum(1 << i for i, n in enumerate(names) if n in fields_set)
+
+
+def _unmask(names: tuple[str, ...], mask: int) -> set[str]:
+    return {n for i, n in enumerate(names) if mask >> i & 1}
+
+
+_ModulationItem_FIELDS = (
+    'amplitude',
+    'frequency',
+    'id',
+    'max',
+    'min',
+    'offset',
+    'phase',
+    'scale',
+    'scaleProfile',
+    'target',
+    'type',
+    'waveform',
+)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ModulationItem:
+    """Frozen twin of :class:`synesthetic_schemas.modulation.ModulationItem`."""
+
+    amplitude: float
+    frequency: float
+    id: str
+    max: Optional[float] = None
+    min: Optional[float] = None
+    offset: float
+    phase: float
+    scale: Optional[float] = 1
+    scaleProfile: Optional[ScaleProfile] = None
+    target: str
+    type: Type
+    waveform: Waveform
+    _set_mask: int = field(default=0, repr=False, compare=False)
+
+    @classmethod
+    def from_model(cls, m: _ModulationItem) -> ModulationItem:
+        d = m.__dict__
+        return cls(
+            amplitude=d['amplitude'],
+            frequency=d['frequency'],
+            id=d['id'],
+            max=d['max'],
+            min=d['min'],
+            offset=d['offset'],
+            phase=d['phase'],
+            scale=d['scale'],
+            scaleProfile=d['scaleProfile'],
+            target=d['target'],
+            type=d['type'],
+            waveform=d['waveform'],
+            _set_mask=_mask(_ModulationItem_FIELDS, m.model_fields_set),
+        )
+
+    def to_model(self) -> _ModulationItem:
+        return _ModulationItem.model_construct(
+            _fields_set=_unmask(_ModulationItem_FIELDS, self._set_mask),
+            amplitude=self.amplitude,
+            frequency=self.frequency,
+            id=self.id,
+            max=self.max,
+            min=self.min,
+            offset=self.offset,
+            phase=self.phase,
+            scale=self.scale,
+            scaleProfile=self.scaleProfile,
+            target=self.target,
+            type=self.type,
+            waveform=self.waveform,
+        )
+
+
+_HapticParameter_FIELDS = (
+    'default',
+    'max',
+    'min',
+    'name',
+    'options',
+    'parameter',
+    'path',
+    'smoothingTime',
+    'step',
+    'type',
+    'unit',
+)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class HapticParameter:
+    """Frozen twin of :class:`synesthetic_schemas.haptic.HapticParameter`."""
+
+    default: Any
+    max: Optional[float] = None
+    min: Optional[float] = None
+    name: str
+    options: Optional[tuple[str, ...]] = None
+    parameter: str
+    path: str
+    smoothingTime: Optional[float] = None
+    step: Optional[float] = None
+    type: str
+    unit: str
+    _set_mask: int = field(default=0, repr=False, compare=False)
+
+    @classmethod
+    def from_model(cls, m: _HapticParameter) -> HapticParameter:
+        d = m.__dict__
+        return cls(
+            default=d['default'],
+            max=d['max'],
+            min=d['min'],
+            name=d['name'],
+            options=None if d['options'] is None else tuple(d['options']),
+            parameter=d['parameter'],
+            path=d['path'],
+            smoothingTime=d['smoothingTime'],
+            step=d['step'],
+            type=d['type'],
+            unit=d['unit'],
+            _set_mask=_mask(_HapticParameter_FIELDS, m.model_fields_set),
+        )
+
+    def to_model(self) -> _HapticParameter:
+        return _HapticParameter.model_construct(
+            _fields_set=_unmask(_HapticParameter_FIELDS, self._set_mask),
+            default=self.default,
+            max=self.max,
+            min=self.min,
+            name=self.name,
+            options=None if self.options is None else list(self.options),
+            parameter=self.parameter,
+            path=self.path,
+            smoothingTime=self.smoothingTime,
+            step=self.step,
+            type=self.type,
+            unit=self.unit,
+        )
+
+
+_InputParameter_FIELDS = (
+    'default',
+    'max',
+    'min',
+    'name',
+    'parameter',
+    'path',
+    'smoothingTime',
+    'step',
+    'type',
+)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class InputParameter:
+    """Frozen twin of :class:`synesthetic_schemas.shader.InputParameter`."""
+
+    default: float
+    max: float
+    min: float
+    name: str
+    parameter: str
+    path: str
+    smoothingTime: Optional[float] = None
+    step: Optional[float] = None
+    type: str
+    _set_mask: int = field(default=0, repr=False, compare=False)
+
+    @classmethod
+    def from_model(cls, m: _InputParameter) -> InputParameter:
+        d = m.__dict__
+        return cls(
+            default=d['default'],
+            max=d['max'],
+            min=d['min'],
+            name=d['name'],
+            parameter=d['parameter'],
+            path=d['path'],
+            smoothingTime=d['smoothingTime'],
+            step=d['step'],
+            type=d['type'],
+            _set_mask=_mask(_InputParameter_FIELDS, m.model_fields_set),
+        )
+
+    def to_model(self) -> _InputParameter:
+        return _InputParameter.model_construct(
+            _fields_set=_unmask(_InputParameter_FIELDS, self._set_mask),
+            default=self.default,
+            max=self.max,
+            min=self.min,
+            name=self.name,
+            parameter=self.parameter,
+            path=self.path,
+            smoothingTime=self.smoothingTime,
+            step=self.step,
+            type=self.type,
+        )
+
+
+_ActionType_FIELDS = ('axis', 'curve', 'scale', 'sensitivity')
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ActionType:
+    """Frozen twin of :class:`synesthetic_schemas.control.ActionType`."""
+
+    axis: AxisType
+    curve: Optional[CurveType] = None
+    scale: Optional[float] = 1
+    sensitivity: float
+    _set_mask: int = field(default=0, repr=False, compare=False)
+
+    @classmethod
+    def from_model(cls, m: _ActionType) -> ActionType:
+        d = m.__dict__
+        return cls(
+            axis=d['axis'],
+            curve=d['curve'],
+            scale=d['scale'],
+            sensitivity=d['sensitivity'],
+            _set_mask=_mask(_ActionType_FIELDS, m.model_fields_set),
+        )
+
+    def to_model(self) -> _ActionType:
+        return _ActionType.model_construct(
+            _fields_set=_unmask(_ActionType_FIELDS, self._set_mask),
+            axis=self.axis,
+            curve=self.curve,
+            scale=self.scale,
+            sensitivity=self.sensitivity,
+        )
+
+
+_ComboType_FIELDS = ('keys', 'mouseButtons', 'strict', 'wheel')
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ComboType:
+    """Frozen twin of :class:`synesthetic_schemas.control.ComboType`."""
+
+    keys: Optional[tuple[str, ...]] = None
+    mouseButtons: Optional[tuple[str, ...]] = None
+    strict: Optional[bool] = False
+    wheel: Optional[bool] = None
+    _set_mask: int = field(default=0, repr=False, compare=False)
+
+    @classmethod
+    def from_model(cls, m: _ComboType) -> ComboType:
+        d = m.__dict__
+        return cls(
+            keys=None if d['keys'] is None else tuple(d['keys']),
+            mouseButtons=(
+                None if d['mouseButtons'] is None else tuple(d['mouseButtons'])
+            ),
+            strict=d['strict'],
+            wheel=d['wheel'],
+            _set_mask=_mask(_ComboType_FIELDS, m.model_fields_set),
+        )
+
+    def to_model(self) -> _ComboType:
+        return _ComboType.model_construct(
+            _fields_set=_unmask(_ComboType_FIELDS, self._set_mask),
+            keys=None if self.keys is None else list(self.keys),
+            mouseButtons=None if self.mouseButtons is None else list(self.mouseButtons),
+            strict=self.strict,
+            wheel=self.wheel,
+        )
+
+
+_Mapping_FIELDS = ('action', 'combo')
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Mapping:
+    """Frozen twin of :class:`synesthetic_schemas.control.Mapping`."""
+
+    action: ActionType
+    combo: ComboType
+    _set_mask: int = field(default=0, repr=False, compare=False)
+
+    @classmethod
+    def from_model(cls, m: _Mapping) -> Mapping:
+        d = m.__dict__
+        return cls(
+            action=ActionType.from_model(d['action']),
+            combo=ComboType.from_model(d['combo']),
+            _set_mask=_mask(_Mapping_FIELDS, m.model_fields_set),
+        )
+
+    def to_model(self) -> _Mapping:
+        return _Mapping.model_construct(
+            _fields_set=_unmask(_Mapping_FIELDS, self._set_mask),
+            action=self.action.to_model(),
+            combo=self.combo.to_model(),
+        )
+
+
+_ControlParameter_FIELDS = (
+    'default',
+    'label',
+    'mappings',
+    'max',
+    'min',
+    'options',
+    'parameter',
+    'smoothingTime',
+    'step',
+    'type',
+    'unit',
+)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ControlParameter:
+    """Frozen twin of :class:`synesthetic_schemas.control_bundle.ControlParameter`."""
+
+    default: Union[float, int, bool, str]
+    label: str
+    mappings: tuple[Mapping, ...]
+    max: Optional[float] = None
+    min: Optional[float] = None
+    options: Optional[tuple[str, ...]] = None
+    parameter: str
+    smoothingTime: Optional[float] = 0
+    step: Optional[float] = None
+    type: DataType
+    unit: str
+    _set_mask: int = field(default=0, repr=False, compare=False)
+
+    @classmethod
+    def from_model(cls, m: _ControlParameter) -> ControlParameter:
+        d = m.__dict__
+        return cls(
+            default=d['default'],
+            label=d['label'],
+            mappings=tuple(Mapping.from_model(x0) for x0 in d['mappings']),
+            max=d['max'],
+            min=d['min'],
+            options=None if d['options'] is None else tuple(d['options']),
+            parameter=d['parameter'],
+            smoothingTime=d['smoothingTime'],
+            step=d['step'],
+            type=d['type'],
+            unit=d['unit'],
+            _set_mask=_mask(_ControlParameter_FIELDS, m.model_fields_set),
+        )
+
+    def to_model(self) -> _ControlParameter:
+        return _ControlParameter.model_construct(
+            _fields_set=_unmask(_ControlParameter_FIELDS, self._set_mask),
+            default=self.default,
+            label=self.label,
+            mappings=[x0.to_model() for x0 in self.mappings],
+            max=self.max,
+            min=self.min,
+            options=None if self.options is None else list(self.options),
+            parameter=self.parameter,
+            smoothingTime=self.smoothingTime,
+            step=self.step,
+            type=self.type,
+            unit=self.unit,
+        )
@@ -4,31 +4,11 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Optional, Union
+from typing import Any, Optional
 
 from pydantic import BaseModel, Extra, Field
 
-
-class Rule(BaseModel):
-    class Config:
-        extra = Extra.forbid
-
-    effects: Optional[list[dict[str, Any]]] = Field(
-        None, description='Effects applied when the rule is triggered', title='Effects'
-    )
-    execution: Optional[str] = Field(
-        None, description='Execution environment for the rule', title='Execution'
-    )
-    expr: Optional[Union[str, dict[str, Any]]] = Field(
-        None, description='Expression defining the rule logic', title='Expr'
-    )
-    id: str = Field(..., description='Unique rule identifier', title='Id')
-    target: Optional[str] = Field(
-        None, description='Parameter path the rule targets', title='Target'
-    )
-    trigger: Optional[dict[str, Any]] = Field(
-        None, description='Trigger configuration for the rule', title='Trigger'
-    )
+from .rule import Rule
 
 
 class RuleBundle(BaseModel):
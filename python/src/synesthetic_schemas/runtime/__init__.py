@@ -0,0 +1,35 @@
+"""
+Runtime-oriented representations of Synesthetic documents.
+
+Hand-written (not generated): codegen leaves this package in place. Nothing here
+validates; build from models that already passed validation.
+
+    ModulationTable      struct-of-arrays modulation set (modulation_table.py)
+    ParameterIndex       parameter path -> dense slot (param_index.py)
+    RuntimePlan          compiled asset with a binary, mmap-able form (plan.py);
+                         ``compile_asset(asset)`` builds one
+    RuleEngine           rule-bundle dispatch by trigger type and source (rules.py)
+    ControlEvaluator     control mappings indexed by axis and pressed combo (controls.py)
+    UniformLayout        std140 uniform block layout and in-place packer (uniforms.py)
+    ModulationEvaluator  vectorized LFO evaluator (modulation_eval.py; needs numpy,
+                         import it from the submodule)
+"""
+
+from __future__ import annotations
+
+from .controls import ControlEvaluator
+from .modulation_table import ModulationTable
+from .param_index import ParameterIndex
+from .plan import RuntimePlan, compile_asset
+from .rules import RuleEngine
+from .uniforms import UniformLayout
+
+__all__ = [
+    'ControlEvaluator',
+    'ModulationTable',
+    'ParameterIndex',
+    'RuleEngine',
+    'RuntimePlan',
+    'UniformLayout',
+    'compile_asset',
+]
@@ -0,0 +1,202 @@
+"""
+Compiled control-mapping evaluator.
+
+Hand-written (not generated): codegen leaves this package in place.
+
+Each ``ControlParameter.mappings[*]`` pairs a ``ComboType`` (keys, mouseButtons,
+wheel, strict) with an ``ActionType`` (axis, sensitivity, scale, curve).
+``ControlEvaluator`` groups the mappings by axis and memoises, per
+``(axis, pressed keys, pressed buttons)``, the mappings whose combo matches, so
+an input event costs one dict lookup plus the matching mappings:
+
+    ctl = ControlEvaluator.from_asset(asset)     # or .from_bundle(control_bundle)
+    values = plan.new_buffer()                   # slots from ctl.index
+    ctl.handle('mouse.x', dx, buttons={'left'}, values=values)
+    ctl.advance(dt, values)                      # once per frame: smoothing
+
+A combo matches when its keys and mouse buttons are all held (``strict``: exactly
+those are held); ``wheel: true`` only matches ``mouse.wheel`` events. A matching
+mapping moves its control's target by ``curve(delta * sensitivity) * scale``
+(``runtime.curves``; no curve is linear), then the target is clamped to
+``[min, max]``. The value written is that target snapped to ``step`` (from ``min``
+when given) and rounded for ``int``/``bool`` controls; the unsnapped target keeps
+accumulating, so moves smaller than one step are not lost. Controls with ``smoothingTime`` > 0 approach their
+target exponentially (time constant ``smoothingTime`` seconds) in ``advance``;
+the others are written to ``values`` immediately. Controls bound to the same
+parameter share one state (kept at the first such control, whose ``smoothingTime``
+applies); each keeps its own limits. String controls are ignored.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from typing import Any, Iterable, Optional, Sequence
+
+from ..control import DataType
+from .curves import curve
+from .param_index import ParameterIndex
+
+__all__ = ['ControlEvaluator']
+
+_CACHE_LIMIT = 4096  # distinct (axis, pressed set) lookups kept
+
+
+class _Mapping:
+    __slots__ = ('control', 'keys', 'buttons', 'strict', 'wheel', 'sensitivity', 'scale', 'shape')
+
+    def __init__(self, control: int, mapping: Any):
+        combo, action = mapping.combo, mapping.action
+        self.control = control
+        self.keys = frozenset(combo.keys or ())
+        self.buttons = frozenset(combo.mouseButtons or ())
+        self.strict = bool(combo.strict)
+        self.wheel = bool(combo.wheel)
+        self.sensitivity = action.sensitivity
+        self.scale = 1.0 if action.scale is None else action.scale
+        self.shape = curve(None if action.curve is None else action.curve.value)
+
+    def matches(self, axis: str, keys: frozenset, buttons: frozenset) -> bool:
+        if self.wheel and axis != 'mouse.wheel':
+            return False
+        if self.strict:
+            return keys == self.keys and buttons == self.buttons
+        return self.keys <= keys and self.buttons <= buttons
+
+
+class ControlEvaluator:
+    """Mapping index plus per-control target/smoothed state; see the module docstring."""
+
+    def __init__(self, controls: Sequence[Any], slots: Sequence[int], index: Optional[ParameterIndex] = None):
+        """``controls`` are ``ControlParameter``/``Control`` models; ``slots[i]`` is control i's slot."""
+        self.index = index
+        self.slots = array('I', slots)
+        n = len(controls)
+        nan = float('nan')
+        self._raw = array('d', [nan]) * n
+        self.target = array('d', [nan]) * n
+        self.current = array('d', [nan]) * n
+        self._min = array('d', [nan]) * n
+        self._max = array('d', [nan]) * n
+        self._step = array('d', [nan]) * n
+        self._tau = array('d', [0.0]) * n
+        self._round = bytearray(n)
+        self._state = array('I', range(n))  # control -> index holding its state
+        first: dict[int, int] = {}
+        self._by_axis: dict[str, list[_Mapping]] = {}
+        for i, c in enumerate(controls):
+            if c.type is DataType.string:
+                continue
+            self._state[i] = first.setdefault(self.slots[i], i)
+            self._min[i] = nan if c.min is None else c.min
+            self._max[i] = nan if c.max is None else c.max
+            self._step[i] = nan if c.step is None else c.step
+            self._tau[i] = c.smoothingTime or 0.0
+            self._round[i] = c.type in (DataType.int, DataType.bool)
+            default = c.default
+            if not isinstance(default, (int, float)):
+                default = 0.0 if c.min is None else c.min
+            if self._state[i] == i:
+                self._raw[i] = self.target[i] = self.current[i] = float(default)
+            for m in c.mappings:
+                self._by_axis.setdefault(m.action.axis.value, []).append(_Mapping(i, m))
+        self._cache: dict[tuple[str, frozenset, frozenset], list[_Mapping]] = {}
+        self._moving: set[int] = set()
+
+    @classmethod
+    def from_asset(cls, asset: Any, index: Optional[ParameterIndex] = None) -> ControlEvaluator:
+        if index is None:
+            index = ParameterIndex.from_asset(asset)
+        controls = asset.control.control_parameters if asset.control is not None else []
+        return cls(controls, index.control_slots, index)
+
+    @classmethod
+    def from_bundle(cls, bundle: Any) -> ControlEvaluator:
+        """From a ``ControlBundle`` (or any object with ``control_parameters``)."""
+        index = ParameterIndex()
+        slots = [index.resolve(c.parameter) for c in bundle.control_parameters]
+        return cls(bundle.control_parameters, slots, index)
+
+    # -- events
+
+    def matching(self, axis: Any, keys: Iterable[str] = (), buttons: Iterable[str] = ()) -> list[Any]:
+        """The compiled mappings an event on ``axis`` with this pressed set would apply."""
+        axis = getattr(axis, 'value', axis)
+        keys, buttons = frozenset(keys), frozenset(buttons)
+        key = (axis, keys, buttons)
+        hits = self._cache.get(key)
+        if hits is None:
+            hits = [m for m in self._by_axis.get(axis, ()) if m.matches(axis, keys, buttons)]
+            if len(self._cache) >= _CACHE_LIMIT:
+                self._cache.clear()
+            self._cache[key] = hits
+        return hits
+
+    def handle(
+        self,
+        axis: Any,
+        delta: float,
+        keys: Iterable[str] = (),
+        buttons: Iterable[str] = (),
+        values: Any = None,
+    ) -> int:
+        """Apply one input event; returns the number of matching mappings."""
+        hits = self.matching(axis, keys, buttons)
+        for m in hits:
+            i = m.control
+            s = self._state[i]
+            raw = self._raw[s] + m.shape(delta * m.sensitivity) * m.scale
+            lo, hi = self._min[i], self._max[i]
+            if raw < lo:
+                raw = lo
+            elif raw > hi:
+                raw = hi
+            self._raw[s] = raw
+            target = self._snap(i, raw)
+            if target == self.target[s]:
+                continue
+            self.target[s] = target
+            if self._tau[s] > 0.0:
+                self._moving.add(s)
+            else:
+                self.current[s] = target
+                if values is not None:
+                    values[self.slots[s]] = target
+        return len(hits)
+
+    def _snap(self, i: int, v: float) -> float:
+        lo, hi, step = self._min[i], self._max[i], self._step[i]
+        if step > 0.0:
+            base = lo if lo == lo else 0.0  # NaN min: snap from 0
+            v = base + round((v - base) / step) * step
+            if v > hi:
+                v -= step
+        if self._round[i]:
+            v = float(round(v))
+        return v
+
+    # -- frames
+
+    def advance(self, dt: float, values: Any = None) -> None:
+        """Move smoothed controls toward their targets by ``dt`` seconds."""
+        done = []
+        for i in self._moving:
+            target = self.target[i]
+            v = target + (self.current[i] - target) * math.exp(-dt / self._tau[i])
+            if abs(v - target) <= 1e-9 * max(1.0, abs(target)):
+                v = target
+                done.append(i)
+            self.current[i] = v
+            if values is not None:
+                values[self.slots[i]] = v
+        for i in done:
+            self._moving.discard(i)
+
+    def write(self, values: Any) -> None:
+        """Write every control's current value into ``values`` (e.g. at startup)."""
+        for i, v in enumerate(self.current):
+            if self._state[i] == i and v == v:
+                values[self.slots[i]] = v
+
+    def __len__(self) -> int:
+        return len(self.slots)
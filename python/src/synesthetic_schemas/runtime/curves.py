@@ -0,0 +1,75 @@
+"""
+Scalar response curves shared by the rule engine and the control evaluator.
+
+Hand-written (not generated): codegen leaves this package in place.
+
+Every curve maps a value (normally in [0, 1], sign preserved for negative input)
+and fixes 0 and 1:
+
+    linear       x
+    exponential  x * |x|                   ('exp' is the legacy rule-bundle name)
+    logarithmic  sign(x) * sqrt(|x|)       ('log')
+    sine         sin(x * pi/2)
+    sigmoid      logistic around 0.5, rescaled so 0 -> 0 and 1 -> 1
+    discrete     round(x)
+
+The names cover ``CurveType`` (control mappings) and the curves written by
+``scripts/convert_legacy_rule_bundles.py``.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Callable, Optional
+
+__all__ = ['CURVES', 'curve']
+
+_K = 10.0  # sigmoid steepness
+_S0 = 1.0 / (1.0 + math.exp(_K * 0.5))
+_S1 = 1.0 / (1.0 + math.exp(-_K * 0.5))
+
+
+def _linear(x: float) -> float:
+    return x
+
+
+def _exponential(x: float) -> float:
+    return x * abs(x)
+
+
+def _logarithmic(x: float) -> float:
+    return math.copysign(math.sqrt(abs(x)), x)
+
+
+def _sine(x: float) -> float:
+    return math.sin(x * (math.pi / 2))
+
+
+def _sigmoid(x: float) -> float:
+    return (1.0 / (1.0 + math.exp(-_K * (x - 0.5))) - _S0) / (_S1 - _S0)
+
+
+def _discrete(x: float) -> float:
+    return float(round(x))
+
+
+CURVES: dict[str, Callable[[float], float]] = {
+    'linear': _linear,
+    'exponential': _exponential,
+    'exp': _exponential,
+    'logarithmic': _logarithmic,
+    'log': _logarithmic,
+    'sine': _sine,
+    'sigmoid': _sigmoid,
+    'discrete': _discrete,
+}
+
+
+def curve(name: Optional[str]) -> Callable[[float], float]:
+    """Curve function for ``name`` (None: linear); ``ValueError`` if unknown."""
+    if name is None:
+        return _linear
+    try:
+        return CURVES[name]
+    except KeyError:
+        raise ValueError(f'unknown curve: {name!r} (expected one of {sorted(CURVES)})') from None
@@ -0,0 +1,212 @@
+"""
+Vectorized reference evaluator for modulation sets.
+
+Hand-written (not generated): codegen leaves this package in place.
+
+Evaluates every modulator of a ``ModulationTable`` over a batch of timestamps in
+one call, writing into a caller-supplied buffer:
+
+    ev = ModulationEvaluator(ModulationTable.from_model(asset))
+    out = np.empty((len(times), len(ev)))
+    ev.evaluate(times, out)          # out[k, i] = modulator i at times[k]
+    ev.evaluate(t, out[0])           # a single frame: float t, out shape (n,)
+
+After the first call for a given batch size, ``evaluate`` allocates no array
+data: scratch buffers are kept on the evaluator and every NumPy operation writes
+in place (modulators are grouped by waveform and profile into contiguous column
+slices, so there is no masking). One evaluator per thread.
+
+Definition, per modulator (``u`` is the cycle position in [0, 1)):
+
+    u      = frac((2*pi*frequency*t + phase) / (2*pi))
+    wave   sine      sin(2*pi*u)
+           triangle  1 - 4*|frac(u + 1/4) - 1/2|
+           square    +1 for u < 1/2, else -1
+           sawtooth  2*frac(u + 1/2) - 1
+    shape  scaleProfile on n = (wave + 1)/2, mapped back to [-1, 1]:
+           linear/None n, exponential n**2, logarithmic sqrt(n),
+           sine sin(n*pi/2), cosine 1 - cos(n*pi/2)
+    value  offset + clamp(amplitude * scale * shape, min, max)   (scale None -> 1)
+
+``min``/``max`` bound the modulation term, not the value: the schema describes
+``offset`` as the base value and ``min``/``max`` as the allowable values "for the
+modulation", and its example (``offset`` 800 on a filter frequency, ``min`` 0,
+``max`` 1) would otherwise always evaluate to 1.
+
+Every waveform is 0 and rising at u = 0 (square: +1). ``type`` says how the
+value combines with the target's base value; pass ``base`` (shape ``(n,)``) to
+get ``base + value`` (additive) or ``base * value`` (multiplicative) instead.
+
+Requires ``numpy`` (``pip install 'synesthetic-schemas[runtime]'``).
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Optional, Union
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "synesthetic_schemas.runtime.modulation_eval requires numpy "
+        "(pip install 'synesthetic-schemas[runtime]')"
+    ) from e
+
+from ..modulation import ScaleProfile, Type, Waveform
+from .modulation_table import SCALE_PROFILES, TYPES, WAVEFORMS, ModulationTable
+
+__all__ = ['ModulationEvaluator']
+
+_TWO_PI = 2.0 * math.pi
+_HALF_PI = 0.5 * math.pi
+_LINEAR = -1  # scale_profile code for None; shaped like 'linear'
+
+
+class ModulationEvaluator:
+    """Evaluate all modulators of a ``ModulationTable``; see the module docstring."""
+
+    def __init__(self, table: ModulationTable):
+        cols = table.numpy()
+        n = len(table)
+        waveform = cols['waveform'].astype(np.int64)
+        profile = cols['scale_profile'].astype(np.int64)
+        profile[profile == SCALE_PROFILES.index(ScaleProfile.linear)] = _LINEAR
+        # columns are evaluated in (waveform, profile) order so each group is a
+        # contiguous slice; the result is permuted back on the way out
+        order = np.lexsort((profile, waveform))
+        self._inverse = np.empty(n, dtype=np.intp)
+        self._inverse[order] = np.arange(n, dtype=np.intp)
+
+        scale = np.where(np.isnan(cols['scale']), 1.0, cols['scale'])
+        self._omega = (cols['frequency'] * _TWO_PI)[order]
+        self._phase = cols['phase'][order].copy()
+        self._gain = (cols['amplitude'] * scale)[order]
+        self._offset = cols['offset'][order].copy()
+        self._min = cols['min'][order].copy()  # NaN = unbounded (fmax/fmin skip NaN)
+        self._max = cols['max'][order].copy()
+        self._clamp = bool(np.any(~np.isnan(self._min)) or np.any(~np.isnan(self._max)))
+        self._multiplicative = cols['type'] == TYPES.index(Type.multiplicative)
+
+        self._waves: list[tuple[Waveform, slice]] = _groups(waveform[order], WAVEFORMS)
+        self._profiles: list[tuple[ScaleProfile, slice]] = _groups(
+            profile[order], SCALE_PROFILES, skip=_LINEAR
+        )
+        self._n = n
+        self._rows = -1
+        self._work: Any = None
+        self._floor: Any = None
+        self._t1 = np.zeros(1)
+
+    def __len__(self) -> int:
+        return self._n
+
+    def evaluate(
+        self,
+        t: Union[float, Any],
+        out: Any,
+        base: Optional[Any] = None,
+    ) -> Any:
+        """Write modulator values at ``t`` into ``out`` and return it.
+
+        ``t`` is a Python or NumPy scalar (``out`` shape ``(n,)``) or a 1-D
+        float64 array of timestamps in seconds (``out`` shape ``(len(t), n)``).
+        ``out`` must be a C-contiguous float64 array.
+        """
+        if np.ndim(t) == 0:  # Python or NumPy scalar
+            self._t1[0] = t
+            t, rows = self._t1, out.reshape(1, self._n) if out.ndim == 1 else out
+        else:
+            rows = out
+        if rows.shape != (len(t), self._n) or rows.dtype != np.float64 or not rows.flags.c_contiguous:
+            raise ValueError(
+                f'out must be a C-contiguous float64 array of shape {(len(t), self._n)}'
+                f' (got {rows.dtype} {rows.shape})'
+            )
+        if self._n:
+            self._compute(t, rows)
+            if base is not None:
+                self._apply_base(rows, base)
+        return out
+
+    # -- internals
+
+    def _scratch(self, rows: int) -> tuple[Any, Any]:
+        if rows != self._rows:
+            self._work = np.empty((rows, self._n))
+            self._floor = np.empty((rows, self._n))
+            self._rows = rows
+        return self._work, self._floor
+
+    def _compute(self, t: Any, out: Any) -> None:
+        w, f = self._scratch(len(t))
+        # cycle position u in [0, 1)
+        np.multiply.outer(t, self._omega, out=w)
+        w += self._phase
+        w *= 1.0 / _TWO_PI
+        w -= np.floor(w, out=f)
+
+        for wave, s in self._waves:
+            x, fx = w[:, s], f[:, s]
+            if wave is Waveform.sine:
+                x *= _TWO_PI
+                np.sin(x, out=x)
+            elif wave is Waveform.triangle:
+                x += 0.25
+                x -= np.floor(x, out=fx)
+                x -= 0.5
+                np.abs(x, out=x)
+                x *= -4.0
+                x += 1.0
+            elif wave is Waveform.square:
+                x *= 2.0
+                np.floor(x, out=x)
+                x *= -2.0
+                x += 1.0
+            else:  # sawtooth
+                x += 0.5
+                x -= np.floor(x, out=fx)
+                x *= 2.0
+                x -= 1.0
+
+        for profile, s in self._profiles:
+            x = w[:, s]
+            x += 1.0
+            x *= 0.5
+            if profile is ScaleProfile.exponential:
+                np.square(x, out=x)
+            elif profile is ScaleProfile.logarithmic:
+                np.sqrt(x, out=x)
+            elif profile is ScaleProfile.sine:
+                x *= _HALF_PI
+                np.sin(x, out=x)
+            else:  # cosine
+                x *= _HALF_PI
+                np.cos(x, out=x)
+                x *= -1.0
+                x += 1.0
+            x *= 2.0
+            x -= 1.0
+
+        w *= self._gain
+        if self._clamp:
+            np.fmax(w, self._min, out=w)
+            np.fmin(w, self._max, out=w)
+        w += self._offset
+        np.take(w, self._inverse, axis=1, out=out, mode='clip')
+
+    def _apply_base(self, out: Any, base: Any) -> None:
+        prod = self._work  # free again once _compute has written ``out``
+        np.multiply(out, base, out=prod)
+        np.add(out, base, out=out)
+        np.copyto(out, prod, where=self._multiplicative)
+
+
+def _groups(codes: Any, members: tuple, skip: Optional[int] = None) -> list[tuple[Any, slice]]:
+    """Runs of equal adjacent ``codes`` -> [(member, slice)], leaving out ``skip``."""
+    bounds = [0, *(np.flatnonzero(np.diff(codes)) + 1).tolist(), len(codes)]
+    return [
+        (members[int(codes[a])], slice(a, b))
+        for a, b in zip(bounds, bounds[1:])
+        if a < b and int(codes[a]) != skip
+    ]
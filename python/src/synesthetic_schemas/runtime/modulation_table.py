@@ -0,0 +1,174 @@
+"""
+Column-oriented (struct-of-arrays) view of a modulation set.
+
+Hand-written (not generated): codegen leaves this package in place.
+
+``Modulation.modulations`` holds one Pydantic object per LFO. A runtime driving
+hundreds of modulators per frame wants each field contiguous instead:
+
+    table = ModulationTable.from_model(asset)       # Modulation or SynestheticAsset
+    table.frequency                                  # array('d'), one entry per item
+    cols = table.numpy()                             # zero-copy NumPy views (optional)
+    items = table.to_items()                         # == asset.modulations
+
+Columns (row ``i`` is ``modulations[i]``):
+
+    amplitude, frequency, offset, phase, scale, min, max
+                      ``array('d')``; ``None`` is stored as NaN and recorded in ``nulls``
+    waveform, type    ``array('B')`` codes into ``WAVEFORMS`` / ``TYPES``
+    scale_profile     ``array('b')`` code into ``SCALE_PROFILES``, -1 for None
+    target            ``array('I')`` index into ``targets`` (interned, first-seen order)
+    ids               ``list[str]``
+    nulls             ``array('B')`` bit per optional numeric column (``NULL_BITS``)
+    fields_set        ``array('H')`` bit per ``ModulationItem`` field that was set
+
+``nulls`` and ``fields_set`` make ``to_items()`` lossless: the rebuilt items
+compare equal and dump identically, including ``exclude_unset``.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from typing import Any, Iterable
+
+from ..modulation import ModulationItem, ScaleProfile, Type, Waveform
+
+__all__ = [
+    'NULL_BITS',
+    'SCALE_PROFILES',
+    'TYPES',
+    'WAVEFORMS',
+    'ModulationTable',
+]
+
+# code -> enum member; the code is the member's position in the schema enum
+WAVEFORMS: tuple[Waveform, ...] = tuple(Waveform)
+TYPES: tuple[Type, ...] = tuple(Type)
+SCALE_PROFILES: tuple[ScaleProfile, ...] = tuple(ScaleProfile)
+
+# optional numeric column -> bit in ``nulls``
+NULL_BITS: dict[str, int] = {'scale': 1, 'min': 2, 'max': 4}
+
+_FLOAT_COLUMNS = ('amplitude', 'frequency', 'offset', 'phase', 'scale', 'min', 'max')
+_CODE_COLUMNS = ('waveform', 'type', 'scale_profile', 'target', 'nulls', 'fields_set')
+_FIELDS = tuple(ModulationItem.model_fields)  # bit order of ``fields_set``
+_FIELD_BIT = {name: 1 << i for i, name in enumerate(_FIELDS)}
+_NAN = float('nan')
+
+
+class ModulationTable:
+    """Struct-of-arrays modulation set; see the module docstring for the columns."""
+
+    __slots__ = _FLOAT_COLUMNS + _CODE_COLUMNS + ('ids', 'targets', '_target_index')
+
+    def __init__(self) -> None:
+        for name in _FLOAT_COLUMNS:
+            setattr(self, name, array('d'))
+        self.waveform = array('B')
+        self.type = array('B')
+        self.scale_profile = array('b')
+        self.target = array('I')
+        self.nulls = array('B')
+        self.fields_set = array('H')
+        self.ids: list[str] = []
+        self.targets: list[str] = []
+        self._target_index: dict[str, int] = {}
+
+    # -- construction
+
+    @classmethod
+    def from_model(cls, model: Any) -> ModulationTable:
+        """Build from a ``Modulation`` or ``SynestheticAsset`` (no modulations: empty)."""
+        return cls.from_items(getattr(model, 'modulations', None) or ())
+
+    @classmethod
+    def from_items(cls, items: Iterable[ModulationItem]) -> ModulationTable:
+        table = cls()
+        for item in items:
+            table.append(item)
+        return table
+
+    def append(self, item: ModulationItem) -> None:
+        d = item.__dict__
+        nulls = 0
+        for name in _FLOAT_COLUMNS:
+            v = d[name]
+            if v is None:
+                nulls |= NULL_BITS[name]
+                v = _NAN
+            getattr(self, name).append(v)
+        self.waveform.append(WAVEFORMS.index(d['waveform']))
+        self.type.append(TYPES.index(d['type']))
+        profile = d['scaleProfile']
+        self.scale_profile.append(-1 if profile is None else SCALE_PROFILES.index(profile))
+        self.target.append(self.target_code(d['target']))
+        self.nulls.append(nulls)
+        mask = 0
+        for name in item.model_fields_set:
+            mask |= _FIELD_BIT[name]
+        self.fields_set.append(mask)
+        self.ids.append(d['id'])
+
+    def target_code(self, target: str) -> int:
+        """Return the index of ``target`` in ``targets``, adding it if new."""
+        code = self._target_index.get(target)
+        if code is None:
+            code = self._target_index[target] = len(self.targets)
+            self.targets.append(sys.intern(target))
+        return code
+
+    # -- access
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def rows_for_target(self, target: str) -> list[int]:
+        code = self._target_index.get(target)
+        if code is None:
+            return []
+        return [i for i, c in enumerate(self.target) if c == code]
+
+    def item(self, i: int) -> ModulationItem:
+        """Rebuild row ``i`` as a ``ModulationItem`` (lossless)."""
+        mask, nulls = self.fields_set[i], self.nulls[i]
+        values: dict[str, Any] = {}
+        for name in _FLOAT_COLUMNS:
+            values[name] = None if nulls & NULL_BITS.get(name, 0) else getattr(self, name)[i]
+        profile = self.scale_profile[i]
+        values['scaleProfile'] = None if profile < 0 else SCALE_PROFILES[profile]
+        values['waveform'] = WAVEFORMS[self.waveform[i]]
+        values['type'] = TYPES[self.type[i]]
+        values['target'] = self.targets[self.target[i]]
+        values['id'] = self.ids[i]
+        # unset fields are left out so model_construct restores the declared default
+        fields_set = {name for name in _FIELDS if mask & _FIELD_BIT[name]}
+        return ModulationItem.model_construct(
+            _fields_set=fields_set, **{k: v for k, v in values.items() if k in fields_set}
+        )
+
+    def to_items(self) -> list[ModulationItem]:
+        return [self.item(i) for i in range(len(self))]
+
+    def numpy(self) -> dict[str, Any]:
+        """Zero-copy NumPy views of the numeric and code columns.
+
+        The views share memory with the arrays (``append`` raises ``BufferError``
+        while one is alive). Requires ``numpy`` (``pip install 'synesthetic-schemas[runtime]'``).
+        """
+        try:
+            import numpy as np
+        except ImportError as e:  # pragma: no cover
+            raise ImportError(
+                "ModulationTable.numpy requires numpy "
+                "(pip install 'synesthetic-schemas[runtime]')"
+            ) from e
+        # array typecodes are C types, which NumPy dtype characters share
+        return {
+            name: np.frombuffer(getattr(self, name), dtype=getattr(self, name).typecode)
+            for name in _FLOAT_COLUMNS + _CODE_COLUMNS
+        }
+
+    def __repr__(self) -> str:
+        return f'ModulationTable(<{len(self)} modulations, {len(self.targets)} targets>)'
+
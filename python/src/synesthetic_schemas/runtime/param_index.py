@@ -0,0 +1,196 @@
+"""
+Compiled parameter-path index for an asset.
+
+Hand-written (not generated): codegen leaves this package in place.
+
+Modulation targets, rule effect targets, ``ControlParameter.parameter`` and the
+``path`` of shader/tone/haptic input parameters all address parameters as dotted
+strings. ``ParameterIndex`` resolves them once, so a runtime can keep every
+parameter in one flat float array and write to ``values[slot]``:
+
+    index = ParameterIndex.from_asset(asset)
+    values = index.new_buffer()                   # array('d'), one per slot
+    values[index.modulation_slots[i]] += ...      # asset.modulations[i]
+    values[index.slot('tone.filter.frequency')] = 800.0
+
+Paths are canonicalised to ``<section>.<rest>`` with section ``shader``, ``tone``
+or ``haptic``:
+
+  * ``visual.`` and ``audio.`` prefixes are aliases of ``shader.`` and ``tone.``;
+  * a declaring input parameter's bare path gets its own section (shader
+    ``path: 'u_r'`` is ``shader.u_r``);
+  * a bare reference (modulation ``target: 'u_r'``) resolves to the declared path
+    whose part after the section matches, when exactly one does.
+
+Slots ``[0, declared)`` are the declared input parameters in asset order (shader,
+tone, haptic). References that match no declaration still get a slot, appended
+after them (listed by ``undeclared()``), so writes never branch; with
+``strict=True`` they raise ``KeyError`` instead.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any, Iterable, Optional
+
+__all__ = [
+    'ALIASES',
+    'SECTIONS',
+    'ParameterIndex',
+    'canonical_path',
+]
+
+SECTIONS: tuple[str, ...] = ('shader', 'tone', 'haptic')
+ALIASES: dict[str, str] = {'visual': 'shader', 'audio': 'tone'}
+
+NO_SLOT = 0xFFFFFFFF  # in ``rule_target_slots``: the rule has no target
+
+
+def canonical_path(path: str, section: Optional[str] = None) -> str:
+    """Return ``path`` as ``<section>.<rest>``; bare paths get ``section`` if given."""
+    head, dot, rest = path.partition('.')
+    if dot:
+        if head in SECTIONS:
+            return path
+        if head in ALIASES:
+            return f'{ALIASES[head]}.{rest}'
+    return f'{section}.{path}' if section else path
+
+
+def _field(obj: Any, name: str) -> Any:
+    # tone sub-objects may be plain dicts (Union[Model, dict] in the model)
+    return obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+
+
+class ParameterIndex:
+    """Dense slot per addressable parameter path; see the module docstring."""
+
+    __slots__ = (
+        'paths',
+        'declared',
+        'modulation_slots',
+        'control_slots',
+        'rule_target_slots',
+        'effect_slots',
+        'effect_offsets',
+        '_slots',
+        '_bare',
+        '_strict',
+    )
+
+    def __init__(self, strict: bool = False):
+        self.paths: list[str] = []  # slot -> canonical path
+        self.declared = 0
+        self.modulation_slots = array('I')  # asset.modulations[i]
+        self.control_slots = array('I')  # asset.control.control_parameters[i]
+        self.rule_target_slots = array('I')  # rules[i].target, NO_SLOT if absent
+        # rules[i].effects[j].target is effect_slots[effect_offsets[i] + j]
+        self.effect_slots = array('I')
+        self.effect_offsets = array('I', [0])
+        self._slots: dict[str, int] = {}
+        self._bare: dict[str, Optional[int]] = {}  # rest-after-section -> slot (None: ambiguous)
+        self._strict = strict
+
+    # -- construction
+
+    @classmethod
+    def from_asset(cls, asset: Any, strict: bool = False) -> ParameterIndex:
+        index = cls(strict=strict)
+        for section in SECTIONS:
+            component = getattr(asset, section, None)
+            for p in (_field(component, 'input_parameters') or []) if component is not None else ():
+                index.declare(_field(p, 'path'), section)
+        index.declared = len(index.paths)
+
+        for i, m in enumerate(asset.modulations or ()):
+            index.modulation_slots.append(index.resolve(m.target, f'modulations[{i}].target'))
+        control = asset.control
+        for i, c in enumerate(control.control_parameters if control is not None else ()):
+            where = f'control.control_parameters[{i}].parameter'
+            index.control_slots.append(index.resolve(c.parameter, where))
+        bundle = asset.rule_bundle
+        for i, rule in enumerate(bundle.rules if bundle is not None else ()):
+            where = f'rule_bundle.rules[{i}]'
+            target = rule.target
+            index.rule_target_slots.append(
+                NO_SLOT if target is None else index.resolve(target, f'{where}.target')
+            )
+            for j, effect in enumerate(rule.effects or ()):
+                target = effect.get('target') if isinstance(effect, dict) else None
+                if isinstance(target, str):
+                    index.effect_slots.append(index.resolve(target, f'{where}.effects[{j}].target'))
+                else:
+                    index.effect_slots.append(NO_SLOT)
+            index.effect_offsets.append(len(index.effect_slots))
+        return index
+
+    def declare(self, path: str, section: str) -> int:
+        """Add a declared parameter; returns its slot (existing slot if already declared)."""
+        path = canonical_path(path, section)
+        slot = self._slots.get(path)
+        if slot is None:
+            slot = self._add(path)
+            rest = path.partition('.')[2]
+            self._bare[rest] = None if rest in self._bare else slot
+        return slot
+
+    def resolve(self, path: str, where: str = 'path') -> int:
+        """Return the slot of a referenced path, adding an undeclared slot if needed."""
+        slot = self._slots.get(path)
+        if slot is not None:
+            return slot
+        canonical = canonical_path(path)
+        slot = self._slots.get(canonical)
+        if slot is None and canonical == path:
+            slot = self._bare.get(path)
+        if slot is None:
+            if self._strict:
+                raise KeyError(f'unresolved parameter path at {where}: {path!r}')
+            slot = self._add(canonical)
+        self._slots[path] = slot  # remember the spelling for the next lookup
+        return slot
+
+    def _add(self, path: str) -> int:
+        slot = len(self.paths)
+        self.paths.append(path)
+        self._slots[path] = slot
+        return slot
+
+    # -- lookup
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __contains__(self, path: str) -> bool:
+        return self.get(path) is not None
+
+    def slot(self, path: str) -> int:
+        """Slot of ``path`` (any accepted spelling); ``KeyError`` if unknown."""
+        slot = self.get(path)
+        if slot is None:
+            raise KeyError(path)
+        return slot
+
+    def get(self, path: str) -> Optional[int]:
+        slot = self._slots.get(path)
+        if slot is None:
+            canonical = canonical_path(path)
+            slot = self._slots.get(canonical)
+            if slot is None and canonical == path:
+                slot = self._bare.get(path)
+        return slot
+
+    def slots(self, paths: Iterable[str]) -> array:
+        """``array('I')`` of slots for ``paths`` (e.g. ``ModulationTable.targets``)."""
+        return array('I', [self.slot(p) for p in paths])
+
+    def undeclared(self) -> list[str]:
+        """Referenced paths that match no declared input parameter."""
+        return self.paths[self.declared:]
+
+    def new_buffer(self) -> array:
+        """A zeroed ``array('d')`` with one value per slot."""
+        return array('d', bytes(8 * len(self.paths)))
+
+    def __repr__(self) -> str:
+        return f'ParameterIndex(<{self.declared} declared, {len(self.undeclared())} undeclared>)'
@@ -0,0 +1,293 @@
+"""
+Asset compiler: ``SynestheticAsset`` -> flat runtime plan, with a binary form.
+
+Hand-written (not generated): codegen leaves this package in place.
+
+A player normally walks ``shader``/``tone``/``haptic`` input parameters, control
+parameters and modulations to set up state. ``compile_asset`` does that walk once
+and keeps only flat columns, addressed by the slots of a ``ParameterIndex``:
+
+    plan = compile_asset(asset)
+    plan.save('asset.plan')                  # binary blob
+    plan = RuntimePlan.load('asset.plan')    # one mmap; columns are views into it
+    values = plan.new_buffer()               # array('d') of slot defaults
+
+Columns (``array`` when compiled, ``memoryview`` of the mapping when loaded):
+
+    per slot        default, min, max, step, smoothing          'd' (NaN: not given)
+    per control     control_slot 'I'; control_default, control_min, control_max,
+                    control_step, control_smoothing 'd'; control_type 'B'
+                    (code into ``DATA_TYPES``)
+    per modulation  mod_slot 'I' plus every ``ModulationTable`` column
+                    (``plan.modulation_table()`` rebuilds the table)
+    per rule        rule_target_slot 'I' (``NO_SLOT``: none); rules[i] effect targets
+                    are effect_slot[effect_offset[i]:effect_offset[i + 1]]
+
+Slot defaults/limits come from the declaring input parameter, else from the first
+control on that slot. Non-numeric defaults (tone strings such as an oscillator
+type) are NaN in ``default`` and kept in ``meta['string_defaults']``. Strings --
+paths, modulation ids/targets, rules as dicts -- live in a small JSON ``meta``
+section; nothing else is parsed on load.
+
+Blob layout (native little-endian only): 16-byte header (``MAGIC``, u32 format
+version, u32 section count), then per section a 40-byte entry (24-byte name,
+typecode, 7 pad bytes, u32 offset, u32 byte length), then 8-byte aligned section
+data.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Any, Optional, Union
+
+from ..control import DataType
+from .modulation_table import _CODE_COLUMNS, _FLOAT_COLUMNS, ModulationTable
+from .param_index import NO_SLOT, SECTIONS, ParameterIndex, _field, canonical_path
+
+__all__ = [
+    'DATA_TYPES',
+    'FORMAT_VERSION',
+    'MAGIC',
+    'NO_SLOT',
+    'RuntimePlan',
+    'compile_asset',
+]
+
+MAGIC = b'SYNPLAN\0'
+FORMAT_VERSION = 1
+DATA_TYPES: tuple[DataType, ...] = tuple(DataType)
+
+_HEADER = struct.Struct('<8sII')
+_ENTRY = struct.Struct('<24sc7xII')
+_NAN = float('nan')
+
+_SLOT_COLUMNS = ('default', 'min', 'max', 'step', 'smoothing')
+_CONTROL_COLUMNS = (
+    'control_slot',
+    'control_default',
+    'control_min',
+    'control_max',
+    'control_step',
+    'control_smoothing',
+    'control_type',
+)
+_MOD_COLUMNS = ('mod_slot',) + tuple(f'mod_{c}' for c in _FLOAT_COLUMNS + _CODE_COLUMNS)
+_RULE_COLUMNS = ('rule_target_slot', 'effect_slot', 'effect_offset')
+COLUMNS: tuple[str, ...] = _SLOT_COLUMNS + _CONTROL_COLUMNS + _MOD_COLUMNS + _RULE_COLUMNS
+
+Column = Union[array, memoryview]
+
+
+def _num(v: Any) -> float:
+    if isinstance(v, bool):
+        return float(v)
+    if isinstance(v, (int, float)):
+        return float(v)
+    return _NAN
+
+
+class RuntimePlan:
+    """Flat, slot-addressed runtime state of one asset; see the module docstring."""
+
+    def __init__(
+        self,
+        columns: dict[str, Column],
+        meta: dict[str, Any],
+        mapping: Optional[mmap.mmap] = None,
+    ):
+        missing = set(COLUMNS) - set(columns)
+        if missing:
+            raise ValueError(f'plan is missing columns: {sorted(missing)}')
+        self.columns = columns
+        self.meta = meta
+        self._mmap = mapping
+
+    def __getattr__(self, name: str) -> Column:
+        try:
+            return self.__dict__['columns'][name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    # -- derived views
+
+    @property
+    def paths(self) -> list[str]:
+        return self.meta['paths']
+
+    def __len__(self) -> int:
+        return len(self.meta['paths'])
+
+    def new_buffer(self) -> array:
+        """A fresh ``array('d')`` holding the slot defaults."""
+        return array('d', self.columns['default'])
+
+    def modulation_table(self) -> ModulationTable:
+        """Rebuild the ``ModulationTable`` (copies the columns out of the plan)."""
+        table = ModulationTable()
+        for name in _FLOAT_COLUMNS + _CODE_COLUMNS:
+            setattr(table, name, array(getattr(table, name).typecode, self.columns[f'mod_{name}']))
+        table.ids = list(self.meta['modulation_ids'])
+        for target in self.meta['modulation_targets']:
+            table.target_code(target)
+        return table
+
+    def rule_effect_slots(self, i: int) -> Column:
+        offsets = self.columns['effect_offset']
+        return self.columns['effect_slot'][offsets[i] : offsets[i + 1]]
+
+    # -- binary form
+
+    def to_bytes(self) -> bytes:
+        sections: list[tuple[str, str, bytes]] = [
+            ('meta', 'B', json.dumps(self.meta, separators=(',', ':')).encode('utf-8'))
+        ]
+        for name in COLUMNS:
+            col = self.columns[name]
+            typecode = col.typecode if isinstance(col, array) else col.format
+            sections.append((name, typecode, bytes(col)))
+        table_end = _HEADER.size + _ENTRY.size * len(sections)
+        entries, chunks, offset = [], [], _align(table_end)
+        for name, typecode, data in sections:
+            entries.append(_ENTRY.pack(name.encode('ascii'), typecode.encode('ascii'), offset, len(data)))
+            chunks.append((offset, data))
+            offset = _align(offset + len(data))
+        out = bytearray(offset)
+        out[: _HEADER.size] = _HEADER.pack(MAGIC, FORMAT_VERSION, len(sections))
+        out[_HEADER.size : table_end] = b''.join(entries)
+        for start, data in chunks:
+            out[start : start + len(data)] = data
+        return bytes(out)
+
+    def save(self, path: Union[str, os.PathLike[str]]) -> None:
+        with open(path, 'wb') as fh:
+            fh.write(self.to_bytes())
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, bytearray, memoryview, mmap.mmap]) -> RuntimePlan:
+        """Plan whose columns are zero-copy views of ``data``."""
+        if sys.byteorder != 'little':  # pragma: no cover
+            raise ValueError('runtime plans are little-endian only')
+        buf = memoryview(data)
+        magic, version, count = _HEADER.unpack_from(buf, 0)
+        if magic != MAGIC:
+            raise ValueError('not a runtime plan (bad magic)')
+        if version != FORMAT_VERSION:
+            raise ValueError(f'unsupported runtime plan version {version} (expected {FORMAT_VERSION})')
+        columns: dict[str, Column] = {}
+        meta: dict[str, Any] = {}
+        for i in range(count):
+            raw_name, typecode, offset, length = _ENTRY.unpack_from(buf, _HEADER.size + i * _ENTRY.size)
+            name = raw_name.rstrip(b'\0').decode('ascii')
+            view = buf[offset : offset + length]
+            if name == 'meta':
+                meta = json.loads(bytes(view))
+            else:
+                columns[name] = view.cast(typecode.decode('ascii'))
+        return cls(columns, meta, data if isinstance(data, mmap.mmap) else None)
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike[str]]) -> RuntimePlan:
+        """Memory-map a saved plan read-only; call ``close()`` (or use ``with``) when done."""
+        with open(path, 'rb') as fh:
+            mapping = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls.from_bytes(mapping)
+
+    def close(self) -> None:
+        """Release the columns and unmap the file.
+
+        Slices taken from a column (``rule_effect_slots`` results included) keep the
+        mapping alive: it is then unmapped when the last of them is dropped.
+        """
+        for col in self.columns.values():
+            if isinstance(col, memoryview):
+                col.release()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass  # views still exported; the mmap is unmapped when they are collected
+            self._mmap = None
+
+    def __enter__(self) -> RuntimePlan:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"RuntimePlan(<{len(self)} slots, {len(self.columns['control_slot'])} controls, "
+            f"{len(self.columns['mod_slot'])} modulations, {len(self.columns['rule_target_slot'])} rules>)"
+        )
+
+
+def _align(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def compile_asset(asset: Any, strict: bool = False) -> RuntimePlan:
+    """Compile a validated ``SynestheticAsset`` into a ``RuntimePlan``.
+
+    ``strict`` is passed to ``ParameterIndex.from_asset`` (unresolved paths raise).
+    """
+    index = ParameterIndex.from_asset(asset, strict=strict)
+    n = len(index)
+    slot_cols = {name: array('d', [_NAN]) * n for name in _SLOT_COLUMNS}
+    filled = bytearray(n)  # slot already has its defaults/limits
+    string_defaults: dict[str, Any] = {}
+
+    def fill(slot: int, p: Any) -> None:
+        if filled[slot]:
+            return
+        filled[slot] = 1
+        default = _field(p, 'default')
+        slot_cols['default'][slot] = _num(default)
+        if isinstance(default, str):
+            string_defaults[str(slot)] = default
+        for col, key in (('min', 'min'), ('max', 'max'), ('step', 'step'), ('smoothing', 'smoothingTime')):
+            slot_cols[col][slot] = _num(_field(p, key))
+
+    for section in SECTIONS:
+        component = getattr(asset, section, None)
+        for p in (_field(component, 'input_parameters') or []) if component is not None else ():
+            fill(index.slot(canonical_path(_field(p, 'path'), section)), p)
+
+    controls = asset.control.control_parameters if asset.control is not None else []
+    cols: dict[str, Column] = dict(slot_cols)
+    cols['control_slot'] = index.control_slots
+    for name in ('default', 'min', 'max', 'step', 'smoothing'):
+        key = 'smoothingTime' if name == 'smoothing' else name
+        cols[f'control_{name}'] = array('d', [_num(getattr(c, key)) for c in controls])
+    cols['control_type'] = array('B', [DATA_TYPES.index(c.type) for c in controls])
+    for slot, c in zip(index.control_slots, controls):
+        fill(slot, c)
+    for slot in range(n):
+        if not filled[slot]:
+            slot_cols['default'][slot] = 0.0  # referenced only: starts at zero
+
+    table = ModulationTable.from_model(asset)
+    cols['mod_slot'] = index.modulation_slots
+    for name in _MOD_COLUMNS[1:]:
+        cols[name] = getattr(table, name[len('mod_'):])
+
+    rules = asset.rule_bundle.rules if asset.rule_bundle is not None else []
+    cols['rule_target_slot'] = index.rule_target_slots
+    cols['effect_slot'] = index.effect_slots
+    cols['effect_offset'] = index.effect_offsets
+
+    meta = {
+        'name': asset.name,
+        'paths': list(index.paths),
+        'declared': index.declared,
+        'string_defaults': string_defaults,
+        'modulation_ids': list(table.ids),
+        'modulation_targets': list(table.targets),
+        'rules': [r.model_dump(mode='json', exclude_none=True) for r in rules],
+    }
+    return RuntimePlan(cols, meta)
+
@@ -0,0 +1,254 @@
+"""
+Rule-bundle execution engine.
+
+Hand-written (not generated): codegen leaves this package in place.
+
+``RuleEngine`` compiles a bundle's rules once into dispatch tables keyed by
+trigger type and by the source signals their effects read, then applies only the
+affected rules to each input event, writing into a slot-addressed value buffer
+(see ``ParameterIndex`` / ``RuntimePlan``):
+
+    engine = RuleEngine.from_plan(plan)          # or RuleEngine.from_asset(asset)
+    values = plan.new_buffer()
+    fired = engine.dispatch('grid_cell', {'grid.pressure': 0.4, 'grid.note': 'C4'},
+                            values, now_ms=t)
+
+Rules follow the shape written by ``scripts/convert_legacy_rule_bundles.py``:
+``trigger: {type, params: {cooldown}}`` and ``effects: [{channel, target, op,
+value}]``. An effect ``value`` is a number, or ``{source, scale, curve,
+threshold}``: the event's ``source`` signal gated by ``threshold`` (below it
+the effect does not fire), shaped by ``curve`` (``runtime.curves``) and
+multiplied by ``scale``. Effects whose source is absent from the event are
+skipped; effects with a constant value fire on every event of the trigger type.
+
+    set                   values[slot] = v
+    add                   values[slot] += v
+    triggerAttackRelease  returns a ``Trigger`` (note, duration, velocity); value is
+                          ``{note, duration, velocity}``, velocity a number or a
+                          source spec, and ``'<signal>'`` notes are read from the event
+
+``dispatch`` returns the triggers fired by the event. ``cooldown`` (ms) is
+enforced when ``now_ms`` is passed. ``expr`` is carried but not interpreted, and
+rules without a trigger type are never dispatched. Unknown ops and curves raise
+``ValueError`` when the engine is built.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, Mapping, NamedTuple, Optional, Sequence
+
+from .curves import curve
+from .param_index import NO_SLOT, ParameterIndex
+
+__all__ = ['OPS', 'RuleEngine', 'Trigger']
+
+OPS = ('set', 'add', 'triggerAttackRelease')
+_SET, _ADD, _TRIGGER = range(3)
+
+
+class Trigger(NamedTuple):
+    rule: str
+    channel: Optional[str]
+    target: Optional[str]
+    slot: int  # NO_SLOT when the target has none
+    note: Any
+    duration: Any
+    velocity: float
+
+
+class _Effect:
+    __slots__ = (
+        'op',
+        'slot',
+        'channel',
+        'target',
+        'source',
+        'scale',
+        'shape',
+        'threshold',
+        'const',
+        'note',
+        'duration',
+    )
+
+    def __init__(self, effect: Mapping[str, Any], slot: int, where: str):
+        op = effect.get('op')
+        if op not in OPS:
+            raise ValueError(f'{where}: unsupported op {op!r} (expected one of {list(OPS)})')
+        self.op = OPS.index(op)
+        self.slot = slot
+        self.channel = effect.get('channel')
+        self.target = effect.get('target')
+        value = effect.get('value')
+        self.note = self.duration = None
+        if self.op == _TRIGGER:
+            if not isinstance(value, Mapping):
+                raise ValueError(f'{where}: triggerAttackRelease needs a {{note, duration, velocity}} value')
+            self.note = value.get('note')
+            self.duration = value.get('duration')
+            value = value.get('velocity', 1.0)
+        elif self.slot == NO_SLOT:
+            raise ValueError(f'{where}: {op} needs a target')
+        self.source: Optional[str] = None
+        self.scale, self.shape, self.threshold, self.const = 1.0, curve(None), None, 0.0
+        if isinstance(value, Mapping) and 'source' in value:
+            self.source = value['source']
+            self.scale = float(value.get('scale', 1.0))
+            self.shape = curve(value.get('curve'))
+            threshold = value.get('threshold')
+            self.threshold = None if threshold is None else float(threshold)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            self.const = float(value)
+        else:
+            raise ValueError(f'{where}: value must be a number or a {{source, ...}} object, got {value!r}')
+
+    def value(self, signals: Mapping[str, Any]) -> Optional[float]:
+        if self.source is None:
+            return self.const
+        x = signals.get(self.source)
+        if x is None or (self.threshold is not None and x < self.threshold):
+            return None
+        return self.shape(x) * self.scale
+
+
+class _Rule:
+    __slots__ = ('id', 'effects', 'cooldown', 'last_ms')
+
+    def __init__(self, rule_id: str, effects: list[_Effect], cooldown: Optional[float]):
+        self.id = rule_id
+        self.effects = effects
+        self.cooldown = cooldown
+        self.last_ms: Optional[float] = None
+
+
+class _Table:
+    """Rules of one trigger type: those reading each source, and those firing always."""
+
+    __slots__ = ('by_source', 'always')
+
+    def __init__(self) -> None:
+        self.by_source: dict[str, list[int]] = {}
+        self.always: list[int] = []
+
+
+class RuleEngine:
+    """Compiled rule bundle; see the module docstring."""
+
+    def __init__(
+        self,
+        rules: Sequence[Mapping[str, Any]],
+        effect_slots: Sequence[int],
+        effect_offsets: Sequence[int],
+        execution: Optional[str] = None,
+    ):
+        """Compile ``rules`` (dicts) whose effect target slots are laid out CSR-style.
+
+        Rule i's effects write ``effect_slots[effect_offsets[i]:effect_offsets[i + 1]]``
+        (``ParameterIndex`` / ``RuntimePlan`` columns). ``execution`` keeps only rules
+        whose ``execution`` is unset or equal to it.
+        """
+        self._rules: list[_Rule] = []
+        self._tables: dict[str, _Table] = {}
+        for i, rule in enumerate(rules):
+            trigger = rule.get('trigger') or {}
+            kind = trigger.get('type')
+            if kind is None or (execution is not None and rule.get('execution') not in (None, execution)):
+                continue
+            slots = effect_slots[effect_offsets[i] : effect_offsets[i + 1]]
+            where = f"rule {rule.get('id')!r}"
+            effects = [
+                _Effect(e, slot, f'{where} effects[{j}]')
+                for j, (e, slot) in enumerate(zip(rule.get('effects') or (), slots))
+            ]
+            cooldown = (trigger.get('params') or {}).get('cooldown')
+            pos = len(self._rules)
+            self._rules.append(_Rule(rule.get('id'), effects, None if cooldown is None else float(cooldown)))
+            table = self._tables.setdefault(kind, _Table())
+            sources = {e.source for e in effects}
+            if None in sources:
+                table.always.append(pos)
+            for source in sorted(s for s in sources if s is not None):
+                table.by_source.setdefault(source, []).append(pos)
+
+    @classmethod
+    def from_plan(cls, plan: Any, execution: Optional[str] = None) -> RuleEngine:
+        return cls(plan.meta['rules'], plan.effect_slot, plan.effect_offset, execution)
+
+    @classmethod
+    def from_asset(
+        cls,
+        asset: Any,
+        index: Optional[ParameterIndex] = None,
+        execution: Optional[str] = None,
+    ) -> RuleEngine:
+        if index is None:
+            index = ParameterIndex.from_asset(asset)
+        rules = asset.rule_bundle.rules if asset.rule_bundle is not None else []
+        dumped = [r.model_dump(exclude_none=True) for r in rules]
+        return cls(dumped, index.effect_slots, index.effect_offsets, execution)
+
+    # -- dispatch
+
+    def trigger_types(self) -> list[str]:
+        return sorted(self._tables)
+
+    def affected(self, event_type: str, signals: Iterable[str]) -> list[str]:
+        """Ids of the rules an event of this type/signals would evaluate, in bundle order."""
+        return [self._rules[i].id for i in self._select(event_type, signals)]
+
+    def _select(self, event_type: str, signals: Iterable[str]) -> Sequence[int]:
+        table = self._tables.get(event_type)
+        if table is None:
+            return ()
+        by_source = table.by_source
+        hits = [by_source[s] for s in signals if s in by_source]
+        if not table.always and len(hits) == 1:
+            return hits[0]
+        if not hits:
+            return table.always
+        return sorted({i for group in hits for i in group}.union(table.always))
+
+    def dispatch(
+        self,
+        event_type: str,
+        signals: Mapping[str, Any],
+        values: Any,
+        now_ms: Optional[float] = None,
+        on_trigger: Optional[Callable[[Trigger], None]] = None,
+    ) -> list[Trigger]:
+        """Apply the rules affected by one event to ``values``; return fired triggers."""
+        fired: list[Trigger] = []
+        for i in self._select(event_type, signals):
+            rule = self._rules[i]
+            if now_ms is not None and rule.cooldown and rule.last_ms is not None:
+                if now_ms - rule.last_ms < rule.cooldown:
+                    continue
+            applied = False
+            for e in rule.effects:
+                v = e.value(signals)
+                if v is None:
+                    continue
+                applied = True
+                if e.op == _SET:
+                    values[e.slot] = v
+                elif e.op == _ADD:
+                    values[e.slot] += v
+                else:
+                    note = e.note
+                    if isinstance(note, str) and note[:1] == '<' and note[-1:] == '>':
+                        note = signals.get(note[1:-1])
+                    t = Trigger(rule.id, e.channel, e.target, e.slot, note, e.duration, v)
+                    fired.append(t)
+                    if on_trigger is not None:
+                        on_trigger(t)
+            if applied and now_ms is not None:
+                rule.last_ms = now_ms
+        return fired
+
+    def reset(self) -> None:
+        """Forget cooldown state."""
+        for rule in self._rules:
+            rule.last_ms = None
+
+    def __len__(self) -> int:
+        return len(self._rules)
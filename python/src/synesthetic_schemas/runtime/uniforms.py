@@ -0,0 +1,199 @@
+"""
+std140 uniform-block layout for a ``Shader`` and an in-place writer.
+
+Hand-written (not generated): codegen leaves this package in place.
+
+``UniformLayout`` fixes a byte offset for every ``Shader.uniforms[*]`` entry,
+in declaration order, using std140 rules. Uniforms driven by an input parameter
+are bound to that parameter's ``ParameterIndex`` slot, and ``write`` packs the
+whole block into a preallocated buffer with a single ``struct.pack_into``:
+
+    layout = UniformLayout.from_asset(asset)      # or .from_shader(shader, index)
+    block = layout.new_buffer()                   # bytearray(layout.size), defaults
+    layout.set('u_time', t)                       # values not held in a slot
+    layout.write(block, values)                   # values: slot buffer (plan.new_buffer())
+    gl_buffer_sub_data(block)                     # upload as-is
+
+Layout (std140, in bytes; ``T`` is float, int, uint or bool, each 4 bytes):
+
+    T         size 4,  align 4
+    Tvec2     size 8,  align 8      (vec2, ivec2, uvec2, bvec2)
+    Tvec3     size 12, align 16
+    Tvec4     size 16, align 16
+    matN      N columns of 16 bytes (column-major), align 16
+
+The block size is rounded up to 16. Sampler and image uniforms are opaque (not
+part of a block) and are listed in ``skipped``. Other types raise
+``ValueError``.
+
+A uniform binds to a slot when it has one component and an input parameter
+with ``parameter`` equal to its name (or ``path`` equal to its name) exists in
+the index. Defaults may be a number (broadcast, or the diagonal of a matrix),
+a list of numbers (matrices column-major), or a ``'#rrggbb'``/``'#rrggbbaa'``
+colour for float vectors. Bound int/uint/bool uniforms are truncated to integers;
+a NaN slot (no value given, as in ``RuntimePlan`` columns) packs as 0.
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import Any, NamedTuple, Optional, Sequence
+
+from .param_index import ParameterIndex, _field, canonical_path
+
+__all__ = ['UNIFORM_TYPES', 'UniformField', 'UniformLayout']
+
+# type -> (struct code, columns, rows); matrices are `columns` vec`rows` columns
+UNIFORM_TYPES: dict[str, tuple[str, int, int]] = {
+    'float': ('f', 1, 1),
+    'int': ('i', 1, 1),
+    'uint': ('I', 1, 1),
+    'bool': ('I', 1, 1),
+}
+for _prefix, _code in (('', 'f'), ('i', 'i'), ('u', 'I'), ('b', 'I')):
+    for _n in (2, 3, 4):
+        UNIFORM_TYPES[f'{_prefix}vec{_n}'] = (_code, 1, _n)
+for _n in (2, 3, 4):
+    UNIFORM_TYPES[f'mat{_n}'] = ('f', _n, _n)
+
+_OPAQUE = ('sampler', 'image', 'isampler', 'usampler', 'iimage', 'uimage')
+
+
+class UniformField(NamedTuple):
+    name: str
+    type: str
+    offset: int  # bytes from the start of the block
+    size: int  # bytes, excluding trailing padding
+    slot: Optional[int]  # bound parameter slot, if any
+
+
+def _align(n: int, to: int) -> int:
+    return (n + to - 1) & ~(to - 1)
+
+
+def _components(default: Any, code: str, columns: int, rows: int, name: str) -> list[Any]:
+    n = columns * rows
+    if isinstance(default, str) and default.startswith('#') and code == 'f' and columns == 1:
+        digits = default[1:]
+        if len(digits) not in (6, 8) or rows < 3:
+            raise ValueError(f'uniform {name!r}: cannot use colour {default!r} for {rows} components')
+        rgba = [int(digits[i : i + 2], 16) / 255.0 for i in range(0, len(digits), 2)]
+        values: list[Any] = (rgba + [1.0])[:rows]
+    elif default is None:
+        values = [0] * n
+    elif isinstance(default, (int, float)):
+        if columns > 1:  # matN(x): x on the diagonal
+            values = [default if c == r else 0 for c in range(columns) for r in range(rows)]
+        else:
+            values = [default] * n
+    elif isinstance(default, (list, tuple)) and len(default) == n:
+        values = list(default)
+    else:
+        raise ValueError(f'uniform {name!r}: default {default!r} does not fit {n} components')
+    if code == 'f':
+        return [float(v) for v in values]
+    return [int(v) for v in values]
+
+
+class UniformLayout:
+    """Fixed std140 block layout plus packer; see the module docstring."""
+
+    def __init__(self, uniforms: Sequence[Any], slots: Optional[dict[str, int]] = None):
+        """``uniforms`` are ``UniformDef`` models (or dicts); ``slots`` maps uniform names to slots."""
+        slots = slots or {}
+        self.fields: list[UniformField] = []
+        self.skipped: list[str] = []
+        self._args: list[Any] = []  # one per packed component, in block order
+        self._arg_pos: dict[str, int] = {}
+        self._bound: list[tuple[int, int, bool]] = []  # (arg position, slot, integer)
+        fmt = ['<']
+        offset = 0
+        for u in uniforms:
+            name, kind = _field(u, 'name'), _field(u, 'type')
+            if kind.startswith(_OPAQUE):
+                self.skipped.append(name)
+                continue
+            try:
+                code, columns, rows = UNIFORM_TYPES[kind]
+            except KeyError:
+                raise ValueError(f'uniform {name!r}: unsupported type {kind!r}') from None
+            align = 16 if columns > 1 or rows > 2 else 4 * rows
+            stride = 16  # matrix column
+            start = _align(offset, align)
+            if start > offset:
+                fmt.append(f'{start - offset}x')
+            values = _components(_field(u, 'default'), code, columns, rows, name)
+            self._arg_pos[name] = len(self._args)
+            for c in range(columns):
+                fmt.append(f'{rows}{code}')
+                if columns > 1 and rows < 4:
+                    fmt.append(f'{stride - 4 * rows}x')
+                self._args.extend(values[c * rows : (c + 1) * rows])
+            size = stride * columns if columns > 1 else 4 * rows
+            offset = start + size
+            slot = slots.get(name) if columns * rows == 1 else None
+            if slot is not None:
+                self._bound.append((self._arg_pos[name], slot, code != 'f'))
+            self.fields.append(UniformField(name, kind, start, size, slot))
+        self.size = _align(offset, 16)
+        if self.size > offset:
+            fmt.append(f'{self.size - offset}x')
+        self._struct = struct.Struct(''.join(fmt))
+        self._by_name = {f.name: f for f in self.fields}
+
+    @classmethod
+    def from_shader(cls, shader: Any, index: Optional[ParameterIndex] = None) -> UniformLayout:
+        """Layout of ``shader.uniforms``, bound to ``index`` slots when given."""
+        slots: dict[str, int] = {}
+        if index is not None:
+            paths = {}
+            for p in _field(shader, 'input_parameters') or ():
+                paths.setdefault(_field(p, 'parameter'), _field(p, 'path'))
+                paths.setdefault(_field(p, 'path'), _field(p, 'path'))
+            for u in _field(shader, 'uniforms') or ():
+                name = _field(u, 'name')
+                slot = index.get(canonical_path(paths.get(name, name), 'shader'))
+                if slot is not None:
+                    slots[name] = slot
+        return cls(_field(shader, 'uniforms') or (), slots)
+
+    @classmethod
+    def from_asset(cls, asset: Any, index: Optional[ParameterIndex] = None) -> UniformLayout:
+        if index is None:
+            index = ParameterIndex.from_asset(asset)
+        return cls.from_shader(asset.shader if asset.shader is not None else {}, index)
+
+    # -- packing
+
+    def field(self, name: str) -> UniformField:
+        return self._by_name[name]
+
+    def set(self, name: str, value: Any) -> None:
+        """Set a uniform's value for the following ``write`` calls (e.g. ``u_time``)."""
+        pos = self._arg_pos[name]
+        code, columns, rows = UNIFORM_TYPES[self._by_name[name].type]
+        if columns * rows == 1 and isinstance(value, (int, float)):
+            self._args[pos] = float(value) if code == 'f' else int(value)
+        else:
+            self._args[pos : pos + columns * rows] = _components(value, code, columns, rows, name)
+
+    def new_buffer(self) -> bytearray:
+        """A ``bytearray(size)`` holding the packed defaults."""
+        buf = bytearray(self.size)
+        self._struct.pack_into(buf, 0, *self._args)
+        return buf
+
+    def write(self, buf: Any, values: Optional[Sequence[float]] = None, offset: int = 0) -> None:
+        """Pack the block into ``buf`` (writable buffer) at ``offset``, reading bound slots from ``values``."""
+        args = self._args
+        if values is not None:
+            for pos, slot, integer in self._bound:
+                v = values[slot]
+                args[pos] = (int(v) if v == v else 0) if integer else v  # v != v: NaN
+        self._struct.pack_into(buf, offset, *args)
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    def __repr__(self) -> str:
+        return f'UniformLayout(<{len(self.fields)} uniforms, {self.size} bytes, {len(self._bound)} bound>)'
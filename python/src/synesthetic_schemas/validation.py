@@ -0,0 +1,481 @@
+"""
+In-process validation for Synesthetic documents.
+
+Hand-written (not generated): codegen leaves this module in place.
+
+``AssetValidator`` loads the schema set from ``jsonschema/`` once, compiles one
+Draft 2020-12 validator per schema on first use, and validates documents
+against both the JSON Schema and the generated Pydantic model:
+
+    v = AssetValidator()
+    result = v.validate(doc)            # dispatch by $schema / $schemaRef
+    if not result.ok:
+        for issue in result.errors:
+            print(issue.stage, issue.pointer, issue.message)
+
+``level`` selects how much work is done per document (cumulative):
+
+    schema     JSON Schema only
+    model      + Pydantic model_validate              (default)
+    roundtrip  + dump/normalize/diff against the input (what ``make validate`` runs)
+
+``json_schema=False`` drops the JSON Schema stage (levels model/roundtrip only).
+``validate_json(raw)`` takes the document as bytes: it is parsed once and the
+result shared by every stage, and with ``json_schema=False, level='model'`` the
+bytes go straight to pydantic-core (``model_validate_json``) and are never
+turned into Python dicts.
+
+The object is meant to be long-lived (one per process / service) and is safe to
+share between threads once constructed.
+
+The schema set ships with the package (``synesthetic_schemas/schemas/``, a copy
+of ``jsonschema/`` written by ``codegen/gen_py.sh``); a source checkout uses its
+``jsonschema/`` directly, and ``$SYNESTHETIC_SCHEMA_DIR`` overrides both.
+
+Requires ``jsonschema>=4.18`` (``pip install synesthetic-schemas[validation]``).
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import os
+from dataclasses import dataclass, field
+from importlib import resources
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+try:
+    from jsonschema import Draft202012Validator
+    from referencing import Registry, Resource
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "synesthetic_schemas.validation requires jsonschema>=4.18 "
+        "(pip install 'synesthetic-schemas[validation]')"
+    ) from e
+
+__all__ = [
+    'LEVELS',
+    'SCHEMA_TO_MODEL',
+    'AssetValidator',
+    'ValidationIssue',
+    'ValidationResult',
+    'build_registry',
+    'default_schema_dir',
+    'load_schema_store',
+    'model_json_errors',
+    'read_envelope',
+    'roundtrip_diff',
+    'schema_file_for_ref',
+]
+
+# Map schema file name -> (python module, model class name)
+SCHEMA_TO_MODEL: dict[str, tuple[str, str]] = {
+    'synesthetic-asset.schema.json': ('synesthetic_asset', 'SynestheticAsset'),
+    'control-bundle.schema.json': ('control_bundle', 'ControlBundle'),
+    'control.schema.json': ('control', 'Control'),
+    'shader.schema.json': ('shader', 'Shader'),
+    'tone.schema.json': ('tone', 'Tone'),
+    'haptic.schema.json': ('haptic', 'Haptic'),
+    'modulation.schema.json': ('modulation', 'Modulation'),
+    'rule-bundle.schema.json': ('rule_bundle', 'RuleBundle'),
+    'rule.schema.json': ('rule', 'Rule'),
+}
+
+# Round-trip keys to ignore entirely (pydantic may normalize heavily)
+ROUNDTRIP_IGNORE_TOPLEVEL = {'shader', 'control', 'modulations'}
+
+SCHEMA_DIR_ENV = 'SYNESTHETIC_SCHEMA_DIR'
+
+# Validation levels, cheapest first; each includes the previous ones.
+LEVELS = ('schema', 'model', 'roundtrip')
+
+
+# ---------------------------- schema set ----------------------------
+
+def default_schema_dir() -> Path:
+    """$SYNESTHETIC_SCHEMA_DIR if set, else jsonschema/ of a source checkout, else the packaged copy."""
+    env = os.environ.get(SCHEMA_DIR_ENV)
+    if env:
+        return Path(env)
+    checkout = Path(__file__).resolve().parents[3] / 'jsonschema'
+    if (checkout / 'synesthetic-asset.schema.json').is_file():
+        return checkout
+    packaged = resources.files(__package__) / 'schemas'
+    if not packaged.is_dir():
+        raise FileNotFoundError(
+            f'no schema set found: the package has no schemas/ data and there is no source checkout; '
+            f'set ${SCHEMA_DIR_ENV} to a directory holding the *.schema.json files'
+        )
+    return Path(str(packaged))
+
+
+def schema_file_for_ref(ref: str) -> str:
+    """'https://…/0.7.3/tone.schema.json' or 'jsonschema/tone.schema.json' -> 'tone.schema.json'."""
+    if ref.startswith('http://') or ref.startswith('https://'):
+        return ref.rsplit('/', 1)[-1]
+    return Path(ref).name
+
+
+def load_schema_store(schema_dir: Path) -> dict[str, dict[str, Any]]:
+    """Load every *.schema.json in schema_dir keyed by $id (file name when $id is absent)."""
+    store: dict[str, dict[str, Any]] = {}
+    for p in sorted(schema_dir.glob('*.schema.json')):
+        data = json.loads(p.read_bytes())
+        store[data.get('$id') or p.name] = data
+    return store
+
+
+def build_registry(store: dict[str, dict[str, Any]]) -> Registry:
+    """Registry of the absolute $ids our cross-file $refs point at."""
+    return Registry().with_resources(
+        (k, Resource.from_contents(v)) for k, v in store.items() if k.startswith('http')
+    )
+
+
+# ---------------------------- round-trip ----------------------------
+
+# Single pass over both trees. Defaults pruning ('scale' == 1 on ActionType-shaped
+# dicts), None-dropping and int/float coercion are applied on the fly while walking,
+# so nothing is copied and equal subtrees allocate nothing; paths and messages are
+# only built once a mismatch has been found.
+
+def _rt_skip(d: dict[str, Any], k: str, v: Any) -> bool:
+    """True if key k of d does not take part in the comparison."""
+    if v is None:
+        return True
+    # ActionType block (heuristic: 'axis' and 'sensitivity' keys): scale defaults to 1.0
+    if k == 'scale' and 'axis' in d and 'sensitivity' in d:
+        try:
+            return float(v) == 1.0
+        except Exception:
+            return False
+    return False
+
+
+def _rt_scalar(v: Any) -> Any:
+    if isinstance(v, bool):
+        return v
+    if isinstance(v, (int, float)):
+        return float(v)
+    return v
+
+
+def _rt_equal(a: Any, b: Any, ignore: frozenset[str] = frozenset()) -> bool:
+    if isinstance(a, dict):
+        if not isinstance(b, dict):
+            return False
+        n = 0
+        for k, v in a.items():
+            if _rt_skip(a, k, v):
+                continue
+            if k not in b:
+                return False
+            w = b[k]
+            if _rt_skip(b, k, w):
+                return False
+            if k not in ignore and not _rt_equal(v, w):
+                return False
+            n += 1
+        for k, w in b.items():
+            if not _rt_skip(b, k, w):
+                n -= 1
+        return n == 0
+    if isinstance(a, list):
+        if not isinstance(b, list) or len(a) != len(b):
+            return False
+        for i in range(len(a)):
+            if not _rt_equal(a[i], b[i]):
+                return False
+        return True
+    if isinstance(b, (dict, list)):
+        return False
+    return _rt_scalar(a) == _rt_scalar(b)
+
+
+def _rt_type(v: Any) -> type:
+    if isinstance(v, bool):
+        return bool
+    if isinstance(v, (int, float)):
+        return float
+    return type(v)
+
+
+def _rt_entries(
+    a: Any,
+    b: Any,
+    path: list[Any],
+    out: list[tuple[tuple[Any, ...], str]],
+    ignore: frozenset[str] = frozenset(),
+) -> None:
+    """Append (path, detail) for every difference below a mismatching pair."""
+    ta, tb = _rt_type(a), _rt_type(b)
+    if ta is not tb and not (isinstance(a, (int, float)) and isinstance(b, (int, float))):
+        out.append((tuple(path), f'type {ta.__name__} != {tb.__name__}'))
+        return
+    if isinstance(a, dict):
+        ak = {k for k, v in a.items() if not _rt_skip(a, k, v)}
+        bk = {k for k, v in b.items() if not _rt_skip(b, k, v)}
+        for k in sorted(ak - bk):
+            out.append((tuple(path) + (k,), 'present in input, missing in output'))
+        for k in sorted(bk - ak):
+            out.append((tuple(path) + (k,), 'added in output'))
+        for k in sorted(ak & bk):
+            if k in ignore or _rt_equal(a[k], b[k]):
+                continue
+            path.append(k)
+            _rt_entries(a[k], b[k], path, out)
+            path.pop()
+    elif isinstance(a, list):
+        if len(a) != len(b):
+            out.append((tuple(path), f'list length {len(a)} != {len(b)}'))
+        for i, (ai, bi) in enumerate(zip(a, b)):
+            if _rt_equal(ai, bi):
+                continue
+            path.append(i)
+            _rt_entries(ai, bi, path, out)
+            path.pop()
+    else:
+        x, y = _rt_scalar(a), _rt_scalar(b)
+        if x != y:
+            out.append((tuple(path), f'{x!r} != {y!r}'))
+
+
+def roundtrip_diff(data: Any, model: Any) -> list[tuple[tuple[Any, ...], str]]:
+    """Diff a (cleaned) input document against ``model``'s JSON dump.
+
+    Defaults are pruned, None dropped and numbers coerced on both sides; an empty
+    list means the model round-trips the input losslessly.
+    """
+    out = model.model_dump(
+        mode='json',
+        exclude_none=True,
+        exclude_unset=True,
+        exclude_defaults=True,
+    )
+
+    # ignore some noisy top-levels entirely (until their shapes stabilize)
+    ignore: frozenset[str] = frozenset()
+    if isinstance(data, dict) and isinstance(out, dict):
+        ignore = frozenset(
+            k for k in ROUNDTRIP_IGNORE_TOPLEVEL
+            if k in data and not _rt_skip(data, k, data[k]) and k in out and not _rt_skip(out, k, out[k])
+        )
+
+    if _rt_equal(data, out, ignore):
+        return []
+    diffs: list[tuple[tuple[Any, ...], str]] = []
+    _rt_entries(data, out, [], diffs, ignore)
+    return diffs
+
+
+def json_pointer(path: Iterable[Any]) -> str:
+    return ''.join('/' + str(p).replace('~', '~0').replace('/', '~1') for p in path)
+
+
+# ---------------------------- bytes path ----------------------------
+
+_ENVELOPE: Any = None
+
+
+def read_envelope(raw: bytes | str) -> dict[str, Any]:
+    """Return the root ``$schema``/``$schemaRef`` of a JSON document without building it.
+
+    pydantic-core parses the bytes but only materializes those two keys. Raises
+    ValueError when raw is not valid JSON, TypeError when it is not an object.
+    """
+    global _ENVELOPE
+    from pydantic import BaseModel, Field, ValidationError
+
+    if _ENVELOPE is None:
+
+        class _Envelope(BaseModel):  # extra keys are ignored, not built
+            schema_: Any = Field(None, alias='$schema')
+            schema_ref: Any = Field(None, alias='$schemaRef')
+
+        _ENVELOPE = _Envelope
+    try:
+        env = _ENVELOPE.model_validate_json(raw)
+    except ValidationError as e:
+        err = e.errors(include_url=False)[0]
+        if err['type'] == 'json_invalid':
+            raise ValueError(err['msg']) from None
+        raise TypeError('document is not a JSON object') from None
+    return env.model_dump(by_alias=True, exclude_unset=True)
+
+
+def model_json_errors(model: type[Any], raw: bytes | str) -> list[ValidationIssue]:
+    """Validate JSON bytes against a model with ``model_validate_json``.
+
+    Root-level ``$``-prefixed keys are transport metadata: the ``extra_forbidden``
+    errors they raise are dropped. Invalid JSON is reported with stage ``parse``.
+    """
+    from pydantic import ValidationError
+
+    try:
+        model.model_validate_json(raw)
+    except ValidationError as e:
+        issues = []
+        for d in e.errors(include_url=False):
+            loc = d['loc']
+            if d['type'] == 'extra_forbidden' and len(loc) == 1 and str(loc[0]).startswith('$'):
+                continue
+            stage = 'parse' if d['type'] == 'json_invalid' else 'model'
+            issues.append(ValidationIssue(stage, json_pointer(loc), d['msg']))
+        return issues
+    return []
+
+
+# ---------------------------- validator ----------------------------
+
+@dataclass(frozen=True)
+class ValidationIssue:
+    stage: str  # parse | dispatch | schema | model | roundtrip
+    pointer: str  # JSON Pointer into the (envelope-stripped) document
+    message: str
+
+
+@dataclass(frozen=True)
+class ValidationResult:
+    schema: Optional[str]
+    errors: list[ValidationIssue] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+class AssetValidator:
+    """Long-lived validator over the whole schema set.
+
+    schema_dir:     directory holding *.schema.json (default: ``default_schema_dir()``)
+    default_schema: schema file used for documents without $schema/$schemaRef
+    level:          one of LEVELS (see module docstring)
+    json_schema:    run the JSON Schema stage (False: Pydantic only; needs level model+)
+    """
+
+    def __init__(
+        self,
+        schema_dir: Optional[os.PathLike[str] | str] = None,
+        *,
+        default_schema: Optional[str] = None,
+        level: str = 'model',
+        json_schema: bool = True,
+    ) -> None:
+        self.schema_dir = Path(schema_dir) if schema_dir is not None else default_schema_dir()
+        if not self.schema_dir.is_dir():
+            raise FileNotFoundError(f'schema dir not found: {self.schema_dir} (see ${SCHEMA_DIR_ENV})')
+        if default_schema is not None and default_schema not in SCHEMA_TO_MODEL:
+            raise ValueError(f'unknown schema: {default_schema}')
+        if level not in LEVELS:
+            raise ValueError(f'unknown level: {level} (expected one of {LEVELS})')
+        if not json_schema and level == 'schema':
+            raise ValueError("json_schema=False needs level 'model' or 'roundtrip'")
+        self.default_schema = default_schema
+        self.level = level
+        self.json_schema = json_schema
+
+        self._by_name: dict[str, dict[str, Any]] = {}
+        for p in sorted(self.schema_dir.glob('*.schema.json')):
+            self._by_name[p.name] = json.loads(p.read_bytes())
+        store = {s.get('$id') or n: s for n, s in self._by_name.items()}
+        self._registry = build_registry(store)
+        self._validators: dict[str, Draft202012Validator] = {}
+        self._models: dict[str, type[Any]] = {}
+
+    # -- lookups (compiled lazily, then cached for the object's lifetime)
+
+    def schema_for(self, obj: Any) -> Optional[str]:
+        """Schema file name for obj: $schema, then $schemaRef, then default_schema."""
+        if isinstance(obj, dict):
+            for key in ('$schema', '$schemaRef'):
+                ref = obj.get(key)
+                if isinstance(ref, str):
+                    return schema_file_for_ref(ref)
+        return self.default_schema
+
+    def validator(self, schema: str) -> Draft202012Validator:
+        v = self._validators.get(schema)
+        if v is None:
+            if schema not in self._by_name:
+                raise KeyError(f'schema not found in {self.schema_dir}: {schema}')
+            v = Draft202012Validator(self._by_name[schema], registry=self._registry)
+            self._validators[schema] = v
+        return v
+
+    def model(self, schema: str) -> type[Any]:
+        cls = self._models.get(schema)
+        if cls is None:
+            module_name, cls_name = SCHEMA_TO_MODEL[schema]
+            mod = importlib.import_module(f'{__package__}.{module_name}')
+            cls = getattr(mod, cls_name)
+            self._models[schema] = cls
+        return cls
+
+    # -- validation
+
+    def validate(self, obj: Any, schema: Optional[str] = None) -> ValidationResult:
+        """Validate one document; schema overrides $schema/$schemaRef dispatch."""
+        if not isinstance(obj, dict):
+            return ValidationResult(None, [ValidationIssue('dispatch', '', 'document is not a JSON object')])
+        name = schema or self.schema_for(obj)
+        if name is None:
+            return ValidationResult(None, [ValidationIssue('dispatch', '', 'no $schema/$schemaRef and no default schema')])
+        if name not in SCHEMA_TO_MODEL or name not in self._by_name:
+            return ValidationResult(None, [ValidationIssue('dispatch', '', f'$schema not recognized: {name}')])
+
+        # Strip transport-only metadata at root ($schema, $schemaRef, ...)
+        data = {k: v for k, v in obj.items() if not (isinstance(k, str) and k.startswith('$'))}
+        errors: list[ValidationIssue] = []
+
+        if self.json_schema:
+            schema_errors = self.validator(name).iter_errors(data)
+            for e in sorted(schema_errors, key=lambda e: (list(map(str, e.absolute_path)), e.message)):
+                errors.append(ValidationIssue('schema', json_pointer(e.absolute_path), e.message))
+        if self.level == 'schema':
+            return ValidationResult(name, errors)
+
+        from pydantic import ValidationError
+
+        try:
+            model = self.model(name).model_validate(data)
+        except ValidationError as e:
+            for d in e.errors(include_url=False):
+                errors.append(ValidationIssue('model', json_pointer(d['loc']), d['msg']))
+            return ValidationResult(name, errors)
+        if self.level == 'roundtrip':
+            for path, detail in roundtrip_diff(data, model):
+                errors.append(ValidationIssue('roundtrip', json_pointer(path), detail))
+        return ValidationResult(name, errors)
+
+    def validate_json(self, raw: bytes | str, schema: Optional[str] = None) -> ValidationResult:
+        """Validate one document given as JSON bytes (or str).
+
+        Parsed once and shared by all stages; Pydantic-only model checks
+        (``json_schema=False, level='model'``) validate the bytes directly.
+        """
+        if self.json_schema or self.level != 'model':
+            try:
+                obj = json.loads(raw)
+            except ValueError as e:
+                return ValidationResult(None, [ValidationIssue('parse', '', str(e))])
+            return self.validate(obj, schema)
+
+        name = schema
+        if name is None:
+            try:
+                name = self.schema_for(read_envelope(raw))
+            except ValueError as e:
+                return ValidationResult(None, [ValidationIssue('parse', '', str(e))])
+            except TypeError as e:
+                return ValidationResult(None, [ValidationIssue('dispatch', '', str(e))])
+        if name is None:
+            return ValidationResult(None, [ValidationIssue('dispatch', '', 'no $schema/$schemaRef and no default schema')])
+        if name not in SCHEMA_TO_MODEL or name not in self._by_name:
+            return ValidationResult(None, [ValidationIssue('dispatch', '', f'$schema not recognized: {name}')])
+        return ValidationResult(name, model_json_errors(self.model(name), raw))
+
+    def validate_many(self, objs: Iterable[Any], schema: Optional[str] = None) -> Iterator[ValidationResult]:
+        """Lazily validate an iterable of documents (results in input order)."""
+        for obj in objs:
+            yield self.validate(obj, schema)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# pyright: reportMissingImports=false
+"""
+Measure the resident cost of leaf models: Pydantic instances vs frozen twins.
+
+A synthetic asset library (scripts/bench_validate.make_corpus, default 10k assets)
+is split into its leaf objects -- modulations, control parameters, haptic and
+shader input parameters -- and each kind is loaded twice under tracemalloc:
+
+  pydantic   Model.model_validate_json(item) for every item, kept alive
+  frozen     the same, converted with synesthetic_schemas.frozen.X.from_model and
+             the Pydantic instances dropped (the twins keep the field values)
+
+Items are parsed from JSON bytes in both cases so neither side shares strings
+with the corpus. Output is JSONL: one corpus row, one row per model with the
+retained bytes of each representation, then a total row.
+
+CLI:
+  --assets N  --modulations N  --controls N  --seed N  --out <path> (default stdout)
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import pathlib
+import sys
+import tracemalloc
+from collections.abc import Callable, Iterable
+from typing import Any
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+PY_SRC = ROOT / "python" / "src"
+
+for p in (str(ROOT), str(PY_SRC)):
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+from scripts.bench_validate import make_corpus  # noqa: E402
+
+# frozen twin name -> how to pull its items out of an asset document
+LEAVES: dict[str, Callable[[dict[str, Any]], list[Any]]] = {
+    "ModulationItem": lambda d: d.get("modulations") or [],
+    "ControlParameter": lambda d: (d.get("control") or {}).get("control_parameters") or [],
+    "HapticParameter": lambda d: (d.get("haptic") or {}).get("input_parameters") or [],
+    "InputParameter": lambda d: (d.get("shader") or {}).get("input_parameters") or [],
+}
+
+
+def _retained(build: Callable[[], Any]) -> int:
+    """Bytes still allocated once build() has returned (its result is kept alive)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        keep = build()
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0] - base
+    finally:
+        tracemalloc.stop()
+    del keep
+    return size
+
+
+def measure(name: str, payloads: list[bytes]) -> dict[str, Any]:
+    import synesthetic_schemas as ss
+    from synesthetic_schemas import frozen
+
+    model, twin = getattr(ss, name), getattr(frozen, name)
+    model.model_validate_json(payloads[0])  # build the validator outside the trace
+
+    def _pydantic() -> list[Any]:
+        return [model.model_validate_json(b) for b in payloads]
+
+    def _frozen() -> list[Any]:
+        return [twin.from_model(model.model_validate_json(b)) for b in payloads]
+
+    n = len(payloads)
+    pyd, fro = _retained(_pydantic), _retained(_frozen)
+    return {
+        "bench": "memory",
+        "model": name,
+        "n": n,
+        "pydantic_bytes": pyd,
+        "frozen_bytes": fro,
+        "pydantic_per_item": round(pyd / n, 1),
+        "frozen_per_item": round(fro / n, 1),
+        "ratio": round(fro / pyd, 3) if pyd else 0.0,
+    }
+
+
+def run(args: argparse.Namespace, emit: Callable[[dict[str, Any]], None]) -> None:
+    corpus = make_corpus(args.assets, args.modulations, 0, args.controls, 0, args.seed)
+    items = {name: [json.dumps(x).encode() for d in corpus for x in pick(d)] for name, pick in LEAVES.items()}
+    del corpus
+    emit({"bench": "corpus", "n": args.assets, **{name: len(v) for name, v in items.items()}})
+
+    total_pyd = total_fro = 0
+    for name, payloads in items.items():
+        if not payloads:
+            continue
+        row = measure(name, payloads)
+        total_pyd += row["pydantic_bytes"]
+        total_fro += row["frozen_bytes"]
+        emit(row)
+    emit({
+        "bench": "memory",
+        "summary": True,
+        "n": args.assets,
+        "pydantic_bytes": total_pyd,
+        "frozen_bytes": total_fro,
+        "ratio": round(total_fro / total_pyd, 3) if total_pyd else 0.0,
+    })
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Compare resident size of Pydantic leaf models and frozen twins")
+    ap.add_argument("--assets", type=int, default=10_000, help="Assets in the library")
+    ap.add_argument("--modulations", type=int, default=8, help="Modulations per asset")
+    ap.add_argument("--controls", type=int, default=8, help="Control parameters per asset")
+    ap.add_argument("--seed", type=int, default=0, help="Seed selection RNG")
+    ap.add_argument("--out", help="Write JSONL here instead of stdout")
+    args = ap.parse_args(list(argv) if argv is not None else None)
+    if args.assets <= 0:
+        ap.error("--assets must be positive")
+
+    out = open(args.out, "w", encoding="utf-8") if args.out else sys.stdout
+    try:
+        def emit(row: dict[str, Any]) -> None:
+            out.write(json.dumps(row, separators=(",", ":")) + "\n")
+            out.flush()
+
+        run(args, emit)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+# pyright: reportMissingImports=false
+"""
+Benchmark the synesthetic_schemas.runtime hot paths.
+
+  modulation_eval   ModulationEvaluator.evaluate over --modulators synthetic
+                    modulators (mixed waveforms/profiles, some clamped) and
+                    --frames timestamps per call, into a preallocated buffer
+  rules_dispatch    RuleEngine.dispatch of --events grid_cell events against the
+                    Example1 rule bundle (no cooldown)
+  controls_handle   ControlEvaluator.handle of --events mouse events (mixed axes
+                    and held combos) against the Example1 controls, plus one
+                    advance() per 16 events
+  uniforms_write    UniformLayout.write of the Example2 shader block (std140)
+                    from the slot buffer, --events writes per pass
+  asset_load        startup from JSON: read + json.loads + SynestheticAsset.model_validate
+                    + compile_asset, per docs/examples/0.7.3 SynestheticAsset example
+  plan_load         startup from the compiled blob: RuntimePlan.load (mmap) + close,
+                    per example
+
+Each timed pass is one call (load benches: one pass over the examples). Output is JSONL as in scripts/bench_validate.py: one
+row per pass, then a summary row per bench (``n`` is the number of modulators,
+so ``per_asset_us`` reads as per-modulator cost). The frame budget these are
+held against is in docs/perf/perf-baselines.md.
+
+CLI:
+  --modulators N  --frames N  --events N  --repeat N  --warmup N  --seed N
+  --only modulation_eval,rules_dispatch,controls_handle,uniforms_write,asset_load,plan_load   --out <path> (default stdout)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import pathlib
+import random
+import sys
+from collections.abc import Callable, Iterable
+from typing import Any
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+PY_SRC = ROOT / "python" / "src"
+
+for p in (str(ROOT), str(PY_SRC)):
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+from scripts.bench_validate import _time_passes  # noqa: E402
+
+BENCHES = ("modulation_eval", "rules_dispatch", "controls_handle", "uniforms_write", "asset_load", "plan_load")
+EXAMPLES_DIR = ROOT / "docs" / "examples" / "0.7.3"
+
+
+def make_modulations(n: int, seed: int = 0) -> list[dict[str, Any]]:
+    """Return n ModulationItem dicts covering every waveform, type and profile."""
+    rng = random.Random(seed)
+    items = []
+    for i in range(n):
+        item = {
+            "id": f"mod_{i}",
+            "target": f"visual.u_param_{i % 64}",
+            "type": rng.choice(("additive", "multiplicative")),
+            "waveform": rng.choice(("sine", "triangle", "square", "sawtooth")),
+            "frequency": round(rng.uniform(0.05, 8.0), 3),
+            "amplitude": round(rng.uniform(0.0, 2.0), 3),
+            "offset": round(rng.uniform(-1.0, 1.0), 3),
+            "phase": round(rng.uniform(0.0, 2 * math.pi), 3),
+            "scaleProfile": rng.choice(("linear", "exponential", "logarithmic", "sine", "cosine")),
+        }
+        if rng.random() < 0.3:
+            item["min"], item["max"] = -0.5, 0.75
+        items.append(item)
+    return items
+
+
+def run(args: argparse.Namespace, emit: Callable[[dict[str, Any]], None]) -> None:
+    only = set(args.only.split(",")) if args.only else set(BENCHES)
+    unknown = only - set(BENCHES)
+    if unknown:
+        raise SystemExit(f"unknown bench(es): {', '.join(sorted(unknown))}")
+
+    if "modulation_eval" in only:
+        import numpy as np
+        from synesthetic_schemas.modulation import ModulationItem
+        from synesthetic_schemas.runtime import ModulationTable
+        from synesthetic_schemas.runtime.modulation_eval import ModulationEvaluator
+
+        items = [ModulationItem.model_validate(d) for d in make_modulations(args.modulators, args.seed)]
+        ev = ModulationEvaluator(ModulationTable.from_items(items))
+        times = np.arange(args.frames) / 60.0
+        out = np.empty((args.frames, len(ev)))
+
+        def _eval() -> None:
+            np.add(times, 1.0 / 60.0, out=times)  # next frame(s)
+            ev.evaluate(times, out)
+
+        emit({"bench": "modulation_eval", "modulators": args.modulators, "frames": args.frames})
+        _time_passes("modulation_eval", _eval, len(ev), args.repeat, args.warmup, emit)
+
+    if "rules_dispatch" in only:
+        from synesthetic_schemas.runtime.plan import compile_asset
+        from synesthetic_schemas.runtime.rules import RuleEngine
+        from synesthetic_schemas.synesthetic_asset import SynestheticAsset
+
+        data = json.loads((EXAMPLES_DIR / "SynestheticAsset_Example1.json").read_text())
+        plan = compile_asset(SynestheticAsset.model_validate({k: v for k, v in data.items() if not k.startswith("$")}))
+        engine = RuleEngine.from_plan(plan)
+        values = plan.new_buffer()
+        rng = random.Random(args.seed)
+        events = [{"grid.pressure": rng.random(), "grid.note": "C4"} for _ in range(args.events)]
+
+        def _dispatch() -> None:
+            for signals in events:
+                engine.dispatch("grid_cell", signals, values)
+
+        _time_passes("rules_dispatch", _dispatch, len(events), args.repeat, args.warmup, emit)
+
+    if "controls_handle" in only:
+        from synesthetic_schemas.runtime.controls import ControlEvaluator
+        from synesthetic_schemas.runtime.plan import compile_asset
+        from synesthetic_schemas.synesthetic_asset import SynestheticAsset
+
+        data = json.loads((EXAMPLES_DIR / "SynestheticAsset_Example1.json").read_text())
+        asset = SynestheticAsset.model_validate({k: v for k, v in data.items() if not k.startswith("$")})
+        ctl = ControlEvaluator.from_asset(asset)
+        values = compile_asset(asset).new_buffer()
+        rng = random.Random(args.seed)
+        combos = [((), ("left",)), (("Shift",), ("left",)), (("Ctrl",), ("right",)), (("Shift",), ()), ((), ())]
+        axes = ("mouse.x", "mouse.y", "mouse.wheel")
+        mouse = [(rng.choice(axes), rng.uniform(-20, 20), *rng.choice(combos)) for _ in range(args.events)]
+
+        def _handle() -> None:
+            for j, (axis, delta, keys, buttons) in enumerate(mouse):
+                ctl.handle(axis, delta, keys, buttons, values)
+                if j & 15 == 15:
+                    ctl.advance(1.0 / 60.0, values)
+
+        _time_passes("controls_handle", _handle, len(mouse), args.repeat, args.warmup, emit)
+
+    if "uniforms_write" in only:
+        from synesthetic_schemas.runtime.plan import compile_asset
+        from synesthetic_schemas.runtime.uniforms import UniformLayout
+        from synesthetic_schemas.synesthetic_asset import SynestheticAsset
+
+        data = json.loads((EXAMPLES_DIR / "SynestheticAsset_Example2.json").read_text())
+        asset = SynestheticAsset.model_validate({k: v for k, v in data.items() if not k.startswith("$")})
+        layout = UniformLayout.from_asset(asset)
+        values = compile_asset(asset).new_buffer()
+        block = memoryview(layout.new_buffer())
+
+        def _write() -> None:
+            for j in range(args.events):
+                layout.set("u_time", j / 60.0)
+                layout.write(block, values)
+
+        emit({"bench": "uniforms_write", "uniforms": len(layout), "bytes": layout.size})
+        _time_passes("uniforms_write", _write, args.events, args.repeat, args.warmup, emit)
+
+    if only & {"asset_load", "plan_load"}:
+        import tempfile
+
+        from synesthetic_schemas.runtime.plan import RuntimePlan, compile_asset
+        from synesthetic_schemas.synesthetic_asset import SynestheticAsset
+
+        sources = sorted(EXAMPLES_DIR.glob("SynestheticAsset_Example*.json"))
+
+        def _from_json(p: pathlib.Path) -> Any:
+            data = json.loads(p.read_bytes())
+            doc = {k: v for k, v in data.items() if not k.startswith("$")}
+            return compile_asset(SynestheticAsset.model_validate(doc))
+
+        with tempfile.TemporaryDirectory(prefix="syn-plan-") as tmp:
+            plans = []
+            for p in sources:
+                dest = pathlib.Path(tmp) / f"{p.stem}.plan"
+                _from_json(p).save(dest)
+                plans.append(dest)
+
+            def _asset_load() -> None:
+                for p in sources:
+                    _from_json(p)
+
+            def _plan_load() -> None:
+                for p in plans:
+                    RuntimePlan.load(p).close()
+
+            if "asset_load" in only:
+                _time_passes("asset_load", _asset_load, len(sources), args.repeat, args.warmup, emit)
+            if "plan_load" in only:
+                _time_passes("plan_load", _plan_load, len(plans), args.repeat, args.warmup, emit)
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark synesthetic_schemas.runtime hot paths")
+    ap.add_argument("--modulators", type=int, default=1000, help="Modulators evaluated per call")
+    ap.add_argument("--frames", type=int, default=1, help="Timestamps evaluated per call")
+    ap.add_argument("--events", type=int, default=10_000, help="Events per rules_dispatch/controls_handle pass (writes per uniforms_write pass)")
+    ap.add_argument("--repeat", type=int, default=50, help="Timed passes per bench")
+    ap.add_argument("--warmup", type=int, default=5, help="Untimed passes per bench")
+    ap.add_argument("--seed", type=int, default=0, help="Synthetic data RNG seed")
+    ap.add_argument("--only", help=f"Comma-separated subset of: {','.join(BENCHES)}")
+    ap.add_argument("--out", help="Write JSONL here instead of stdout")
+    args = ap.parse_args(list(argv) if argv is not None else None)
+    if args.modulators <= 0 or args.frames <= 0 or args.repeat <= 0:
+        ap.error("--modulators, --frames and --repeat must be positive")
+
+    out = open(args.out, "w", encoding="utf-8") if args.out else sys.stdout
+    try:
+        def emit(row: dict[str, Any]) -> None:
+            out.write(json.dumps(row, separators=(",", ":")) + "\n")
+            out.flush()
+
+        run(args, emit)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
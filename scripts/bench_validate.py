@@ -0,0 +1,241 @@
+#!/usr/bin/env python
+# pyright: reportMissingImports=false
+"""
+Benchmark the validation paths over synthetic SynestheticAsset corpora.
+
+Corpora are grown from the docs/examples/0.7.3 SynestheticAsset seeds; shape knobs
+control how many modulations, rules and control parameters each asset carries and
+how long its fragment_shader is. Three paths are timed separately:
+
+  validate_file   scripts/validate_examples.validate_file (file read + JSON Schema
+                  + Pydantic + round-trip, per --level)
+  examples_qc     scripts/examples_qc._validate_instance (JSON Schema only)
+  pydantic        SynestheticAsset.model_validate on pre-parsed dicts
+
+Output is JSONL in the style of docs/perf/perf_baseline_*.jsonl: one row per pass
+over the corpus ({"ts_ms","bench","iter","dt_ms","n"}), then one summary row per
+bench with avg/p50/p90 and the per-asset cost.
+
+CLI:
+  --assets N  --modulations N  --rules N  --controls N  --shader-bytes N
+  --repeat N  --warmup N  --seed N  --level schema|model|roundtrip
+  --only validate_file,examples_qc,pydantic   --out <path> (default stdout)
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import os
+import pathlib
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+SEEDS_DIR = ROOT / "docs" / "examples" / "0.7.3"
+PY_SRC = ROOT / "python" / "src"
+
+for p in (str(ROOT), str(PY_SRC)):
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+BENCHES = ("validate_file", "examples_qc", "pydantic")
+
+
+# ---------- corpus
+
+def _load_seeds() -> list[dict[str, Any]]:
+    seeds = [json.loads(p.read_text()) for p in sorted(SEEDS_DIR.glob("SynestheticAsset_Example*.json"))]
+    if not seeds:
+        raise FileNotFoundError(f"no SynestheticAsset seeds under {SEEDS_DIR}")
+    return seeds
+
+
+def _cycle(items: list[Any], n: int, relabel: Callable[[Any, int], Any]) -> list[Any]:
+    if not items or n <= 0:
+        return []
+    return [relabel(copy.deepcopy(items[i % len(items)]), i) for i in range(n)]
+
+
+def _with_id(item: dict[str, Any], i: int) -> dict[str, Any]:
+    if "id" in item:
+        item["id"] = f"{item['id']}_{i}"
+    return item
+
+
+def _pad_shader(src: str, size: int) -> str:
+    if len(src) >= size:
+        return src
+    line = "// padding: synthetic benchmark payload ......................................\n"
+    reps = -(-(size - len(src)) // len(line))
+    return src + "\n" + (line * reps)[: size - len(src) - 1]
+
+
+def make_corpus(
+    n: int,
+    modulations: int,
+    rules: int,
+    controls: int,
+    shader_bytes: int,
+    seed: int = 0,
+) -> list[dict[str, Any]]:
+    """Return n SynestheticAsset documents (with $schema) shaped by the knobs."""
+    rng = random.Random(seed)
+    seeds = _load_seeds()
+    pool_mods = [m for s in seeds for m in s.get("modulations") or []]
+    pool_rules = [r for s in seeds for r in (s.get("rule_bundle") or {}).get("rules") or []]
+    pool_ctrls = [c for s in seeds for c in (s.get("control") or {}).get("control_parameters") or []]
+    bundle_seed = next((s["rule_bundle"] for s in seeds if s.get("rule_bundle")), None)
+
+    corpus: list[dict[str, Any]] = []
+    for i in range(n):
+        doc = copy.deepcopy(seeds[rng.randrange(len(seeds))])
+        doc["name"] = f"{doc.get('name', 'asset')} #{i}"
+        if "modulations" in doc or modulations:
+            doc["modulations"] = _cycle(pool_mods, modulations, _with_id)
+        if bundle_seed is not None and rules:
+            rb = copy.deepcopy(doc.get("rule_bundle") or bundle_seed)
+            rb["rules"] = _cycle(pool_rules, rules, _with_id)
+            doc["rule_bundle"] = rb
+        elif not rules:
+            doc.pop("rule_bundle", None)
+        if isinstance(doc.get("control"), dict):
+            doc["control"]["control_parameters"] = _cycle(pool_ctrls, controls, lambda c, _: c)
+        if isinstance(doc.get("shader"), dict) and shader_bytes:
+            doc["shader"]["fragment_shader"] = _pad_shader(doc["shader"]["fragment_shader"], shader_bytes)
+        corpus.append(doc)
+    return corpus
+
+
+# ---------- timing
+
+def _time_passes(
+    bench: str, fn: Callable[[], None], n: int, repeat: int, warmup: int, emit: Callable[[dict[str, Any]], None]
+) -> None:
+    for _ in range(warmup):
+        fn()
+    t_start = time.perf_counter()
+    dts: list[float] = []
+    for i in range(1, repeat + 1):
+        t0 = time.perf_counter()
+        fn()
+        dt = (time.perf_counter() - t0) * 1000.0
+        dts.append(dt)
+        emit({"ts_ms": round((t0 - t_start) * 1000.0), "bench": bench, "iter": i, "dt_ms": round(dt, 3), "n": n})
+    q = statistics.quantiles(dts, n=10, method="inclusive") if len(dts) > 1 else [dts[0]] * 9
+    avg = statistics.fmean(dts)
+    emit({
+        "bench": bench,
+        "summary": True,
+        "n": n,
+        "repeat": repeat,
+        "avg_dt_ms": round(avg, 3),
+        "p50_ms": round(statistics.median(dts), 3),
+        "p90_ms": round(q[8], 3),
+        "per_asset_us": round(avg * 1000.0 / n, 1) if n else 0.0,
+    })
+
+
+def run(args: argparse.Namespace, emit: Callable[[dict[str, Any]], None]) -> None:
+    corpus = make_corpus(args.assets, args.modulations, args.rules, args.controls, args.shader_bytes, args.seed)
+    only = set(args.only.split(",")) if args.only else set(BENCHES)
+    unknown = only - set(BENCHES)
+    if unknown:
+        raise SystemExit(f"unknown bench(es): {', '.join(sorted(unknown))}")
+
+    emit({
+        "bench": "corpus",
+        "n": len(corpus),
+        "modulations": args.modulations,
+        "rules": args.rules,
+        "controls": args.controls,
+        "shader_bytes": args.shader_bytes,
+        "bytes": sum(len(json.dumps(d)) for d in corpus),
+    })
+    clean = [{k: v for k, v in d.items() if not k.startswith("$")} for d in corpus]
+
+    if "validate_file" in only:
+        from scripts import validate_examples as ve
+
+        with tempfile.TemporaryDirectory(prefix="syn-bench-") as tmp:
+            paths = []
+            for i, d in enumerate(corpus):
+                p = pathlib.Path(tmp) / f"SynestheticAsset_Bench{i:06d}.json"
+                p.write_text(json.dumps(d))
+                paths.append(p)
+
+            def _validate_files() -> None:
+                for p in paths:
+                    errs = ve.validate_file(p, strict=True, level=args.level)
+                    if errs:
+                        raise RuntimeError(errs[0])
+
+            _time_passes("validate_file", _validate_files, len(paths), args.repeat, args.warmup, emit)
+
+    if "examples_qc" in only:
+        from scripts import examples_qc as qc
+
+        # examples_qc resolves refs relative to the repo root
+        cwd = os.getcwd()
+        os.chdir(ROOT)
+        try:
+            schema, registry = qc._load_schema(pathlib.Path(qc.FALLBACK_CANONICAL))
+
+            def _qc() -> None:
+                for d in clean:
+                    if qc._validate_instance(d, schema, registry):
+                        raise RuntimeError("examples_qc reported errors on a generated asset")
+
+            _time_passes("examples_qc", _qc, len(clean), args.repeat, args.warmup, emit)
+        finally:
+            os.chdir(cwd)
+
+    if "pydantic" in only:
+        from synesthetic_schemas.synesthetic_asset import SynestheticAsset
+
+        def _pyd() -> None:
+            for d in clean:
+                SynestheticAsset.model_validate(d)
+
+        _time_passes("pydantic", _pyd, len(clean), args.repeat, args.warmup, emit)
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark validation paths over synthetic asset corpora")
+    ap.add_argument("--assets", type=int, default=200, help="Assets in the corpus")
+    ap.add_argument("--modulations", type=int, default=8, help="Modulations per asset")
+    ap.add_argument("--rules", type=int, default=4, help="Rules per asset rule_bundle (0 drops the bundle)")
+    ap.add_argument("--controls", type=int, default=8, help="Control parameters per asset")
+    ap.add_argument("--shader-bytes", type=int, default=4096, help="Minimum fragment_shader length")
+    ap.add_argument("--repeat", type=int, default=5, help="Timed passes per bench")
+    ap.add_argument("--warmup", type=int, default=1, help="Untimed passes per bench")
+    ap.add_argument("--seed", type=int, default=0, help="Seed selection RNG")
+    ap.add_argument("--level", choices=("schema", "model", "roundtrip"), default="roundtrip",
+                    help="validate_file level")
+    ap.add_argument("--only", help=f"Comma-separated subset of: {','.join(BENCHES)}")
+    ap.add_argument("--out", help="Write JSONL here instead of stdout")
+    args = ap.parse_args(list(argv) if argv is not None else None)
+    if args.assets <= 0 or args.repeat <= 0:
+        ap.error("--assets and --repeat must be positive")
+
+    out = open(args.out, "w", encoding="utf-8") if args.out else sys.stdout
+    try:
+        def emit(row: dict[str, Any]) -> None:
+            out.write(json.dumps(row, separators=(",", ":")) + "\n")
+            out.flush()
+
+        run(args, emit)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
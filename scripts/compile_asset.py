@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# pyright: reportMissingImports=false
+"""
+Compile SynestheticAsset JSON into binary runtime plans (synesthetic_schemas.runtime.plan).
+
+Each input is validated with the generated Pydantic model ($schema/$schemaRef
+envelope keys are dropped), compiled, and written next to it as <stem>.plan (or
+into --out-dir). Players then start with RuntimePlan.load(path): one mmap, no
+JSON parse or model build.
+
+CLI:
+  compile_asset.py <asset.json>... [--out-dir DIR] [--strict]
+  --strict   Unresolved parameter paths are errors
+
+Exit codes: 0 OK, 1 validation/compile errors.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import sys
+from collections.abc import Iterable
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+PY_SRC = ROOT / "python" / "src"
+if str(PY_SRC) not in sys.path:
+    sys.path.insert(0, str(PY_SRC))
+
+
+def compile_file(src: pathlib.Path, out_dir: pathlib.Path | None, strict: bool) -> pathlib.Path:
+    from synesthetic_schemas.runtime.plan import compile_asset
+    from synesthetic_schemas.synesthetic_asset import SynestheticAsset
+
+    data = json.loads(src.read_text(encoding="utf-8"))
+    doc = {k: v for k, v in data.items() if not k.startswith("$")}
+    plan = compile_asset(SynestheticAsset.model_validate(doc), strict=strict)
+    dest = (out_dir or src.parent) / f"{src.stem}.plan"
+    plan.save(dest)
+    return dest
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Compile SynestheticAsset JSON into binary runtime plans")
+    ap.add_argument("files", nargs="+", help="SynestheticAsset JSON files")
+    ap.add_argument("--out-dir", help="Directory for the .plan files (default: next to each input)")
+    ap.add_argument("--strict", action="store_true", help="Fail on unresolved parameter paths")
+    args = ap.parse_args(list(argv) if argv is not None else None)
+
+    out_dir = pathlib.Path(args.out_dir) if args.out_dir else None
+    if out_dir is not None:
+        out_dir.mkdir(parents=True, exist_ok=True)
+    failed = False
+    for name in args.files:
+        src = pathlib.Path(name)
+        try:
+            dest = compile_file(src, out_dir, args.strict)
+        except Exception as e:  # report and continue with the next file
+            print(f"❌ {src}: {e}", file=sys.stderr)
+            failed = True
+            continue
+        print(f"compiled: {src} -> {dest}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
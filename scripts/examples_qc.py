@@ -18,6 +18,7 @@ By default writes to meta/output and prints nothing. Exit code conveys status.
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import os
 import sys
@@ -31,8 +32,16 @@ import jsonschema
 # --- NEW IMPORTS START ---
 from referencing import Registry, Resource
 from referencing.jsonschema import DRAFT202012
+
+try:
+    from scripts.lib.schema_graph import SchemaGraph
+except ModuleNotFoundError:  # run as a script: scripts/ is sys.path[0]
+    from lib.schema_graph import SchemaGraph
 # --- NEW IMPORTS END ---
 
+_ROOT = Path(__file__).resolve().parents[1]
+_SCHEMA_DIR = _ROOT / "jsonschema"
+
 
 # --- Constants / Config ---
 
@@ -151,21 +160,30 @@ def _collect_field_matrix(instances: List[Tuple[str, Any]]) -> Dict[str, Any]:
     return out
 
 
+@functools.cache
+def _schema_graph() -> SchemaGraph:
+    # Anchored at the repo, not the CWD: the graph also writes the shared .cache/schema_graph.json
+    return SchemaGraph(_SCHEMA_DIR)
+
+
 # --- MODIFIED FUNCTION START ---
 def _load_schema(canonical_path: Path) -> Tuple[Dict[str, Any], Registry]:
     # Load schema and provide a registry that maps https://schemas.synesthetic.dev/... to local files
     schema = _read_json(canonical_path)
 
     # The new library uses a "retriever" function for custom URI handling.
+    # Shared schema graph: $id -> local file, documents parsed once
+    graph = _schema_graph()
+
     def retrieve_from_filesystem(uri: str) -> Resource:
         # Maps URIs like https://schemas.synesthetic.dev/0.7.3/tone.schema.json
         # to a local file at jsonschema/tone.schema.json
         if uri.startswith("https://schemas.synesthetic.dev/"):
-            name = uri.split("/")[-1]
-            local_path = Path("jsonschema") / name
-            if not local_path.is_file():
+            name = graph.file_for(uri)
+            local_path = _SCHEMA_DIR / (name or uri.split("/")[-1])
+            if name not in graph.entries or graph.error(name):
                 raise FileNotFoundError(f"Missing local schema for {uri} -> {local_path}")
-            contents = _read_json(local_path)
+            contents = graph.document(name)
             return Resource.from_contents(contents, default_specification=DRAFT202012)
         # This is an important fallback for any other URIs.
         # It lets the library handle standard metaschemas (like draft2020-12) correctly.
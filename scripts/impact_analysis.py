@@ -0,0 +1,406 @@
+#!/usr/bin/env python
+"""
+Schema-change impact analysis: which instances need re-validation.
+
+Compares two schema trees and selects only the instances that hold data governed
+by what changed:
+
+  1. Units: each $defs entry of a schema file, plus the file's root schema
+     (everything but $defs). A unit changed when its canonical JSON differs.
+     Headers ($id, $schema, x-schema-version) are ignored, and absolute $refs
+     compare by target file, so a version bump alone changes nothing.
+  2. Pointers: starting from every root schema an instance names, the $ref
+     structure is walked through properties, items, additionalProperties and
+     allOf/anyOf/oneOf. This maps each unit to the instance pointer patterns it
+     governs (e.g. ComboType -> /control/control_parameters/*/mappings/*/combo;
+     '*' stands for an array index or an additionalProperties key). Both trees
+     are walked, so moved or removed definitions are covered.
+  3. Selection: a per-instance field-presence index (every pointer holding data,
+     array indices collapsed to '*'; see examples_qc._collect_field_matrix) is
+     inverted to pointer -> instances. An exact pattern costs one lookup plus the
+     instances it returns. Wildcard patterns are indexed by segment count and
+     literal prefix (the segments before the first '*'), so each present pointer
+     is only matched against the patterns that share both. The index lives in
+     .cache/impact/presence.json and is rebuilt only for instances whose bytes
+     changed.
+
+Instances pick their root schema with "$schema" or "$schemaRef". Instances
+without either are treated as SynestheticAsset. Instances that cannot be read or
+parsed are always selected, and listed under "unparsed" in the JSON report.
+
+CLI:
+  impact_analysis.py (--base REV | --old DIR) [--new DIR] [--instances PATH ...] [--json] [--no-cache]
+  --base REV       Old schemas are jsonschema/ at git revision REV
+  --old DIR        Old schemas from a directory
+  --new DIR        New schemas (default: jsonschema/)
+  --instances P    Instance files or directories, searched recursively for *.json
+                   (default: docs/examples/)
+  --json           Print a JSON report (changed units, patterns, selection) instead
+                   of one affected path per line
+
+Exit codes: 0 OK, 2 setup error.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import pathlib
+import subprocess
+import sys
+import tempfile
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.lib.schema_graph import SchemaGraph, resolve_pointer  # noqa: E402
+
+SCHEMA_DIR = ROOT / "jsonschema"
+EXAMPLES_DIR = ROOT / "docs" / "examples"
+PRESENCE_FILE = ROOT / ".cache" / "impact" / "presence.json"
+DEFAULT_ROOT = "synesthetic-asset.schema.json"
+HEADER_KEYS = {"$id", "$schema", "x-schema-version"}
+MAX_DEPTH = 64
+
+Unit = tuple[str, str | None]  # (schema file, $defs name or None for the root schema)
+
+
+def unit_label(unit: Unit) -> str:
+    name, d = unit
+    return f"{name}#/$defs/{d}" if d else name
+
+
+# ---------------------------- changed units ----------------------------
+
+def _canonical(node: Any, graph: SchemaGraph) -> Any:
+    if isinstance(node, dict):
+        out = {}
+        for k, v in node.items():
+            if k == "$ref" and isinstance(v, str) and v.startswith(("http://", "https://")):
+                base, _, frag = v.partition("#")
+                v = f"{graph.file_for(base)}#{frag}"
+            out[k] = _canonical(v, graph)
+        return out
+    if isinstance(node, list):
+        return [_canonical(v, graph) for v in node]
+    return node
+
+
+def unit_digests(graph: SchemaGraph) -> dict[Unit, str]:
+    out: dict[Unit, str] = {}
+    for name in graph.files:
+        if graph.error(name):
+            continue
+        doc = graph.document(name)
+        if not isinstance(doc, dict):
+            continue
+        root = {k: v for k, v in doc.items() if k != "$defs" and k not in HEADER_KEYS}
+        parts: list[tuple[Unit, Any]] = [((name, None), root)]
+        parts += [((name, d), body) for d, body in (doc.get("$defs") or {}).items()]
+        for unit, body in parts:
+            text = json.dumps(_canonical(body, graph), sort_keys=True, separators=(",", ":"))
+            out[unit] = hashlib.sha256(text.encode()).hexdigest()
+    return out
+
+
+def changed_units(old: SchemaGraph, new: SchemaGraph) -> list[Unit]:
+    a, b = unit_digests(old), unit_digests(new)
+    return sorted((u for u in set(a) | set(b) if a.get(u) != b.get(u)), key=lambda u: (u[0], u[1] or ""))
+
+
+# ---------------------------- unit -> pointers ----------------------------
+
+def _unit_of(fragment: str) -> str | None:
+    parts = fragment.split("/")
+    return parts[2].replace("~1", "/").replace("~0", "~") if len(parts) > 2 and parts[1] == "$defs" else None
+
+
+def governed_pointers(graph: SchemaGraph, root: str) -> dict[Unit, set[str]]:
+    """unit -> instance pointer patterns it governs, for instances of schema file root."""
+    out: dict[Unit, set[str]] = defaultdict(set)
+    if root not in graph.entries or graph.error(root):
+        return out
+
+    def visit(name: str, node: Any, ptr: str, active: tuple[Unit, ...], depth: int) -> None:
+        if not isinstance(node, dict) or depth > MAX_DEPTH:
+            return
+        ref = node.get("$ref")
+        if isinstance(ref, str):
+            base, _, frag = ref.partition("#")
+            if not base:
+                target = name
+            elif base.startswith(("http://", "https://")):
+                target = graph.file_for(base)
+            else:
+                target = pathlib.PurePosixPath(base).name
+            if target in graph.entries and not graph.error(target):
+                found, sub = resolve_pointer(graph.document(target), frag)
+                unit = (target, _unit_of(frag))
+                if found and unit not in active:  # recursive schemas stop at the cycle
+                    out[unit].add(ptr)
+                    visit(target, sub, ptr, active + (unit,), depth + 1)
+        for key, sub in (node.get("properties") or {}).items():
+            visit(name, sub, f"{ptr}/{key.replace('~', '~0').replace('/', '~1')}", active, depth + 1)
+        for key in ("additionalProperties", "items", "contains", "unevaluatedProperties", "unevaluatedItems"):
+            visit(name, node.get(key), f"{ptr}/*", active, depth + 1)
+        for sub in (node.get("patternProperties") or {}).values():
+            visit(name, sub, f"{ptr}/*", active, depth + 1)
+        for sub in node.get("prefixItems") or ():
+            visit(name, sub, f"{ptr}/*", active, depth + 1)
+        for key in ("allOf", "anyOf", "oneOf"):
+            for sub in node.get(key) or ():
+                visit(name, sub, ptr, active, depth + 1)
+        for key in ("not", "if", "then", "else"):
+            visit(name, node.get(key), ptr, active, depth + 1)
+
+    unit = (root, None)
+    out[unit].add("")
+    visit(root, graph.document(root), "", (unit,), 0)
+    return out
+
+
+# ---------------------------- presence index ----------------------------
+
+def field_presence(value: Any, ptr: str = "") -> Iterator[str]:
+    """Every pointer holding data in value, array indices as '*'."""
+    yield ptr
+    if isinstance(value, dict):
+        for k, v in value.items():
+            yield from field_presence(v, f"{ptr}/{k.replace('~', '~0').replace('/', '~1')}")
+    elif isinstance(value, list):
+        for v in value:
+            yield from field_presence(v, f"{ptr}/*")
+
+
+def _root_for(doc: Any) -> str:
+    if isinstance(doc, dict):
+        for key in ("$schema", "$schemaRef"):
+            ref = doc.get(key)
+            if isinstance(ref, str) and ref.endswith(".schema.json"):
+                return ref.rsplit("/", 1)[-1]
+    return DEFAULT_ROOT
+
+
+def _gather(paths: Iterable[pathlib.Path]) -> list[pathlib.Path]:
+    out: set[pathlib.Path] = set()
+    for p in paths:
+        if p.is_dir():
+            out.update(q for q in p.rglob("*.json") if q.is_file())
+        elif p.is_file():
+            out.add(p)
+    return sorted(out)
+
+
+class PresenceIndex:
+    """Instance -> (root schema, present pointers), persisted and rebuilt per changed file."""
+
+    def __init__(self, cache_file: pathlib.Path | None = PRESENCE_FILE):
+        self.cache_file = cache_file
+        self.entries: dict[str, dict[str, Any]] = {}
+        if cache_file is not None:
+            try:
+                self.entries = json.loads(cache_file.read_text())
+            except Exception:
+                self.entries = {}
+        self._dirty = False
+
+    def add(self, p: pathlib.Path) -> dict[str, Any]:
+        """Index entry for p; an instance that does not read or parse gets an "error" entry."""
+        key = str(p.resolve())
+        try:
+            st = p.stat()
+        except OSError as e:
+            return {"error": f"cannot read: {e}"}
+        sig = [st.st_mtime_ns, st.st_size]
+        hit = self.entries.get(key)
+        if hit is not None and hit["sig"] == sig:
+            return hit
+        try:
+            raw = p.read_bytes()
+        except OSError as e:
+            return {"error": f"cannot read: {e}"}
+        digest = hashlib.sha256(raw).hexdigest()
+        if hit is not None and hit["sha256"] == digest:
+            hit["sig"] = sig
+        else:
+            try:
+                doc = json.loads(raw)
+            except ValueError as e:
+                hit = {"sig": sig, "sha256": digest, "error": f"invalid JSON: {e}"}
+            else:
+                body = {k: v for k, v in doc.items() if not k.startswith("$")} if isinstance(doc, dict) else doc
+                hit = {
+                    "sig": sig, "sha256": digest, "root": _root_for(doc),
+                    "paths": sorted(set(field_presence(body))),
+                }
+            self.entries[key] = hit
+        self._dirty = True
+        return hit
+
+    def save(self) -> None:
+        if self.cache_file is None or not self._dirty:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(self.entries, sort_keys=True, separators=(",", ":")))
+            os.replace(tmp, self.cache_file)
+        except OSError:
+            pass  # cache is best-effort
+
+
+# segment count -> literal prefix length -> literal prefix -> wildcard patterns (as segments)
+WildcardIndex = dict[int, dict[int, dict[tuple[str, ...], list[list[str]]]]]
+
+
+def _wildcard_index(patterns: Iterable[str]) -> WildcardIndex:
+    out: WildcardIndex = {}
+    for pat in patterns:
+        segs = pat.split("/")
+        if "*" in segs:
+            k = segs.index("*")
+            out.setdefault(len(segs), {}).setdefault(k, {}).setdefault(tuple(segs[:k]), []).append(segs)
+    return out
+
+
+def _matches_any(segs: list[str], wildcards: WildcardIndex) -> bool:
+    for k, by_prefix in wildcards.get(len(segs), {}).items():
+        for pat in by_prefix.get(tuple(segs[:k]), ()):
+            if all(x == "*" or x == y for x, y in zip(pat[k:], segs[k:])):
+                return True
+    return False
+
+
+def select(
+    instances: list[pathlib.Path],
+    patterns: dict[str, set[str]],
+    index: PresenceIndex,
+) -> list[pathlib.Path]:
+    """Instances holding data at any pattern of their root schema (patterns: root -> set).
+
+    Instances whose index entry is an error (unreadable or not JSON) are always selected.
+    """
+    inverted: dict[str, dict[str, list[int]]] = defaultdict(lambda: defaultdict(list))
+    hits: set[int] = set()
+    for i, p in enumerate(instances):
+        entry = index.add(p)
+        if "error" in entry:
+            hits.add(i)
+            continue
+        for path in entry["paths"]:
+            inverted[entry["root"]][path].append(i)
+    for root, pats in patterns.items():
+        by_path = inverted.get(root)
+        if not by_path:
+            continue
+        for pat in pats:
+            hits.update(by_path.get(pat, ()))
+        wildcards = _wildcard_index(pats)
+        if wildcards:
+            for path, ids in by_path.items():
+                if _matches_any(path.split("/"), wildcards):
+                    hits.update(ids)
+    return [instances[i] for i in sorted(hits)]
+
+
+# ---------------------------- CLI ----------------------------
+
+def analyze(
+    old: SchemaGraph,
+    new: SchemaGraph,
+    instances: list[pathlib.Path],
+    index: PresenceIndex,
+) -> dict[str, Any]:
+    changed = changed_units(old, new)
+    entries = [index.add(p) for p in instances]
+    roots = sorted({e["root"] for e in entries if "error" not in e})
+    patterns: dict[str, set[str]] = {}
+    for root in roots:
+        governed: dict[Unit, set[str]] = defaultdict(set)
+        for graph in (old, new):
+            for unit, ptrs in governed_pointers(graph, root).items():
+                governed[unit] |= ptrs
+        patterns[root] = {ptr for unit in changed for ptr in governed.get(unit, ())}
+    selected = select(instances, patterns, index)
+    index.save()
+    return {
+        "changed": [unit_label(u) for u in changed],
+        "patterns": {root: sorted(p) for root, p in patterns.items() if p},
+        "instances": len(instances),
+        "selected": [str(p) for p in selected],
+        "unparsed": [f"{p}: {e['error']}" for p, e in zip(instances, entries) if "error" in e],
+    }
+
+
+def _git_tree(rev: str, dest: pathlib.Path) -> None:
+    names = subprocess.run(
+        ["git", "ls-tree", "--name-only", f"{rev}:jsonschema"],
+        cwd=ROOT, check=True, capture_output=True, text=True,
+    ).stdout.split()
+    for name in names:
+        if name.endswith(".schema.json"):
+            blob = subprocess.run(
+                ["git", "show", f"{rev}:jsonschema/{name}"], cwd=ROOT, check=True, capture_output=True
+            ).stdout
+            (dest / name).write_bytes(blob)
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Select instances affected by a schema change")
+    src = ap.add_mutually_exclusive_group(required=True)
+    src.add_argument("--base", help="Git revision holding the old jsonschema/")
+    src.add_argument("--old", help="Directory holding the old schemas")
+    ap.add_argument("--new", default=str(SCHEMA_DIR), help="Directory holding the new schemas")
+    ap.add_argument("--instances", nargs="+", default=[str(EXAMPLES_DIR)], help="Instance files/directories")
+    ap.add_argument("--json", action="store_true", help="Print a JSON report")
+    ap.add_argument("--no-cache", action="store_true", help="Do not read or write the presence index")
+    args = ap.parse_args(list(argv) if argv is not None else None)
+
+    new_dir = pathlib.Path(args.new)
+    if not new_dir.is_dir():
+        print(f"missing schema dir: {new_dir}", file=sys.stderr)
+        return 2
+    instances = _gather(pathlib.Path(p) for p in args.instances)
+    index = PresenceIndex(None if args.no_cache else PRESENCE_FILE)
+
+    with tempfile.TemporaryDirectory(prefix="syn-impact-") as tmp:
+        if args.base:
+            old_dir = pathlib.Path(tmp)
+            try:
+                _git_tree(args.base, old_dir)
+            except subprocess.CalledProcessError as e:
+                print(f"cannot read jsonschema/ at {args.base}: {e.stderr.strip()}", file=sys.stderr)
+                return 2
+        else:
+            old_dir = pathlib.Path(args.old)
+            if not old_dir.is_dir():
+                print(f"missing schema dir: {old_dir}", file=sys.stderr)
+                return 2
+        old = SchemaGraph(old_dir, None)
+        # the working tree's graph is the persisted one
+        new = SchemaGraph(new_dir) if new_dir.resolve() == SCHEMA_DIR else SchemaGraph(new_dir, None)
+        report = analyze(old, new, instances, index)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for p in report["selected"]:
+            print(p)
+        for line in report["unparsed"]:
+            print(f"unparsed (selected): {line}", file=sys.stderr)
+    print(
+        f"{len(report['changed'])} changed unit(s); "
+        f"{len(report['selected'])}/{report['instances']} instance(s) affected",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,298 @@
+"""
+Persisted $id/$ref graph of jsonschema/*.schema.json, shared by the schema tools.
+
+schema_lint, normalize_schemas, validate_examples, examples_qc and ssot_audit
+used to re-read and re-walk every schema to find $ids and $refs. SchemaGraph
+walks each file once and persists the result in .cache/schema_graph.json:
+
+    graph = SchemaGraph()                     # loads/refreshes .cache/schema_graph.json
+    graph.ids                                 # $id -> file name
+    graph.refs("rule-bundle.schema.json")     # [Ref(source, at, ref, kind, file, fragment)]
+    graph.dependencies(name)                  # files its $refs point at
+    graph.dependents(name, transitive=True)   # files that (indirectly) $ref it
+    graph.def_usage[("control.schema.json", "ComboType")]   # $refs to a $def
+    graph.document(name)                      # parsed JSON, loaded on first use
+    graph.store()                             # {$id (or name): document}
+
+On load, files whose (mtime, size) are unchanged are taken from the cache as-is.
+Other files are re-hashed, and only files whose sha256 changed are parsed and
+walked again. Derived views (edges, reverse dependencies, $defs usage) are
+rebuilt from the per-file entries, which is cheap.
+
+Ref kinds: "internal" ("#/..."), "absolute" (http(s) URL; resolved by $id, then by
+file name), "relative" ("./x.schema.json"), "other".
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pathlib
+import sys
+from collections import Counter
+from collections.abc import Iterator
+from typing import Any, NamedTuple
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+SCHEMA_DIR = ROOT / "jsonschema"
+GRAPH_FILE = ROOT / ".cache" / "schema_graph.json"
+FORMAT_VERSION = 1
+
+
+class Ref(NamedTuple):
+    source: str  # file holding the $ref
+    at: str  # JSON pointer of the object holding the $ref
+    ref: str
+    kind: str  # internal | absolute | relative | other
+    file: str | None  # target file name (may not exist; see SchemaGraph.missing)
+    fragment: str  # JSON pointer into the target ('' for the whole document)
+
+
+def _pointer_token(key: str) -> str:
+    return key.replace("~", "~0").replace("/", "~1")
+
+
+def _walk_refs(node: Any, at: str = "") -> Iterator[tuple[str, str]]:
+    if isinstance(node, dict):
+        ref = node.get("$ref")
+        if isinstance(ref, str):
+            yield at, ref
+        for k, v in node.items():
+            yield from _walk_refs(v, f"{at}/{_pointer_token(k)}")
+    elif isinstance(node, list):
+        for i, v in enumerate(node):
+            yield from _walk_refs(v, f"{at}/{i}")
+
+
+def resolve_pointer(doc: Any, fragment: str) -> tuple[bool, Any]:
+    """(found, node) for a JSON pointer such as "/$defs/Name" ("" is the document)."""
+    cur = doc
+    if not fragment:
+        return True, cur
+    for seg in fragment[1:].split("/"):
+        seg = seg.replace("~1", "/").replace("~0", "~")
+        if isinstance(cur, dict) and seg in cur:
+            cur = cur[seg]
+        elif isinstance(cur, list) and seg.isdigit() and int(seg) < len(cur):
+            cur = cur[int(seg)]
+        else:
+            return False, None
+    return True, cur
+
+
+def _entry(raw: bytes, sig: list[int], digest: str) -> dict[str, Any]:
+    """Per-file cache entry: everything the tools need without re-parsing."""
+    try:
+        doc = json.loads(raw)
+    except ValueError as e:
+        return {"sig": sig, "sha256": digest, "id": None, "refs": [], "defs": [], "broken": [], "error": str(e)}
+    refs = [[at, ref] for at, ref in _walk_refs(doc)]
+    broken = sorted({ref for _, ref in refs if ref.startswith("#/") and not resolve_pointer(doc, ref[1:])[0]})
+    defs = doc.get("$defs") if isinstance(doc, dict) else None
+    sid = doc.get("$id") if isinstance(doc, dict) else None
+    return {
+        "sig": sig,
+        "sha256": digest,
+        "id": sid if isinstance(sid, str) else None,
+        "refs": refs,
+        "defs": sorted(defs) if isinstance(defs, dict) else [],
+        "broken": broken,
+        "error": None,
+    }
+
+
+class SchemaGraph:
+    """Nodes, $ids and $ref edges of one schema directory; see the module docstring."""
+
+    def __init__(
+        self,
+        schema_dir: pathlib.Path = SCHEMA_DIR,
+        cache_file: pathlib.Path | None = GRAPH_FILE,
+    ):
+        """Graph of schema_dir, re-walking only changed files; cache_file=None disables persistence."""
+        self.schema_dir = schema_dir
+        self.cache_file = cache_file
+        self.entries: dict[str, dict[str, Any]] = {}
+        if cache_file is not None:
+            try:
+                data = json.loads(cache_file.read_text())
+                if data.get("version") == FORMAT_VERSION and data.get("schema_dir") == str(schema_dir.resolve()):
+                    self.entries = data["files"]
+            except Exception:
+                pass
+        self._docs: dict[str, Any] = {}
+        self._derived = False
+        self.refresh()
+
+    # -- build / persist
+
+    def refresh(self) -> SchemaGraph:
+        """Pick up added, removed and edited files; persists the cache if anything changed."""
+        entries: dict[str, dict[str, Any]] = {}
+        changed = False
+        for p in sorted(self.schema_dir.glob("*.schema.json")):
+            st = p.stat()
+            sig = [st.st_mtime_ns, st.st_size]
+            old = self.entries.get(p.name)
+            if old is not None and old["sig"] == sig:
+                entries[p.name] = old
+                continue
+            raw = p.read_bytes()
+            digest = hashlib.sha256(raw).hexdigest()
+            if old is not None and old["sha256"] == digest:
+                entries[p.name] = dict(old, sig=sig)  # touched, not edited
+            else:
+                entries[p.name] = _entry(raw, sig, digest)
+                self._docs.pop(p.name, None)
+            changed = True
+        if set(entries) != set(self.entries):
+            changed = True
+            for name in set(self._docs) - set(entries):
+                del self._docs[name]
+        self.entries = entries
+        if changed or not self._derived:
+            self._derive()
+        if changed:
+            self.save()
+        return self
+
+    def save(self) -> None:
+        if self.cache_file is None:
+            return
+        data = {
+            "version": FORMAT_VERSION,
+            "schema_dir": str(self.schema_dir.resolve()),
+            "files": self.entries,
+        }
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(data, sort_keys=True, separators=(",", ":")))
+            os.replace(tmp, self.cache_file)
+        except OSError:
+            pass  # cache is best-effort
+
+    def _derive(self) -> None:
+        self._derived = True
+        self.files: list[str] = sorted(self.entries)
+        self.ids: dict[str, str] = {}
+        for name in self.files:
+            sid = self.entries[name]["id"]
+            if sid is not None:
+                self.ids.setdefault(sid, name)
+        self._refs: dict[str, list[Ref]] = {}
+        self._deps: dict[str, list[str]] = {}
+        rdeps: dict[str, set] = {name: set() for name in self.files}
+        self.def_usage: Counter = Counter()
+        for name in self.files:
+            refs = [self._classify(name, at, ref) for at, ref in self.entries[name]["refs"]]
+            self._refs[name] = refs
+            deps = sorted({r.file for r in refs if r.file and r.file != name})
+            self._deps[name] = deps
+            for d in deps:
+                rdeps.setdefault(d, set()).add(name)
+            for r in refs:
+                if r.file and r.fragment.startswith("/$defs/"):
+                    self.def_usage[(r.file, r.fragment.split("/")[2])] += 1
+        self._rdeps = {k: sorted(v) for k, v in rdeps.items()}
+
+    def _classify(self, source: str, at: str, ref: str) -> Ref:
+        base, _, fragment = ref.partition("#")
+        if not base:
+            return Ref(source, at, ref, "internal", source, fragment)
+        if base.startswith(("http://", "https://")):
+            return Ref(source, at, ref, "absolute", self.file_for(base), fragment)
+        if base.endswith(".schema.json"):
+            return Ref(source, at, ref, "relative", pathlib.PurePosixPath(base).name, fragment)
+        return Ref(source, at, ref, "other", None, fragment)
+
+    # -- queries
+
+    def file_for(self, uri: str) -> str | None:
+        """File name for an absolute $id/URL: exact $id match, else its last path segment."""
+        uri = uri.partition("#")[0]
+        if uri in self.ids:
+            return self.ids[uri]
+        name = uri.rsplit("/", 1)[-1]
+        return name if name.endswith(".schema.json") else None
+
+    def id_of(self, name: str) -> str | None:
+        return self.entries[name]["id"]
+
+    def sha256(self, name: str) -> str:
+        return self.entries[name]["sha256"]
+
+    def set_digest(self) -> str:
+        """Digest of every file name and content hash (changes when any schema does)."""
+        h = hashlib.sha256()
+        for name in self.files:
+            h.update(name.encode())
+            h.update(self.entries[name]["sha256"].encode())
+        return h.hexdigest()
+
+    def refs(self, name: str) -> list[Ref]:
+        return self._refs[name]
+
+    def broken(self, name: str) -> list[str]:
+        """Internal $refs of name that do not resolve within it."""
+        return self.entries[name]["broken"]
+
+    def missing(self, name: str) -> list[Ref]:
+        """Cross-file $refs of name whose target file is not in the graph."""
+        return [r for r in self._refs[name] if r.kind in ("absolute", "relative") and r.file not in self.entries]
+
+    def defs(self, name: str) -> list[str]:
+        return self.entries[name]["defs"]
+
+    def dependencies(self, name: str, transitive: bool = False) -> list[str]:
+        return self._closure(name, self._deps) if transitive else list(self._deps.get(name, ()))
+
+    def dependents(self, name: str, transitive: bool = False) -> list[str]:
+        return self._closure(name, self._rdeps) if transitive else list(self._rdeps.get(name, ()))
+
+    @staticmethod
+    def _closure(start: str, edges: dict[str, list[str]]) -> list[str]:
+        seen: set = set()
+        todo = list(edges.get(start, ()))
+        while todo:
+            n = todo.pop()
+            if n in seen or n == start:
+                continue
+            seen.add(n)
+            todo.extend(edges.get(n, ()))
+        return sorted(seen)
+
+    def document(self, name: str) -> Any:
+        """Parsed schema, read once per graph."""
+        doc = self._docs.get(name)
+        if doc is None:
+            doc = self._docs[name] = json.loads((self.schema_dir / name).read_bytes())
+        return doc
+
+    def error(self, name: str) -> str | None:
+        """JSON parse error of name, if it is not valid JSON."""
+        return self.entries[name]["error"]
+
+    def store(self) -> dict[str, Any]:
+        """{$id (file name when absent): document} for every schema that parses."""
+        return {self.entries[n]["id"] or n: self.document(n) for n in self.files if not self.entries[n]["error"]}
+
+
+def main() -> int:
+    graph = SchemaGraph()
+    for name in graph.files:
+        print(f"{name}: id={graph.id_of(name)}")
+        print(f"  refs: {len(graph.refs(name))}  depends on: {', '.join(graph.dependencies(name)) or '-'}")
+        print(f"  used by: {', '.join(graph.dependents(name)) or '-'}")
+    unused = [
+        f"{name}#/$defs/{d}" for name in graph.files for d in graph.defs(name) if not graph.def_usage[(name, d)]
+    ]
+    print(f"unreferenced $defs: {len(unused)}")
+    for u in unused:
+        print(f"  {u}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
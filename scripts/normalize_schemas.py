@@ -11,6 +11,20 @@ Normalize JSON Schemas in jsonschema/:
 - optional --check mode: fail if any optional-enum defaults remain
 
 Idempotent: safe to run repeatedly.
+
+Incremental: file hashes come from the shared schema graph
+(scripts/lib/schema_graph.py, refreshed by stat), and the sha256 of every file
+that came out clean (normalized, no offenses) is recorded in .cache/normalize/state.json together with a digest of
+VERSION, BASE_URL and this script; files whose bytes still match are skipped.
+Files are normalized independently, so the remaining ones can be spread over
+worker processes. Output files and per-file messages match the serial,
+uncached run.
+
+CLI:
+  --check          Do not write; fail if a file is not normalized or has offenses
+  --fail-fast      With --check: stop at the first offending file (in file order)
+  --jobs N, -j N   Worker processes (0 = one per CPU; default 1)
+  --no-cache       Process every file and do not update the state file
 """
 
 
@@ -19,27 +33,34 @@ from __future__ import annotations
 
 import argparse
 import copy
+import hashlib
 import json
+import os
 import pathlib
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Iterable, Iterator
+
+# ensure repo root on sys.path so we can import scripts.lib
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.lib.schema_graph import GRAPH_FILE, SchemaGraph
 
 # Support version.json single source
 try:
-    # ensure repo root on sys.path so we can import scripts.lib.version
-    ROOT = pathlib.Path(__file__).resolve().parents[1]
-    if str(ROOT) not in sys.path:
-        sys.path.insert(0, str(ROOT))
     from scripts.lib.version import schema_version  # type: ignore
 except Exception:
     schema_version = None  # type: ignore
 
-ROOT = pathlib.Path(__file__).resolve().parents[1]
 SCHEMA_DIR = ROOT / "jsonschema"
 BASE_URL = "https://schemas.synesthetic.dev"
 VERSION = schema_version() if callable(schema_version) else "0.1.0"
 
+CACHE_FILE = ROOT / ".cache" / "normalize" / "state.json"
+
 # Files that may keep additionalProperties=true at root
 ALLOW_ADDITIONAL_PROPS = {"tone.schema.json", "haptic.schema.json"}
 
@@ -54,12 +75,16 @@ def load_json(p: pathlib.Path) -> dict[str, Any]:
     return json.loads(p.read_text())
 
 
-def save_json(p: pathlib.Path, data: dict[str, Any]) -> None:
+def dump_json(data: dict[str, Any]) -> str:
     text = json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False)
     # Ensure exactly one newline at EOF, not two
     if not text.endswith("\n"):
         text += "\n"
-    p.write_text(text)
+    return text
+
+
+def save_json(p: pathlib.Path, data: dict[str, Any]) -> None:
+    p.write_text(dump_json(data))
 
 
 
@@ -258,8 +283,12 @@ def _find_optional_enum_defaults(root: dict[str, Any], node: Any, path: list[str
 
 # ---------------------------- normalize ----------------------------
 
-def normalize_file(fp: pathlib.Path, check_only: bool) -> tuple[dict[str, Any], list[Offense]]:
-    data = load_json(fp)
+def normalize_file(
+    fp: pathlib.Path, check_only: bool, data: dict[str, Any] | None = None
+) -> tuple[dict[str, Any], list[Offense]]:
+    """Normalize ``data`` (default: the parsed file) in place for ``fp``."""
+    if data is None:
+        data = load_json(fp)
 
     # headers
     data["$schema"] = "https://json-schema.org/draft/2020-12/schema"
@@ -292,41 +321,148 @@ def normalize_file(fp: pathlib.Path, check_only: bool) -> tuple[dict[str, Any],
     return data, offenses
 
 
-def main() -> int:
+# ---------------------------- incremental runs ----------------------------
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _env_digest() -> str:
+    """Digest of everything besides a file's bytes that can change its normalized form."""
+    h = hashlib.sha256()
+    h.update(VERSION.encode())
+    h.update(BASE_URL.encode())
+    h.update(pathlib.Path(__file__).resolve().read_bytes())
+    return h.hexdigest()
+
+
+def _load_state(env: str) -> dict[str, str]:
+    """file name -> sha256 of its last clean bytes; empty when the environment changed."""
+    try:
+        state = json.loads(CACHE_FILE.read_text())
+    except Exception:
+        return {}
+    if not isinstance(state, dict) or state.get("env") != env:
+        return {}
+    files = state.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _save_state(env: str, files: dict[str, str]) -> None:
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = CACHE_FILE.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"env": env, "files": files}, indent=2, sort_keys=True))
+        os.replace(tmp, CACHE_FILE)
+    except OSError:
+        pass  # state is best-effort
+
+
+@dataclass
+class FileResult:
+    name: str
+    text: str  # normalized output, exactly as save_json writes it
+    normalized: bool  # parsed original == normalized data
+    offenses: list[Offense]
+
+
+def _process(fp: pathlib.Path, raw: bytes) -> FileResult:
+    """Worker entry point: normalize one file from its bytes (never writes)."""
+    original = json.loads(raw)
+    data, offenses = normalize_file(fp, check_only=True, data=json.loads(raw))
+    return FileResult(fp.name, dump_json(data), original == data, offenses)
+
+
+def _run(files: list[tuple[pathlib.Path, bytes]], jobs: int) -> Iterator[FileResult]:
+    """Results in input order; closing the generator early cancels pending work."""
+    if jobs <= 1 or len(files) <= 1:
+        for fp, raw in files:
+            yield _process(fp, raw)
+        return
+    pool = ProcessPoolExecutor(max_workers=min(jobs, len(files)))
+    try:
+        futures = [pool.submit(_process, fp, raw) for fp, raw in files]
+        for fut in futures:
+            yield fut.result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def main(argv: Iterable[str] | None = None) -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--check", action="store_true", help="Fail if optional enum defaults remain")
-    args = ap.parse_args()
+    ap.add_argument(
+        "--fail-fast", action="store_true", help="With --check: stop at the first offending file"
+    )
+    ap.add_argument(
+        "--jobs", "-j", type=int, default=1,
+        help="Worker processes (0 = one per CPU); output matches the serial run",
+    )
+    ap.add_argument("--no-cache", action="store_true", help="Process every file; do not update state")
+    args = ap.parse_args(list(argv) if argv is not None else None)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    env = _env_digest()
+    state = {} if args.no_cache else _load_state(env)
+    # content hashes from the shared schema graph: unchanged files are not even read
+    graph = SchemaGraph(SCHEMA_DIR, GRAPH_FILE)
+    files = [SCHEMA_DIR / name for name in graph.files]
+    todo: list[tuple[pathlib.Path, bytes]] = []
+    digests: dict[str, str] = {}
+    clean: dict[str, str] = {}
+    for fp in files:
+        digests[fp.name] = graph.sha256(fp.name)
+        if state.get(fp.name) == digests[fp.name]:
+            clean[fp.name] = digests[fp.name]
+        else:
+            raw = fp.read_bytes()
+            digests[fp.name] = _sha256(raw)
+            todo.append((fp, raw))
 
-    total = 0
+    total = len(files)
+    not_normalized = False
     all_offenses: list[Offense] = []
-
-    for fp in sorted(SCHEMA_DIR.glob("*.schema.json")):
-        original = load_json(fp)
-        data, offenses = normalize_file(fp, check_only=args.check)
-
-        # In --check mode, do not write; ensure normalized equals original
-        if args.check:
-            if original != data:
-                print(f"❌ not normalized: {fp.name}")
-                # optional: show a minimal hint (avoid huge diffs)
-                # users should run normalize without --check to rewrite
-                all_offenses.append(Offense(file=fp.name, path="<normalized>", default=None, enum=[]))
+    results = _run(todo, jobs)
+    try:
+        for fp in files:
+            if fp.name in clean:
+                # unchanged since a clean run: normalized, no offenses, nothing to write
+                print(f"ok: {fp.name}" if args.check else f"normalized: {fp.name}")
+                continue
+            r = next(results)
+            # In --check mode, do not write; ensure normalized equals original
+            if args.check:
+                if not r.normalized:
+                    print(f"❌ not normalized: {fp.name}")
+                    # users should run normalize without --check to rewrite
+                    not_normalized = True
+                else:
+                    print(f"ok: {fp.name}")
+                all_offenses.extend(r.offenses)
+                if r.normalized and not r.offenses:
+                    clean[fp.name] = digests[fp.name]
+                elif args.fail_fast:
+                    break
             else:
-                print(f"ok: {fp.name}")
-        else:
-            save_json(fp, data)
-            print(f"normalized: {fp.name}")
-        total += 1
-        all_offenses.extend(offenses)
+                data = r.text.encode()
+                if _sha256(data) != digests[fp.name]:
+                    fp.write_bytes(data)
+                print(f"normalized: {fp.name}")
+                if not r.offenses:
+                    clean[fp.name] = _sha256(data)
+    finally:
+        results.close()
+
+    if not args.no_cache:
+        _save_state(env, clean)
+        print(f"normalize cache: {total - len(todo)} unchanged file(s) skipped", file=sys.stderr)
 
     if args.check:
-        offenses_only = [o for o in all_offenses if o.path != "<normalized>"]
-        not_normalized = any(o.path == "<normalized>" for o in all_offenses)
-        if offenses_only:
+        if all_offenses:
             print("❌ Optional enum defaults found (disallowed):")
-            for v in offenses_only:
+            for v in all_offenses:
                 print(f" - {v.file}: {v.path} (default={v.default}, enum={v.enum})")
-        if offenses_only or not_normalized:
+        if all_offenses or not_normalized:
             return 1
 
     print(f"done. files: {total}")
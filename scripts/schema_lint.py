@@ -10,40 +10,22 @@ Checks:
   - absolute refs to https://schemas.synesthetic.dev/<ver>/<file> exist in the store
   - relative refs like "./control.schema.json" exist in jsonschema/
 
+$ids and $refs come from the shared schema graph (scripts/lib/schema_graph.py),
+so files unchanged since the last run are not re-parsed.
+
 Exit codes: 0 clean, 1 problems, 2 setup error
 """
 from __future__ import annotations
-import json
 import pathlib
 import sys
-from typing import Any, Dict
+from typing import Dict
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 SCHEMAS = ROOT / "jsonschema"
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
 
-
-def loadj(p: pathlib.Path) -> Dict[str, Any]:
-    return json.loads(p.read_text())
-
-
-def _walk(node: Any):
-    if isinstance(node, dict):
-        yield node
-        for v in node.values():
-            yield from _walk(v)
-    elif isinstance(node, list):
-        for v in node:
-            yield from _walk(v)
-
-
-def _resolve_internal(root: Dict[str, Any], ref: str) -> bool:
-    path = ref[2:].split("/")
-    cur: Any = root
-    for seg in path:
-        if not isinstance(cur, dict) or seg not in cur:
-            return False
-        cur = cur[seg]
-    return True
+from scripts.lib.schema_graph import SchemaGraph
 
 
 def lint() -> int:
@@ -51,45 +33,33 @@ def lint() -> int:
         print(f"missing jsonschema dir: {SCHEMAS}", file=sys.stderr)
         return 2
 
-    files = sorted(SCHEMAS.glob("*.schema.json"))
-    store: Dict[str, Dict[str, Any]] = {}
-    ids: Dict[str, pathlib.Path] = {}
+    graph = SchemaGraph(SCHEMAS)
+    ids: Dict[str, str] = {}
     errs: list[str] = []
 
-    # load all
-    for p in files:
-        data = loadj(p)
-        store[p.name] = data
-        sid = data.get("$id")
-        if isinstance(sid, str):
+    for name in graph.files:
+        if graph.error(name):
+            errs.append(f"invalid JSON in {name}: {graph.error(name)}")
+        sid = graph.id_of(name)
+        if sid is not None:
             if sid in ids:
-                errs.append(f"duplicate $id: {sid} in {ids[sid].name} and {p.name}")
+                errs.append(f"duplicate $id: {sid} in {ids[sid]} and {name}")
             else:
-                ids[sid] = p
-
-    # helper to test presence by absolute URL
-    def has_abs(url: str) -> bool:
-        # expect .../<name>.schema.json
-        name = url.rsplit("/", 1)[-1]
-        return name in store
-
-    for p in files:
-        data = store[p.name]
-        for node in _walk(data):
-            ref = node.get("$ref") if isinstance(node, dict) else None
-            if not isinstance(ref, str):
-                continue
-            if ref.startswith("#/"):
-                if not _resolve_internal(data, ref):
-                    errs.append(f"unresolved internal $ref in {p.name}: {ref}")
-            elif ref.endswith(".schema.json") and (ref.startswith("http://") or ref.startswith("https://")):
-                if not has_abs(ref):
-                    errs.append(f"missing absolute $ref target in store for {p.name}: {ref}")
-            elif ref.endswith(".schema.json"):
+                ids[sid] = name
+
+    for name in graph.files:
+        broken = set(graph.broken(name))
+        for r in graph.refs(name):
+            if r.kind == "internal":
+                if r.ref in broken:
+                    errs.append(f"unresolved internal $ref in {name}: {r.ref}")
+            elif r.kind == "absolute" and r.ref.endswith(".schema.json"):
+                if r.file not in graph.entries:
+                    errs.append(f"missing absolute $ref target in store for {name}: {r.ref}")
+            elif r.kind == "relative" and r.ref.endswith(".schema.json"):
                 # treat as local file in jsonschema/
-                target = SCHEMAS / pathlib.Path(ref).name
-                if not target.exists():
-                    errs.append(f"missing local $ref file for {p.name}: {ref}")
+                if r.file not in graph.entries:
+                    errs.append(f"missing local $ref file for {name}: {r.ref}")
 
     for e in errs:
         print(e)
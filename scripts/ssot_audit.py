@@ -13,6 +13,11 @@ from typing import Any, Dict, List, Tuple
 
 
 ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.lib.schema_graph import SchemaGraph
+
 SPEC_PATH_DEFAULT = ROOT / "meta" / "prompts" / "ssot.audit.json"
 OUT_PATH_DEFAULT = ROOT / "meta" / "output" / "SSOT_AUDIT.md"
 
@@ -131,17 +136,17 @@ def c4_examples_validate(verbose: bool = False) -> Tuple[bool, List[str]]:
         has_jsonschema = False
         jsonschema_err = str(e)
 
-    # Load all schemas for resolver store (by both path and $id)
+    # Schemas for the resolver store (by both path and $id), from the shared schema graph
     store: Dict[str, Any] = {}
-    schema_dir = ROOT / "jsonschema"
-    for f in sorted(schema_dir.glob("*.schema.json")):
-        try:
-            data = load_json(f)
-            store[rel(f)] = data
-            if isinstance(data.get("$id"), str):
-                store[data["$id"]] = data
-        except Exception:
-            pass
+    graph = SchemaGraph(ROOT / "jsonschema")
+    for name in graph.files:
+        if graph.error(name):
+            continue
+        data = graph.document(name)
+        store[rel(graph.schema_dir / name)] = data
+        sid = graph.id_of(name)
+        if sid is not None:
+            store[sid] = data
 
     # Prefer modern referencing.Registry for resolution; fall back silently
     # to RefResolver (without emitting deprecation warnings) when needed.
@@ -163,13 +168,12 @@ def c4_examples_validate(verbose: bool = False) -> Tuple[bool, List[str]]:
             registry = None
 
     def load_schema(ref: str) -> Any:
-        # prefer path relative to repo root
+        # prefer path relative to repo root (schemas are already parsed in the store)
+        if ref in store:
+            return store[ref]
         p = ROOT / ref
         if p.exists():
             return load_json(p)
-        # try store by $id
-        if ref in store:
-            return store[ref]
         raise FileNotFoundError(ref)
 
     # Expand and de-duplicate example globs (avoid double-including top-level files)
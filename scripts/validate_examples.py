@@ -15,38 +15,67 @@ CLI:
   --file <path>    Validate a single file
   --dir  <path>    Validate all *.json under a directory (recursively)
   --strict         Require $schema; disallow filename heuristics
+  --level L        schema | model | roundtrip (default). Cumulative: "schema" runs
+                   JSON Schema only, "model" adds Pydantic validation, "roundtrip"
+                   adds the dump/normalize/diff check CI relies on.
+  --no-json-schema Skip the JSON Schema stage. With --level model the file bytes go
+                   straight to Pydantic (model_validate_json), never through json.loads.
+  --jobs N         Validate across N worker processes (output order is unchanged)
+  --no-cache       Ignore and do not update the on-disk result cache (.cache/validate/)
+  --ndjson <path>  Stream newline-delimited JSON records ("-" for stdin); one JSONL
+                   result row per record on stdout (or --out). Dispatch is strict.
 
 Exit codes: 0 OK, 1 validation errors, 2 setup issues.
 """
 
 from __future__ import annotations
 import argparse
+import hashlib
 import importlib
 import json
+import os
 import pathlib
 import sys
-from typing import Any, Dict, Tuple, List, Optional
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Dict, IO, Iterator, Tuple, List, Optional
 
 # --- repo dirs
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 SCHEMAS_DIR = ROOT / "jsonschema"
 EXAMPLES_DIR = ROOT / "docs" / "examples" / "0.7.3"
 PY_SRC = ROOT / "python" / "src"
+RESULT_CACHE_DIR = ROOT / ".cache" / "validate"
+RESULT_CACHE_MAX_ENTRIES = 20000
 
-# Make generated package importable without install
-if str(PY_SRC) not in sys.path:
-    sys.path.insert(0, str(PY_SRC))
+# Make generated package (and scripts.lib) importable without install
+for _p in (str(PY_SRC), str(ROOT)):
+    if _p not in sys.path:
+        sys.path.insert(0, _p)
 
 # JSON Schema validator
 import jsonschema
 import warnings
 from jsonschema.validators import Draft202012Validator
 try:
-    from referencing import Registry, Resource  # jsonschema >=4.18
+    import referencing  # noqa: F401  (jsonschema >=4.18)
     _HAVE_REFERENCING = True
 except Exception:  # pragma: no cover
     _HAVE_REFERENCING = False
 
+# Shared dispatch table, round-trip diff and in-process validator
+from synesthetic_schemas.validation import (
+    LEVELS,
+    SCHEMA_TO_MODEL,
+    AssetValidator,
+    build_registry,
+    model_json_errors,
+    read_envelope,
+    roundtrip_diff,
+    schema_file_for_ref,
+)
+
 # filename token  -> (python module name, candidate class names, schema filename)
 TOKENS = {
     "synestheticasset": ("synesthetic_asset", "SynestheticAsset", "synesthetic-asset.schema.json"),
@@ -64,103 +93,70 @@ TOKENS = {
     "rule":             ("rule",              "Rule", "rule.schema.json"),
 }
 
-# Map schema file name → (python module, candidate class names)
-SCHEMA_TO_MODEL: Dict[str, Tuple[str, str]] = {
-    "synesthetic-asset.schema.json": ("synesthetic_asset", "SynestheticAsset"),
-    "control-bundle.schema.json": ("control_bundle", "ControlBundle"),
-    "control.schema.json": ("control", "Control"),
-    "shader.schema.json": ("shader", "Shader"),
-    "tone.schema.json": ("tone", "Tone"),
-    "haptic.schema.json": ("haptic", "Haptic"),
-    "modulation.schema.json": ("modulation", "Modulation"),
-    "rule-bundle.schema.json": ("rule_bundle", "RuleBundle"),
-    "rule.schema.json": ("rule", "Rule"),
-}
-
-# Round-trip keys to ignore entirely (pydantic may normalize heavily)
-ROUNDTRIP_IGNORE_TOPLEVEL = {"shader", "control", "modulations"}
-
-# ---------- helpers
+# Shared $id/$ref graph (.cache/schema_graph.json); refreshed by stat, re-parsed on change
+from scripts.lib.schema_graph import SchemaGraph
 
-def _normalize(o: Any) -> Any:
-    """Sort dict keys, drop None, and coerce ints/floats to float for stable compare."""
-    if isinstance(o, dict):
-        return {k: _normalize(v) for k, v in sorted(o.items()) if v is not None}
-    if isinstance(o, list):
-        return [_normalize(v) for v in o]
-    if isinstance(o, bool):
-        return o
-    if isinstance(o, (int, float)):
-        return float(o)
-    return o
+_GRAPH: Optional[SchemaGraph] = None
 
-def _prune_defaults(o: Any) -> Any:
-    """
-    Remove fields that equal canonical defaults so round-trip compares don't flag.
-    - action.scale defaults to 1.0 (per control.schema.json)
-    """
-    if isinstance(o, dict):
-        # If this looks like an ActionType block, drop scale==1.0
-        # (heuristic: presence of 'axis' and 'sensitivity' keys)
-        if "axis" in o and "sensitivity" in o and "scale" in o:
-            try:
-                if float(o["scale"]) == 1.0:
-                    o = dict(o)
-                    o.pop("scale", None)
-            except Exception:
-                pass
-        return {k: _prune_defaults(v) for k, v in o.items()}
-    if isinstance(o, list):
-        return [_prune_defaults(v) for v in o]
-    return o
-
-def _deep_diff(a: Any, b: Any, path: Tuple[Any, ...] = ()) -> List[str]:
-    """Return human-readable diffs of structure/content differences."""
-    diffs: List[str] = []
-    if type(a) != type(b) and not (isinstance(a, (int, float)) and isinstance(b, (int, float))):
-        diffs.append(f"{'/'.join(map(str,path)) or '<root>'}: type {type(a).__name__} != {type(b).__name__}")
-        return diffs
-    if isinstance(a, dict):
-        ak, bk = set(a.keys()), set(b.keys())
-        for k in sorted(ak - bk):
-            diffs.append(f"{'/'.join(map(str,path+(k,)))}: present in input, missing in output")
-        for k in sorted(bk - ak):
-            diffs.append(f"{'/'.join(map(str,path+(k,)))}: added in output")
-        for k in sorted(ak & bk):
-            diffs.extend(_deep_diff(a[k], b[k], path + (k,)))
-    elif isinstance(a, list):
-        if len(a) != len(b):
-            diffs.append(f"{'/'.join(map(str,path))}: list length {len(a)} != {len(b)}")
-        for i, (ai, bi) in enumerate(zip(a, b)):
-            diffs.extend(_deep_diff(ai, bi, path + (i,)))
+def _schema_graph() -> SchemaGraph:
+    global _GRAPH
+    if _GRAPH is None:
+        _GRAPH = SchemaGraph(SCHEMAS_DIR)
     else:
-        if _normalize(a) != _normalize(b):
-            diffs.append(f"{'/'.join(map(str,path))}: {a!r} != {b!r}")
-    return diffs
+        _GRAPH.refresh()
+    return _GRAPH
 
 def _load_schema_store() -> Dict[str, Any]:
-    store: Dict[str, Any] = {}
-    for p in SCHEMAS_DIR.glob("*.schema.json"):
-        data = json.loads(p.read_text())
-        sid = data.get("$id") or p.name
-        store[sid] = data
-    return store
+    return _schema_graph().store()
+
+# Process-wide compiled validator cache.
+# Key: (schema file name, sha256 of that schema file, sha256 of the whole schema set);
+# the set digest covers edits to referenced schemas that the root file does not see.
+_VALIDATOR_CACHE: Dict[Tuple[str, str, str], Draft202012Validator] = {}
+VALIDATOR_CACHE_STATS: Dict[str, int] = {"hits": 0, "misses": 0}
+
+# path -> ((mtime_ns, size), sha256); avoids re-hashing unchanged files per instance
+_DIGESTS: Dict[pathlib.Path, Tuple[Tuple[int, int], str]] = {}
+
+def _file_digest(p: pathlib.Path) -> str:
+    st = p.stat()
+    sig = (st.st_mtime_ns, st.st_size)
+    hit = _DIGESTS.get(p)
+    if hit is not None and hit[0] == sig:
+        return hit[1]
+    digest = hashlib.sha256(p.read_bytes()).hexdigest()
+    _DIGESTS[p] = (sig, digest)
+    return digest
+
+def _schema_set_digest() -> str:
+    return _schema_graph().set_digest()
 
 def _validator_for(schema_name: str) -> Draft202012Validator:
     schema_path = SCHEMAS_DIR / schema_name
     if not schema_path.exists():
         raise FileNotFoundError(f"schema not found: {schema_path}")
-    schema = json.loads(schema_path.read_text())
-    store = _load_schema_store()
+    graph = _schema_graph()
+    key = (schema_name, graph.sha256(schema_name), graph.set_digest())
+    v = _VALIDATOR_CACHE.get(key)
+    if v is not None:
+        VALIDATOR_CACHE_STATS["hits"] += 1
+        return v
+    VALIDATOR_CACHE_STATS["misses"] += 1
+    # drop stale entries for this schema (content changed on disk)
+    for k in [k for k in _VALIDATOR_CACHE if k[0] == schema_name]:
+        del _VALIDATOR_CACHE[k]
+    v = _build_validator(schema_name)
+    _VALIDATOR_CACHE[key] = v
+    return v
+
+def _build_validator(schema_name: str) -> Draft202012Validator:
+    graph = _schema_graph()
+    schema = graph.document(schema_name)
+    store = graph.store()
     if _HAVE_REFERENCING:
         try:
             # Build a registry of resources keyed by $id, which our schemas use.
-            resources = {}
-            for k, v in store.items():
-                if isinstance(k, str) and k.startswith("http"):
-                    resources[k] = Resource.from_contents(v)
-            registry = Registry().with_resources(resources)
-            return Draft202012Validator(schema, registry=registry)
+            return Draft202012Validator(schema, registry=build_registry(store))
         except Exception:
             # Fall back to RefResolver if the runtime combo of jsonschema/referencing misbehaves
             pass
@@ -175,16 +171,14 @@ def _validator_for(schema_name: str) -> Draft202012Validator:
 
 def _pick_model_and_schema(example_path: pathlib.Path, data: Dict[str, Any], strict: bool = False):
     """Return (model_cls or None, schema_file or None, reason_if_none).
-    Prefers $schema; falls back to filename tokens unless strict.
+    Prefers $schema/$schemaRef; falls back to filename tokens unless strict.
     """
-    # 1) Prefer $schema at root
+    # 1) Prefer $schema at root ($schemaRef is the examples_qc spelling)
     ref = data.get("$schema")
+    if not isinstance(ref, str):
+        ref = data.get("$schemaRef")
     if isinstance(ref, str):
-        schema_file: Optional[str] = None
-        if ref.startswith("http://") or ref.startswith("https://"):
-            schema_file = ref.rsplit("/", 1)[-1]
-        else:
-            schema_file = pathlib.Path(ref).name
+        schema_file = schema_file_for_ref(ref)
         if schema_file in SCHEMA_TO_MODEL:
             module_name, candidates = SCHEMA_TO_MODEL[schema_file]
             try:
@@ -221,12 +215,40 @@ def _should_skip(p: pathlib.Path) -> bool:
         parts = p.parts
     return any(part.startswith("_") for part in parts[:-1])  # skip dirs like examples/_skip/...
 
-def validate_file(p: pathlib.Path, strict: bool = False) -> list[str]:
+def _validate_file_json(p: pathlib.Path, raw: bytes, strict: bool) -> list[str]:
+    """Pydantic-only check straight from bytes; only the $schema envelope is built in Python."""
+    try:
+        envelope: Dict[str, Any] = read_envelope(raw)
+    except ValueError as e:
+        return [f"{p.name}: invalid JSON: {e}"]
+    except TypeError:
+        envelope = {}
+    model_cls, _, why = _pick_model_and_schema(p, envelope, strict=strict)
+    if model_cls is None:
+        return [f"{p.name}: could not determine model/schema -> {why}"]
+    issues = model_json_errors(model_cls, raw)
+    if not issues:
+        return []
+    return [
+        f"{p.name}: Pydantic validation failed: "
+        + "; ".join(f"{i.pointer or '<root>'}: {i.message}" for i in issues)
+    ]
+
+def validate_file(
+    p: pathlib.Path, strict: bool = False, level: str = "roundtrip", json_schema: bool = True
+) -> list[str]:
     errs: list[str] = []
+    fast = not json_schema and level == "model"
+    # Parsed once; the dict is shared by the JSON Schema, Pydantic and round-trip stages
     try:
-        data = json.loads(p.read_text())
+        raw = p.read_bytes()
+        data = None if fast else json.loads(raw)
+    except OSError as e:
+        return [f"{p.name}: could not read file: {e}"]
     except Exception as e:
         return [f"{p.name}: invalid JSON: {e}"]
+    if fast:
+        return _validate_file_json(p, raw, strict)
 
     # Determine model/schema, prefer $schema on raw data
     model_cls, schema_name, why = _pick_model_and_schema(p, data, strict=strict)
@@ -240,32 +262,21 @@ def validate_file(p: pathlib.Path, strict: bool = False) -> list[str]:
         data_clean = data
 
     # 1) JSON Schema validation
-    try:
-        v = _validator_for(schema_name)
-        v.validate(data_clean)
-    except Exception as e:
-        errs.append(f"{p.name}: JSON Schema validation failed: {e}")
+    if json_schema:
+        try:
+            v = _validator_for(schema_name)
+            v.validate(data_clean)
+        except Exception as e:
+            errs.append(f"{p.name}: JSON Schema validation failed: {e}")
+    if level == "schema":
+        return errs
 
     # 2) Pydantic validation + round-trip
     try:
         model = model_cls.model_validate(data_clean)
-        out = model.model_dump(
-            mode="json",
-            exclude_none=True,
-            exclude_unset=True,
-            exclude_defaults=True,
-        )
-
-        in_norm = _normalize(_prune_defaults(json.loads(json.dumps(data_clean))))
-        out_norm = _normalize(_prune_defaults(json.loads(json.dumps(out))))
-
-        # ignore some noisy top-levels entirely (until their shapes stabilize)
-        for k in ROUNDTRIP_IGNORE_TOPLEVEL:
-            if k in in_norm and k in out_norm:
-                out_norm[k] = in_norm[k]
-
-        if in_norm != out_norm:
-            diffs = _deep_diff(in_norm, out_norm)
+        entries = roundtrip_diff(data_clean, model) if level == "roundtrip" else []
+        if entries:
+            diffs = [f"{'/'.join(map(str, path)) or '<root>'}: {d}" for path, d in entries]
             errs.append(
                 f"{p.name}: round-trip mismatch (diff count={len(diffs)}): "
                 + "; ".join(diffs[:8])
@@ -276,6 +287,37 @@ def validate_file(p: pathlib.Path, strict: bool = False) -> list[str]:
 
     return errs
 
+_RECORD_VALIDATORS: Dict[Tuple[str, bool], AssetValidator] = {}
+
+def _record_validator(level: str, json_schema: bool) -> AssetValidator:
+    v = _RECORD_VALIDATORS.get((level, json_schema))
+    if v is None:
+        v = _RECORD_VALIDATORS[(level, json_schema)] = AssetValidator(
+            SCHEMAS_DIR, level=level, json_schema=json_schema
+        )
+    return v
+
+def _record_errors(result: Any) -> List[Dict[str, str]]:
+    return [{"stage": e.stage, "pointer": e.pointer, "message": e.message} for e in result.errors]
+
+def validate_record(
+    data: Any, level: str = "roundtrip", json_schema: bool = True
+) -> Tuple[Optional[str], List[Dict[str, str]]]:
+    """Validate one in-memory document (strict $schema/$schemaRef dispatch).
+
+    Returns (schema file or None, errors); each error carries a JSON pointer,
+    a message, and the stage that produced it (parse/dispatch/schema/model/roundtrip).
+    """
+    result = _record_validator(level, json_schema).validate(data)
+    return result.schema, _record_errors(result)
+
+def validate_record_json(
+    raw: bytes, level: str = "roundtrip", json_schema: bool = True
+) -> Tuple[Optional[str], List[Dict[str, str]]]:
+    """validate_record for a document still in JSON bytes (parsed at most once)."""
+    result = _record_validator(level, json_schema).validate_json(raw)
+    return result.schema, _record_errors(result)
+
 def _gather_files(path: Optional[str]) -> list[pathlib.Path]:
     if path is None:
         base = EXAMPLES_DIR
@@ -296,13 +338,230 @@ def _gather_files(path: Optional[str]) -> list[pathlib.Path]:
     print(f"path not found: {p}")
     return []
 
+# ---------- on-disk result cache
+
+def _package_digest() -> str:
+    h = hashlib.sha256()
+    pkg = PY_SRC / "synesthetic_schemas"
+    for p in sorted(pkg.rglob("*.py")):
+        h.update(p.relative_to(pkg).as_posix().encode())
+        h.update(_file_digest(p).encode())
+    return h.hexdigest()
+
+def _cache_env_digest(strict: bool, level: str, json_schema: bool = True) -> str:
+    """Digest of everything besides the instance that can change a result."""
+    h = hashlib.sha256()
+    h.update(_schema_set_digest().encode())
+    h.update(_package_digest().encode())
+    h.update(_file_digest(pathlib.Path(__file__).resolve()).encode())
+    h.update(b"strict" if strict else b"lenient")
+    h.update(level.encode())
+    h.update(b"json-schema" if json_schema else b"models-only")
+    return h.hexdigest()
+
+def _cache_key(p: pathlib.Path, env: str) -> str:
+    h = hashlib.sha256(env.encode())
+    # messages embed the file name, so identical bytes under another name are a different entry
+    h.update(p.name.encode())
+    h.update(hashlib.sha256(p.read_bytes()).digest())
+    return h.hexdigest()
+
+def _cache_path(key: str) -> pathlib.Path:
+    return RESULT_CACHE_DIR / key[:2] / f"{key}.json"
+
+def _cache_get(key: str) -> Optional[List[str]]:
+    cp = _cache_path(key)
+    try:
+        errs = json.loads(cp.read_text())["errors"]
+    except Exception:
+        return None
+    try:
+        os.utime(cp)  # refresh for LRU eviction
+    except OSError:
+        pass
+    return errs
+
+def _cache_put(key: str, errs: List[str]) -> None:
+    cp = _cache_path(key)
+    try:
+        cp.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cp.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"errors": errs}, ensure_ascii=False))
+        os.replace(tmp, cp)
+    except OSError:
+        pass  # cache is best-effort
+
+def _cache_evict(max_entries: int) -> int:
+    """Drop least-recently-used entries beyond max_entries; return number removed."""
+    if not RESULT_CACHE_DIR.exists():
+        return 0
+    entries = []
+    for cp in RESULT_CACHE_DIR.glob("*/*.json"):
+        try:
+            entries.append((cp.stat().st_mtime_ns, cp))
+        except OSError:
+            pass
+    excess = len(entries) - max_entries
+    if excess <= 0:
+        return 0
+    entries.sort()
+    for _, cp in entries[:excess]:
+        try:
+            cp.unlink()
+        except OSError:
+            pass
+    return excess
+
+def _validate_shard(
+    files: List[pathlib.Path], strict: bool, level: str, json_schema: bool = True
+) -> Tuple[List[List[str]], int, int]:
+    """Worker entry point: validate a contiguous shard, reusing this process' caches.
+
+    Returns per-file errors (in input order) plus the cache hit/miss delta for the shard.
+    """
+    hits, misses = VALIDATOR_CACHE_STATS["hits"], VALIDATOR_CACHE_STATS["misses"]
+    results = [validate_file(f, strict=strict, level=level, json_schema=json_schema) for f in files]
+    return (
+        results,
+        VALIDATOR_CACHE_STATS["hits"] - hits,
+        VALIDATOR_CACHE_STATS["misses"] - misses,
+    )
+
+def _shards(files: List[pathlib.Path], n: int) -> List[List[pathlib.Path]]:
+    size = max(1, -(-len(files) // n))
+    return [files[i:i + size] for i in range(0, len(files), size)]
+
+def _validate_parallel(
+    files: List[pathlib.Path], strict: bool, level: str, jobs: int, json_schema: bool = True
+) -> List[List[str]]:
+    # Several shards per worker keeps the pool busy when file sizes are uneven;
+    # contiguous shards + ordered map keep the output identical to a serial run.
+    shards = _shards(files, jobs * 4)
+    results: List[List[str]] = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        n = len(shards)
+        for shard_results, hits, misses in pool.map(
+            _validate_shard, shards, [strict] * n, [level] * n, [json_schema] * n
+        ):
+            results.extend(shard_results)
+            VALIDATOR_CACHE_STATS["hits"] += hits
+            VALIDATOR_CACHE_STATS["misses"] += misses
+    return results
+
+# ---------- NDJSON streaming
+
+NDJSON_BATCH_PER_JOB = 256
+
+def _iter_ndjson(path: str) -> Iterator[Tuple[int, bytes]]:
+    """Yield (line number, raw bytes) for non-blank lines; memory stays bounded by one line."""
+    f = sys.stdin.buffer if path == "-" else open(path, "rb")
+    try:
+        for lineno, raw in enumerate(f, 1):
+            if raw.strip():
+                yield lineno, raw
+    finally:
+        if f is not sys.stdin.buffer:
+            f.close()
+
+def _ndjson_row(
+    item: Tuple[int, bytes], level: str = "roundtrip", json_schema: bool = True
+) -> Tuple[str, bool]:
+    lineno, raw = item
+    t0 = time.perf_counter()
+    schema_name: Optional[str] = None
+    try:
+        schema_name, errors = validate_record_json(raw, level, json_schema)
+    except Exception as e:
+        errors = [{"stage": "setup", "pointer": "", "message": str(e)}]
+    row = {
+        "line": lineno,
+        "ok": not errors,
+        "schema": schema_name,
+        "errors": errors,
+        "ms": round((time.perf_counter() - t0) * 1000.0, 3),
+    }
+    return json.dumps(row, ensure_ascii=False, separators=(",", ":")), not errors
+
+def _ndjson_batch(
+    items: List[Tuple[int, bytes]], level: str, json_schema: bool = True
+) -> List[Tuple[str, bool]]:
+    return [_ndjson_row(it, level, json_schema) for it in items]
+
+def validate_ndjson(
+    path: str, out: IO[str], jobs: int = 1, level: str = "roundtrip", json_schema: bool = True
+) -> Tuple[int, int]:
+    """Validate an NDJSON stream, writing one result row per record; return (records, failed)."""
+    total = failed = 0
+    records = _iter_ndjson(path)
+
+    def emit(rows: List[Tuple[str, bool]]) -> None:
+        nonlocal total, failed
+        for line, ok in rows:
+            out.write(line + "\n")
+            total += 1
+            failed += 0 if ok else 1
+
+    if jobs <= 1:
+        for item in records:
+            emit([_ndjson_row(item, level, json_schema)])
+        return total, failed
+
+    # Read a bounded window, fan it out, write it back in input order, repeat.
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        while True:
+            window = list(islice(records, jobs * NDJSON_BATCH_PER_JOB))
+            if not window:
+                break
+            chunks = [window[i:i + NDJSON_BATCH_PER_JOB] for i in range(0, len(window), NDJSON_BATCH_PER_JOB)]
+            n = len(chunks)
+            for rows in pool.map(_ndjson_batch, chunks, [level] * n, [json_schema] * n):
+                emit(rows)
+    return total, failed
+
 
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--file", dest="file", help="Validate a single file")
     ap.add_argument("--dir", dest="dir", help="Validate all json under a directory")
     ap.add_argument("--strict", action="store_true", help="Require $schema; no filename fallback")
+    ap.add_argument(
+        "--level", choices=LEVELS, default="roundtrip",
+        help="schema: JSON Schema only; model: + Pydantic; roundtrip: + round-trip diff (default)",
+    )
+    ap.add_argument(
+        "--no-json-schema", dest="json_schema", action="store_false",
+        help="Skip the JSON Schema stage; with --level model, Pydantic validates the raw bytes",
+    )
+    ap.add_argument(
+        "--jobs", "-j", type=int, default=1,
+        help="Worker processes (0 = one per CPU); output matches the serial run",
+    )
+    ap.add_argument("--no-cache", action="store_true", help="Bypass the on-disk result cache")
+    ap.add_argument("--ndjson", dest="ndjson", help="Stream-validate an NDJSON/JSONL file ('-' = stdin)")
+    ap.add_argument("--out", dest="out", help="With --ndjson: write result rows here instead of stdout")
+    ap.add_argument(
+        "--cache-max-entries", type=int, default=RESULT_CACHE_MAX_ENTRIES,
+        help="Evict least-recently-used cache entries beyond this count",
+    )
     args = ap.parse_args()
+    if not args.json_schema and args.level == "schema":
+        ap.error("--no-json-schema needs --level model or roundtrip")
+
+    if args.ndjson:
+        if args.ndjson != "-" and not pathlib.Path(args.ndjson).is_file():
+            print(f"path not found: {args.ndjson}", file=sys.stderr)
+            return 2
+        jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+        out = open(args.out, "w", encoding="utf-8") if args.out else sys.stdout
+        try:
+            total, failed = validate_ndjson(
+                args.ndjson, out, jobs=jobs, level=args.level, json_schema=args.json_schema
+            )
+        finally:
+            if out is not sys.stdout:
+                out.close()
+        print(f"{'❌' if failed else '✅'} {total - failed}/{total} record(s) valid.", file=sys.stderr)
+        return 1 if failed else 0
 
     # precedence: --file over --dir; else default docs/examples/0.7.3/
     chosen = args.file or args.dir
@@ -311,9 +570,52 @@ def main() -> int:
         print("No example JSON files found (respecting _skip/) or invalid path")
         return 2
 
+    # Unchanged files (same bytes, schemas, models and validator) replay their last result.
+    results: Dict[pathlib.Path, List[str]] = {}
+    keys: Dict[pathlib.Path, str] = {}
+    if not args.no_cache:
+        env = _cache_env_digest(args.strict, args.level, args.json_schema)
+        for f in files:
+            try:
+                keys[f] = _cache_key(f, env)
+            except OSError:
+                continue
+            cached = _cache_get(keys[f])
+            if cached is not None:
+                results[f] = cached
+    todo = [f for f in files if f not in results]
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    jobs = min(jobs, len(todo))
+    if jobs > 1:
+        fresh = _validate_parallel(todo, args.strict, args.level, jobs, args.json_schema)
+    else:
+        fresh = [
+            validate_file(f, strict=args.strict, level=args.level, json_schema=args.json_schema)
+            for f in todo
+        ]
+    for f, errs in zip(todo, fresh):
+        results[f] = errs
+        if f in keys:
+            _cache_put(keys[f], errs)
+
+    if not args.no_cache:
+        _cache_evict(args.cache_max_entries)
+        print(
+            f"result cache: {len(files) - len(todo)} hit(s), {len(todo)} miss(es)",
+            file=sys.stderr,
+        )
+
     all_errs: list[str] = []
     for f in files:
-        all_errs += validate_file(f, strict=args.strict)
+        all_errs += results[f]
+
+    # stderr keeps stdout stable for diffing while still surfacing reuse in CI logs
+    print(
+        f"validator cache: {VALIDATOR_CACHE_STATS['hits']} hit(s), "
+        f"{VALIDATOR_CACHE_STATS['misses']} miss(es)",
+        file=sys.stderr,
+    )
 
     if all_errs:
         for e in all_errs:
@@ -321,7 +623,11 @@ def main() -> int:
         print(f"❌ {len(all_errs)} issue(s) across {len(files)} file(s).")
         return 1
 
-    print(f"✅ {len(files)} example file(s) validated and round-tripped clean.")
+    if args.level == "roundtrip" and args.json_schema:
+        print(f"✅ {len(files)} example file(s) validated and round-tripped clean.")
+    else:
+        scope = args.level if args.json_schema else f"{args.level}, no JSON Schema"
+        print(f"✅ {len(files)} example file(s) validated clean (level: {scope}).")
     return 0
 
 if __name__ == "__main__":
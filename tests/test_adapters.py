@@ -0,0 +1,57 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "python" / "src"))
+from synesthetic_schemas import ModulationItem, Rule, SynestheticAsset  # noqa: E402
+from synesthetic_schemas.adapters import (  # noqa: E402
+    TOP_LEVEL_MODELS,
+    list_adapter,
+    validate_batch,
+    validate_batch_json,
+    warm,
+)
+
+EXAMPLES = REPO_ROOT / "docs" / "examples" / "0.7.3"
+
+
+def _assets():
+    out = []
+    for p in sorted(EXAMPLES.glob("SynestheticAsset_*.json")):
+        data = json.loads(p.read_text())
+        out.append({k: v for k, v in data.items() if not k.startswith("$")})
+    return out
+
+
+def test_adapters_are_cached_per_model():
+    assert list_adapter("Rule") is list_adapter(Rule)
+    warm()
+    for name in TOP_LEVEL_MODELS:
+        assert list_adapter(name) is list_adapter(name)
+
+
+def test_batch_matches_per_object_validation():
+    assets = _assets()
+    expected = [SynestheticAsset.model_validate(a) for a in assets]
+    assert validate_batch("SynestheticAsset", assets) == expected
+    assert validate_batch_json(SynestheticAsset, json.dumps(assets).encode()) == expected
+
+    mods = [m for a in assets for m in a.get("modulations") or []]
+    got = validate_batch_json("ModulationItem", json.dumps(mods).encode())
+    assert got == [ModulationItem.model_validate(m) for m in mods]
+
+
+def test_batch_errors_carry_item_index():
+    rules = [{"id": "ok"}, {"id": "bad", "nope": 1}]
+    with pytest.raises(ValidationError) as exc:
+        validate_batch_json(Rule, json.dumps(rules))
+    assert exc.value.errors()[0]["loc"][:2] == (1, "nope")
+
+
+def test_unknown_model_name():
+    with pytest.raises(KeyError):
+        list_adapter("NoSuchModel")
@@ -0,0 +1,140 @@
+import json
+import math
+import sys
+from array import array
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "python" / "src"))
+from synesthetic_schemas.control_bundle import ControlBundle  # noqa: E402
+from synesthetic_schemas.runtime import ControlEvaluator, compile_asset  # noqa: E402
+from synesthetic_schemas.synesthetic_asset import SynestheticAsset  # noqa: E402
+
+EXAMPLES = REPO_ROOT / "docs" / "examples" / "0.7.3"
+
+
+def _load(name):
+    data = json.loads((EXAMPLES / name).read_text())
+    return {k: v for k, v in data.items() if not k.startswith("$")}
+
+
+def _control(mappings, **kw):
+    spec = {"parameter": "shader.x", "label": "x", "type": "float", "unit": "linear", "default": 0.0}
+    spec.update(kw, mappings=mappings)
+    return spec
+
+
+def _mapping(axis="mouse.x", keys=None, buttons=None, strict=False, wheel=None, sensitivity=1.0, **action):
+    combo = {"strict": strict}
+    if keys is not None:
+        combo["keys"] = keys
+    if buttons is not None:
+        combo["mouseButtons"] = buttons
+    if wheel is not None:
+        combo["wheel"] = wheel
+    return {"combo": combo, "action": {"axis": axis, "sensitivity": sensitivity, **action}}
+
+
+def _evaluator(*controls):
+    bundle = ControlBundle.model_validate({"name": "test", "control_parameters": list(controls)})
+    return ControlEvaluator.from_bundle(bundle)
+
+
+def test_example_asset_writes_plan_slots():
+    asset = SynestheticAsset.model_validate(_load("SynestheticAsset_Example1.json"))
+    plan = compile_asset(asset)
+    ctl = ControlEvaluator.from_asset(asset)
+    assert list(ctl.slots) == list(plan.control_slot)
+    values = plan.new_buffer()
+    px, r = plan.paths.index("shader.u_px"), plan.paths.index("shader.u_r")
+
+    # strict combos: left drag moves position only, shift+left drag moves radius and detune
+    assert ctl.handle("mouse.x", 100, buttons={"left"}, values=values) == 1
+    assert ctl.target[0] == pytest.approx(0.1)
+    assert values[px] == 0.0  # smoothed: written by advance()
+    ctl.advance(0.1, values)
+    assert values[px] == pytest.approx(0.1 * (1 - math.exp(-1)))
+    assert ctl.handle("mouse.x", 10, keys={"Shift"}, buttons={"left"}, values=values) == 2
+    ctl.advance(10.0, values)
+    assert values[px] == pytest.approx(0.1)
+    assert values[r] == pytest.approx(0.6)
+    # the shift+wheel control on shader.u_r continues from the dragged value
+    assert ctl.handle("mouse.wheel", 10, keys={"Shift"}, values=values) == 1
+    ctl.advance(10.0, values)
+    assert values[r] == pytest.approx(0.7)
+    assert ctl.handle("mouse.x", 10, keys={"Shift", "Alt"}, buttons={"left"}) == 0
+
+
+def test_bundle_example_builds():
+    bundle = ControlBundle.model_validate(_load("Control-Bundle_Example.json"))
+    ctl = ControlEvaluator.from_bundle(bundle)
+    assert len(ctl) == len(bundle.control_parameters)
+    values = ctl.index.new_buffer()
+    ctl.write(values)
+
+
+def test_combo_matching():
+    ctl = _evaluator(
+        _control([_mapping(keys=["Shift"])], parameter="shader.a"),
+        _control([_mapping(keys=["Shift"], strict=True)], parameter="shader.b"),
+        _control([_mapping(axis="mouse.wheel", wheel=True)], parameter="shader.c"),
+        _control([_mapping(axis="mouse.y")], parameter="shader.d"),
+    )
+    hit = lambda *a, **kw: sorted(m.control for m in ctl.matching(*a, **kw))  # noqa: E731
+    assert hit("mouse.x", keys={"Shift"}) == [0, 1]
+    assert hit("mouse.x", keys={"Shift", "Ctrl"}) == [0]
+    assert hit("mouse.x", keys={"Shift"}, buttons={"left"}) == [0]
+    assert hit("mouse.x") == []
+    assert hit("mouse.wheel") == [2]
+    assert hit("mouse.y", keys={"Shift"}) == [3]
+    # memoised per (axis, keys, buttons)
+    assert ctl.matching("mouse.x", keys=["Shift"]) is ctl.matching("mouse.x", keys=("Shift",))
+
+
+def test_curve_clamp_step_and_types():
+    ctl = _evaluator(
+        _control([_mapping(curve="exponential", scale=2.0)], parameter="shader.a", min=-1.0, max=1.0),
+        _control([_mapping(sensitivity=0.004)], parameter="shader.b", min=0.0, max=1.0, step=0.01),
+        _control([_mapping()], parameter="shader.c", type="int", default=3, min=0, max=10),
+    )
+    values = array("d", [0.0] * 3)
+    ctl.handle("mouse.x", -0.5, values=values)
+    assert values[0] == pytest.approx(-0.5)  # -(0.5 * 0.5) * 2
+    ctl.handle("mouse.x", -5.0, values=values)
+    assert values[0] == -1.0
+    # sub-step moves accumulate instead of being snapped away
+    assert values[1] == 0.0
+    ctl.handle("mouse.x", 2.0, values=values)
+    assert values[1] == pytest.approx(0.01)
+    # int: rounded, clamped to [0, 10]
+    assert values[2] == 2.0
+    ctl.handle("mouse.x", 20.0, values=values)
+    assert values[2] == 10.0
+    ctl.handle("mouse.x", -6.6, values=values)
+    assert values[2] == 3.0
+
+
+def test_smoothing_converges_and_stops():
+    ctl = _evaluator(_control([_mapping()], smoothingTime=0.05, min=0.0, max=1.0))
+    values = array("d", [0.0])
+    ctl.handle("mouse.x", 1.0, values=values)
+    assert values[0] == 0.0
+    ctl.advance(0.05, values)
+    assert values[0] == pytest.approx(1 - math.exp(-1))
+    for _ in range(100):
+        ctl.advance(1 / 60, values)
+    assert values[0] == 1.0
+    assert not ctl._moving
+
+
+def test_unknown_axis_and_string_controls_are_ignored():
+    ctl = _evaluator(
+        _control([_mapping()], parameter="tone.type", type="string", default="sine"),
+    )
+    values = array("d", [7.0])
+    assert ctl.handle("mouse.x", 1.0, values=values) == 0
+    assert ctl.handle("gamepad.x", 1.0, values=values) == 0
+    ctl.write(values)
+    assert values[0] == 7.0
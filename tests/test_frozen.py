@@ -0,0 +1,61 @@
+import dataclasses
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "python" / "src"))
+sys.path.insert(0, str(REPO_ROOT / "codegen"))
+import py_frozen  # noqa: E402
+from synesthetic_schemas import frozen  # noqa: E402
+from synesthetic_schemas.synesthetic_asset import SynestheticAsset  # noqa: E402
+
+PKG = REPO_ROOT / "python" / "src" / "synesthetic_schemas"
+EXAMPLES = sorted((REPO_ROOT / "docs" / "examples" / "0.7.3").glob("SynestheticAsset_Example*.json"))
+
+
+def _assets():
+    for path in EXAMPLES:
+        data = {k: v for k, v in json.loads(path.read_text()).items() if not k.startswith("$")}
+        yield SynestheticAsset.model_validate(data)
+
+
+def _leaves(asset):
+    for m in asset.modulations or []:
+        yield "ModulationItem", m
+    for c in asset.control.control_parameters if asset.control else []:
+        yield "ControlParameter", c
+    for h in asset.haptic.input_parameters if asset.haptic else []:
+        yield "HapticParameter", h
+    for i in (asset.shader.input_parameters or []) if asset.shader else []:
+        yield "InputParameter", i
+
+
+def test_round_trip_is_lossless():
+    seen = set()
+    for asset in _assets():
+        for name, model in _leaves(asset):
+            twin = getattr(frozen, name).from_model(model)
+            back = twin.to_model()
+            assert type(back) is type(model)
+            assert back == model
+            assert back.model_fields_set == model.model_fields_set
+            assert back.model_dump_json(exclude_unset=True) == model.model_dump_json(exclude_unset=True)
+            seen.add(name)
+    assert seen == set(py_frozen.DEFAULT_MODELS)
+
+
+def test_twins_are_frozen_and_slotted():
+    asset = next(_assets())
+    twin = frozen.ControlParameter.from_model(asset.control.control_parameters[0])
+    assert not hasattr(twin, "__dict__")
+    assert isinstance(twin.mappings, tuple) and isinstance(twin.mappings[0], frozen.Mapping)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        twin.parameter = "other"
+    assert hash(twin) == hash(frozen.ControlParameter.from_model(asset.control.control_parameters[0]))
+
+
+def test_frozen_module_is_up_to_date():
+    assert py_frozen.render(PKG, list(py_frozen.DEFAULT_MODELS)) == (PKG / "frozen.py").read_text()
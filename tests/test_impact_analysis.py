@@ -0,0 +1,104 @@
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+import scripts.impact_analysis as impact  # noqa: E402
+from scripts.lib.schema_graph import SchemaGraph  # noqa: E402
+
+EXAMPLES = REPO_ROOT / "docs" / "examples" / "0.7.3"
+
+
+@pytest.fixture
+def trees(tmp_path):
+    old, new = tmp_path / "old", tmp_path / "new"
+    shutil.copytree(REPO_ROOT / "jsonschema", old)
+    shutil.copytree(REPO_ROOT / "jsonschema", new)
+    return old, new
+
+
+def _edit(path, fn):
+    data = json.loads(path.read_text())
+    fn(data)
+    path.write_text(json.dumps(data, indent=2))
+
+
+def _run(old, new, instances, tmp_path):
+    index = impact.PresenceIndex(tmp_path / "presence.json")
+    return impact.analyze(SchemaGraph(old, None), SchemaGraph(new, None), instances, index)
+
+
+def test_def_change_selects_instances_with_data_there(trees, tmp_path):
+    old, new = trees
+    _edit(new / "control.schema.json", lambda d: d["$defs"]["ComboType"].update(description="edited"))
+    with_control = EXAMPLES / "SynestheticAsset_Example1.json"
+    without = tmp_path / "no_control.json"
+    data = json.loads(with_control.read_text())
+    del data["control"]
+    without.write_text(json.dumps(data))
+
+    report = _run(old, new, [with_control, without, EXAMPLES / "Tone_Example.json"], tmp_path)
+    assert report["changed"] == ["control.schema.json#/$defs/ComboType"]
+    assert report["patterns"] == {
+        impact.DEFAULT_ROOT: ["/control/control_parameters/*/mappings/*/combo"],
+    }
+    assert report["selected"] == [str(with_control)]
+    # the presence index is persisted and reused
+    assert str(without.resolve()) in json.loads((tmp_path / "presence.json").read_text())
+
+
+def test_version_bump_changes_nothing(trees, tmp_path):
+    old, new = trees
+    for p in new.glob("*.schema.json"):
+        p.write_text(p.read_text().replace("/0.7.3/", "/9.9.9/"))
+    instances = sorted(EXAMPLES.glob("*.json"))
+    assert _run(old, new, instances, tmp_path) == {
+        "changed": [],
+        "patterns": {},
+        "instances": len(instances),
+        "selected": [],
+        "unparsed": [],
+    }
+
+
+def test_root_and_removed_def_changes(trees, tmp_path):
+    old, new = trees
+    _edit(new / "tone.schema.json", lambda d: d["$defs"].pop("ToneEffect") and d["properties"].pop("effects"))
+    instances = sorted(EXAMPLES.glob("*.json"))
+    report = _run(old, new, instances, tmp_path)
+    assert report["changed"] == ["tone.schema.json", "tone.schema.json#/$defs/ToneEffect"]
+    selected = {Path(p).name for p in report["selected"]}
+    # the tone root schema governs /tone of assets and the whole of tone instances
+    assert "Tone_Example.json" in selected
+    assert "Shader_Example.json" not in selected
+    for p in instances:
+        data = json.loads(p.read_text())
+        if "tone" in data and impact._root_for(data) == impact.DEFAULT_ROOT:
+            assert p.name in selected
+
+
+def test_unparsed_instances_are_selected(trees, tmp_path):
+    old, new = trees
+    broken = tmp_path / "broken.json"
+    broken.write_text('{"control": ')
+    report = _run(old, new, [broken, EXAMPLES / "Tone_Example.json"], tmp_path)
+    assert report["changed"] == []
+    assert report["selected"] == [str(broken)]
+    assert len(report["unparsed"]) == 1 and report["unparsed"][0].startswith(f"{broken}: invalid JSON: ")
+    # still selected when the error entry comes from the persisted index
+    assert _run(old, new, [broken], tmp_path)["selected"] == [str(broken)]
+
+
+def test_wildcard_patterns_match_by_length_and_prefix(tmp_path):
+    a, b = tmp_path / "a.json", tmp_path / "b.json"
+    a.write_text(json.dumps({"control": {"control_parameters": [{"mappings": [{"combo": {}}]}]}}))
+    b.write_text(json.dumps({"control": {"control_parameters": [{"mappings": [{}]}]}, "combo": 1}))
+    index = impact.PresenceIndex(None)
+    pats = {impact.DEFAULT_ROOT: {"/control/control_parameters/*/mappings/*/combo", "/*/combo"}}
+    assert impact.select([a, b], pats, index) == [a]
+    pats = {impact.DEFAULT_ROOT: {"/*"}}
+    assert impact.select([a, b], pats, index) == [a, b]
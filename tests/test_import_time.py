@@ -0,0 +1,63 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+PY_SRC = REPO_ROOT / "python" / "src"
+
+# The module-set assertions are the guard: the lazy namespace promises which modules
+# an import loads, not how long a cold interpreter takes on a loaded runner. The
+# time bound only catches gross regressions (e.g. pydantic imported eagerly).
+COLD_IMPORT_LIMIT_S = 5.0
+
+_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+{stmt}
+dt = time.perf_counter() - t0
+mods = sorted(m for m in sys.modules if m.startswith(('synesthetic_schemas', 'pydantic')))
+print(json.dumps({{'dt': dt, 'modules': mods}}))
+"""
+
+
+def _probe(stmt: str) -> dict:
+    """Run stmt in a fresh interpreter; return its wall time and loaded modules."""
+    proc = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(stmt=stmt)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(PY_SRC)},
+    )
+    return json.loads(proc.stdout)
+
+
+def test_package_import_is_lazy_and_cheap():
+    out = _probe("import synesthetic_schemas")
+    assert out["modules"] == ["synesthetic_schemas"]  # no submodule, no pydantic
+    assert out["dt"] < COLD_IMPORT_LIMIT_S
+
+
+def test_attribute_access_loads_only_needed_modules():
+    out = _probe("from synesthetic_schemas import Rule")
+    loaded = [m for m in out["modules"] if m.startswith("synesthetic_schemas")]
+    assert loaded == ["synesthetic_schemas", "synesthetic_schemas.rule"]
+    assert out["dt"] < COLD_IMPORT_LIMIT_S
+
+
+def test_namespace_exposes_models():
+    sys.path.insert(0, str(PY_SRC))
+    import synesthetic_schemas as pkg
+    from synesthetic_schemas import control, synesthetic_asset
+
+    assert pkg.SynestheticAsset is synesthetic_asset.SynestheticAsset
+    assert pkg.Control is control.Control
+    assert "ModulationItem" in pkg.__all__ and "ModulationItem" in dir(pkg)
+    for name in pkg.__all__:
+        getattr(pkg, name)
+    with pytest.raises(AttributeError):
+        pkg.NoSuchModel
@@ -0,0 +1,55 @@
+import json
+import shutil
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "python" / "src"))
+sys.path.insert(0, str(REPO_ROOT / "codegen"))
+import py_dedupe  # noqa: E402
+from synesthetic_schemas import (  # noqa: E402
+    control,
+    control_bundle,
+    haptic,
+    modulation,
+    rule,
+    rule_bundle,
+    shader,
+    synesthetic_asset,
+    tone,
+)
+
+PKG = REPO_ROOT / "python" / "src" / "synesthetic_schemas"
+EXAMPLE = REPO_ROOT / "docs" / "examples" / "0.7.3" / "SynestheticAsset_Example1.json"
+
+
+def test_asset_reuses_component_classes():
+    assert synesthetic_asset.ModulationItem is modulation.ModulationItem
+    assert synesthetic_asset.Modulation is modulation.Modulation
+    assert synesthetic_asset.Rule is rule.Rule is rule_bundle.Rule
+    assert synesthetic_asset.RuleBundle is rule_bundle.RuleBundle
+    assert synesthetic_asset.ControlParameter is control_bundle.ControlParameter
+    assert synesthetic_asset.Mapping is control_bundle.Mapping is control.Mapping
+    assert synesthetic_asset.Shader is shader.Shader
+    assert synesthetic_asset.Tone is tone.Tone
+    assert synesthetic_asset.Haptic is haptic.Haptic
+    assert synesthetic_asset.Waveform is modulation.Waveform
+
+
+def test_sub_objects_are_component_instances():
+    data = json.loads(EXAMPLE.read_text())
+    data.pop("$schema", None)
+    asset = synesthetic_asset.SynestheticAsset.model_validate(data)
+    assert isinstance(asset.shader, shader.Shader)
+    assert all(isinstance(m, modulation.ModulationItem) for m in asset.modulations or [])
+
+    # component objects drop straight into an asset without conversion
+    mod = modulation.ModulationItem.model_validate(data["modulations"][0])
+    again = synesthetic_asset.SynestheticAsset(name="x", modulations=[mod])
+    assert again.modulations[0] is mod
+
+
+def test_checked_in_models_are_deduplicated(tmp_path):
+    pkg = tmp_path / "pkg"
+    shutil.copytree(PKG, pkg)
+    assert py_dedupe.dedupe(pkg, check=True) == []
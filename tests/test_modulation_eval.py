@@ -0,0 +1,143 @@
+import math
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "python" / "src"))
+from synesthetic_schemas.modulation import ModulationItem  # noqa: E402
+from synesthetic_schemas.runtime import ModulationTable  # noqa: E402
+from synesthetic_schemas.runtime.modulation_eval import ModulationEvaluator  # noqa: E402
+
+
+def _frac(x):
+    return x - math.floor(x)
+
+
+def _reference(m, t, base=None):
+    """Scalar transcription of the definition in the module docstring."""
+    u = _frac((2 * math.pi * m.frequency * t + m.phase) / (2 * math.pi))
+    wave = {
+        "sine": math.sin(2 * math.pi * u),
+        "triangle": 1 - 4 * abs(_frac(u + 0.25) - 0.5),
+        "square": 1.0 if u < 0.5 else -1.0,
+        "sawtooth": 2 * _frac(u + 0.5) - 1,
+    }[m.waveform.value]
+    n = (wave + 1) / 2
+    n = {
+        "linear": n,
+        "exponential": n * n,
+        "logarithmic": math.sqrt(n),
+        "sine": math.sin(n * math.pi / 2),
+        "cosine": 1 - math.cos(n * math.pi / 2),
+    }[m.scaleProfile.value if m.scaleProfile else "linear"]
+    v = m.amplitude * (1 if m.scale is None else m.scale) * (2 * n - 1)
+    if m.min is not None:
+        v = max(v, m.min)
+    if m.max is not None:
+        v = min(v, m.max)
+    v += m.offset
+    if base is not None:
+        v = base + v if m.type.value == "additive" else base * v
+    return v
+
+
+def _items(n, seed=0):
+    rng = random.Random(seed)
+    items = []
+    for i in range(n):
+        data = {
+            "id": f"m{i}",
+            "target": f"visual.u_{i % 5}",
+            "type": rng.choice(["additive", "multiplicative"]),
+            "waveform": rng.choice(["sine", "triangle", "square", "sawtooth"]),
+            "frequency": rng.uniform(0.05, 8),
+            "amplitude": rng.uniform(0, 2),
+            "offset": rng.uniform(-1, 1),
+            "phase": rng.uniform(0, 2 * math.pi),
+        }
+        if rng.random() < 0.7:
+            data["scaleProfile"] = rng.choice(["linear", "exponential", "logarithmic", "sine", "cosine"])
+        if rng.random() < 0.5:
+            data["scale"] = rng.uniform(0.5, 2)
+        if rng.random() < 0.3:
+            data["min"] = -0.5
+        if rng.random() < 0.3:
+            data["max"] = 0.75
+        items.append(ModulationItem.model_validate(data))
+    return items
+
+
+def test_matches_reference_over_batch():
+    items = _items(300)
+    ev = ModulationEvaluator(ModulationTable.from_items(items))
+    times = np.array([0.0, 0.016, 0.5, 3.25, 1234.5])
+    out = np.empty((len(times), len(items)))
+    assert ev.evaluate(times, out) is out
+    want = np.array([[_reference(m, t) for m in items] for t in times])
+    np.testing.assert_allclose(out, want, rtol=0, atol=1e-9)
+
+
+def test_single_frame_and_base():
+    items = _items(64, seed=1)
+    ev = ModulationEvaluator(ModulationTable.from_items(items))
+    base = np.linspace(-1, 1, len(items))
+    out = np.empty(len(items))
+    ev.evaluate(2.0, out, base=base)
+    want = [_reference(m, 2.0, b) for m, b in zip(items, base)]
+    np.testing.assert_allclose(out, want, rtol=0, atol=1e-9)
+
+
+
+def test_numpy_scalar_timestamps_are_single_frames():
+    ev = ModulationEvaluator(ModulationTable.from_items(_items(16, seed=3)))
+    want = ev.evaluate(2.0, np.empty(len(ev))).copy()
+    times = np.array([1.0, 2.0], dtype=np.float32)
+    for t in (np.float32(2.0), np.float64(2.0), times[1], np.array(2.0)):
+        np.testing.assert_array_equal(ev.evaluate(t, np.empty(len(ev))), want)
+
+def test_no_array_allocation_after_first_call():
+    ev = ModulationEvaluator(ModulationTable.from_items(_items(1000, seed=2)))
+    out = np.empty(len(ev))
+    ev.evaluate(0.0, out)
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        for k in range(20):
+            ev.evaluate(k / 60.0, out)
+        peak = tracemalloc.get_traced_memory()[1] - start
+    finally:
+        tracemalloc.stop()
+    assert peak < out.nbytes  # only small view objects, never a (n,) buffer
+
+
+def test_rejects_bad_out_buffer():
+    ev = ModulationEvaluator(ModulationTable.from_items(_items(4)))
+    with pytest.raises(ValueError):
+        ev.evaluate(np.zeros(2), np.empty((2, 5)))
+    with pytest.raises(ValueError):
+        ev.evaluate(0.0, np.empty(4, dtype=np.float32))
+
+
+def test_empty_table():
+    ev = ModulationEvaluator(ModulationTable())
+    assert ev.evaluate(np.zeros(3), np.empty((3, 0))).shape == (3, 0)
+
+
+def test_min_max_bound_the_modulation_term():
+    # filter_sweep from modulation.schema.json: offset is the base, min/max bound the sweep
+    item = ModulationItem.model_validate({
+        "id": "filter_sweep", "target": "tone.filter.frequency", "type": "additive",
+        "waveform": "triangle", "frequency": 0.25, "amplitude": 400, "offset": 800,
+        "phase": 0, "scale": 1, "scaleProfile": "exponential", "min": 0, "max": 1,
+    })
+    ev = ModulationEvaluator(ModulationTable.from_items([item]))
+    times = np.array([0.0, 1.0, 2.0, 3.0])  # u = 0, 1/4, 1/2, 3/4
+    out = ev.evaluate(times, np.empty((4, 1)))
+    np.testing.assert_allclose(out[:, 0], [800.0, 801.0, 800.0, 800.0], rtol=0, atol=1e-9)
+    np.testing.assert_allclose(out[:, 0], [_reference(item, t) for t in times], rtol=0, atol=1e-9)
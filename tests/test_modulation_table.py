@@ -0,0 +1,92 @@
+import json
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "python" / "src"))
+from synesthetic_schemas.modulation import Modulation, ModulationItem  # noqa: E402
+from synesthetic_schemas.runtime import ModulationTable  # noqa: E402
+from synesthetic_schemas.synesthetic_asset import SynestheticAsset  # noqa: E402
+
+EXAMPLES = REPO_ROOT / "docs" / "examples" / "0.7.3"
+
+
+def _load(path):
+    return {k: v for k, v in json.loads(path.read_text()).items() if not k.startswith("$")}
+
+
+def _item(**overrides):
+    data = {
+        "id": "m",
+        "target": "visual.u_x",
+        "type": "additive",
+        "waveform": "sine",
+        "frequency": 1,
+        "amplitude": 0.5,
+        "offset": 0,
+        "phase": 0,
+    }
+    data.update(overrides)
+    return ModulationItem.model_validate(data)
+
+
+def test_round_trip_examples():
+    seen = 0
+    for path in sorted(EXAMPLES.glob("SynestheticAsset_Example*.json")):
+        asset = SynestheticAsset.model_validate(_load(path))
+        table = ModulationTable.from_model(asset)
+        items = table.to_items()
+        assert items == (asset.modulations or [])
+        for got, want in zip(items, asset.modulations or []):
+            assert got.model_fields_set == want.model_fields_set
+            assert got.model_dump_json() == want.model_dump_json()
+            assert got.model_dump_json(exclude_unset=True) == want.model_dump_json(exclude_unset=True)
+        seen += len(items)
+    assert seen
+
+
+def test_modulation_example_and_columns():
+    asset = _load(EXAMPLES / "SynestheticAsset_Example1.json")
+    mod = Modulation.model_validate({"name": "mods", "modulations": asset["modulations"]})
+    table = ModulationTable.from_model(mod)
+    assert len(table) == len(mod.modulations)
+    assert list(table.frequency) == [m.frequency for m in mod.modulations]
+    assert [table.targets[c] for c in table.target] == [m.target for m in mod.modulations]
+    assert table.to_items() == mod.modulations
+
+
+def test_none_unset_and_shared_targets():
+    items = [
+        _item(),  # scale unset (default 1), min/max None
+        _item(id="n", scale=2, min=None, max=1, scaleProfile="exponential"),
+        _item(id="o", target="tone.volume", waveform="square", type="multiplicative"),
+    ]
+    table = ModulationTable.from_items(items)
+    assert math.isnan(table.min[0]) and math.isnan(table.max[0])
+    assert list(table.scale_profile) == [-1, 1, -1]
+    assert table.targets == ["visual.u_x", "tone.volume"]
+    assert table.rows_for_target("visual.u_x") == [0, 1]
+    assert table.rows_for_target("missing") == []
+    back = table.to_items()
+    assert back == items
+    assert [b.model_fields_set for b in back] == [i.model_fields_set for i in items]
+    assert back[0].model_dump_json() == items[0].model_dump_json()  # scale stays the int default
+
+
+def test_numpy_views_share_memory():
+    np = pytest.importorskip("numpy")
+    table = ModulationTable.from_items([_item(), _item(id="n", frequency=2)])
+    cols = table.numpy()
+    assert cols["frequency"].dtype == np.float64
+    assert cols["waveform"].dtype == np.uint8
+    assert cols["frequency"].tolist() == [1.0, 2.0]
+    table.frequency[1] = 3.0
+    assert cols["frequency"][1] == 3.0
+
+
+def test_empty_asset():
+    table = ModulationTable.from_model(SynestheticAsset.model_construct(modulations=None))
+    assert len(table) == 0 and table.to_items() == []
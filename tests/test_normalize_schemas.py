@@ -0,0 +1,80 @@
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+import normalize_schemas  # noqa: E402
+
+
+def _dirty(schema_dir):
+    """Copy of jsonschema/ with stale headers, a root description and odd formatting."""
+    shutil.copytree(REPO_ROOT / "jsonschema", schema_dir)
+    for i, p in enumerate(sorted(schema_dir.glob("*.schema.json"))):
+        data = json.loads(p.read_text())
+        data["description"] = "stale"
+        data["$id"] = f"{normalize_schemas.BASE_URL}/0.0.1/{p.name}"
+        p.write_text(json.dumps(data, indent=i % 3))
+
+
+def _snapshot(schema_dir):
+    return {p.name: p.read_bytes() for p in sorted(schema_dir.glob("*.schema.json"))}
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    monkeypatch.setattr(normalize_schemas, "SCHEMA_DIR", tmp_path / "jsonschema")
+    monkeypatch.setattr(normalize_schemas, "CACHE_FILE", tmp_path / ".cache" / "state.json")
+    monkeypatch.setattr(normalize_schemas, "GRAPH_FILE", tmp_path / ".cache" / "schema_graph.json")
+    return tmp_path / "jsonschema"
+
+
+def test_parallel_matches_serial(tree, tmp_path):
+    _dirty(tree)
+    assert normalize_schemas.main(["--check", "--no-cache"]) == 1
+    assert normalize_schemas.main(["--no-cache"]) == 0
+    serial = _snapshot(tree)
+    assert serial == _snapshot(REPO_ROOT / "jsonschema")
+
+    shutil.rmtree(tree)
+    _dirty(tree)
+    assert normalize_schemas.main(["--jobs", "3"]) == 0
+    assert _snapshot(tree) == serial
+    assert normalize_schemas.main(["--check", "--jobs", "3"]) == 0
+
+
+def test_unchanged_files_are_skipped(tree, capsys, monkeypatch):
+    shutil.copytree(REPO_ROOT / "jsonschema", tree)
+    assert normalize_schemas.main(["--check"]) == 0
+    uncached = capsys.readouterr().out
+    calls = []
+    real = normalize_schemas._process
+    monkeypatch.setattr(normalize_schemas, "_process", lambda fp, raw: calls.append(fp.name) or real(fp, raw))
+
+    assert normalize_schemas.main(["--check"]) == 0
+    assert calls == []
+    captured = capsys.readouterr()
+    assert "9 unchanged file(s) skipped" in captured.err
+    # per-file status lines are printed for skipped files too
+    assert captured.out == uncached
+
+    target = tree / "rule.schema.json"
+    data = json.loads(target.read_text())
+    data["description"] = "edited"
+    target.write_text(json.dumps(data))
+    assert normalize_schemas.main(["--check"]) == 1
+    assert calls == ["rule.schema.json"]
+    # a failing file is not recorded, so it is checked again
+    assert normalize_schemas.main(["--check"]) == 1
+    assert calls == ["rule.schema.json"] * 2
+
+
+def test_check_fail_fast(tree, capsys):
+    _dirty(tree)
+    assert normalize_schemas.main(["--check", "--fail-fast", "--no-cache"]) == 1
+    out = capsys.readouterr().out
+    assert out.count("not normalized") == 1
+    assert "❌ not normalized: control-bundle.schema.json" in out
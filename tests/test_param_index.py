@@ -0,0 +1,69 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "python" / "src"))
+from synesthetic_schemas.runtime import ModulationTable, ParameterIndex  # noqa: E402
+from synesthetic_schemas.runtime.param_index import NO_SLOT, canonical_path  # noqa: E402
+from synesthetic_schemas.synesthetic_asset import SynestheticAsset  # noqa: E402
+
+EXAMPLES = REPO_ROOT / "docs" / "examples" / "0.7.3"
+
+
+def _asset(name):
+    data = json.loads((EXAMPLES / name).read_text())
+    return SynestheticAsset.model_validate({k: v for k, v in data.items() if not k.startswith("$")})
+
+
+def test_canonical_path():
+    assert canonical_path("shader.u_r") == "shader.u_r"
+    assert canonical_path("visual.u_r") == "shader.u_r"
+    assert canonical_path("audio.filter.frequency") == "tone.filter.frequency"
+    assert canonical_path("u_r", "shader") == "shader.u_r"
+    assert canonical_path("u_r") == "u_r"
+
+
+def test_declared_slots_and_references():
+    asset = _asset("SynestheticAsset_Example1.json")
+    index = ParameterIndex.from_asset(asset)
+    shader_paths = [f"shader.{p.path}" for p in asset.shader.input_parameters]
+    assert index.paths[: len(shader_paths)] == shader_paths
+    assert index.slot("u_r") == index.slot("shader.u_r") == index.slot("visual.u_r")
+    assert [index.paths[s] for s in index.modulation_slots] == [
+        canonical_path(m.target) for m in asset.modulations
+    ]
+    assert [index.paths[s] for s in index.control_slots] == [
+        canonical_path(c.parameter) for c in asset.control.control_parameters
+    ]
+    rule = asset.rule_bundle.rules[0]
+    a, b = index.effect_offsets[0], index.effect_offsets[1]
+    assert [index.paths[s] for s in index.effect_slots[a:b]] == [
+        canonical_path(e["target"]) for e in rule.effects
+    ]
+    assert index.rule_target_slots[0] == NO_SLOT
+    assert index.undeclared() == ["tone.poly.trigger"]
+    assert len(index.new_buffer()) == len(index)
+
+
+def test_bare_reference_resolves_to_declaration():
+    index = ParameterIndex.from_asset(_asset("SynestheticAsset_Example3.json"))
+    assert index.paths[index.modulation_slots[0]] == "shader.u_r"
+    assert index.slot("u_r") < index.declared
+
+
+def test_modulation_table_targets():
+    asset = _asset("SynestheticAsset_Example2.json")
+    index = ParameterIndex.from_asset(asset)
+    table = ModulationTable.from_model(asset)
+    per_row = [index.slots(table.targets)[c] for c in table.target]
+    assert per_row == list(index.modulation_slots)
+
+
+def test_strict_rejects_unresolved():
+    with pytest.raises(KeyError, match="rule_bundle.rules\\[0\\].effects\\[0\\].target"):
+        ParameterIndex.from_asset(_asset("SynestheticAsset_Example1.json"), strict=True)
+    with pytest.raises(KeyError):
+        ParameterIndex().slot("shader.missing")
@@ -0,0 +1,75 @@
+import json
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "python" / "src"))
+from synesthetic_schemas.runtime import ParameterIndex  # noqa: E402
+from synesthetic_schemas.runtime.plan import COLUMNS, RuntimePlan, compile_asset  # noqa: E402
+from synesthetic_schemas.synesthetic_asset import SynestheticAsset  # noqa: E402
+
+EXAMPLES = sorted((REPO_ROOT / "docs" / "examples" / "0.7.3").glob("SynestheticAsset_Example*.json"))
+
+
+def _asset(path):
+    data = json.loads(path.read_text())
+    return SynestheticAsset.model_validate({k: v for k, v in data.items() if not k.startswith("$")})
+
+
+def _same(a, b):
+    return len(a) == len(b) and all(x == y or (math.isnan(x) and math.isnan(y)) for x, y in zip(a, b))
+
+
+@pytest.mark.parametrize("path", EXAMPLES, ids=lambda p: p.stem)
+def test_blob_round_trip(path, tmp_path):
+    asset = _asset(path)
+    plan = compile_asset(asset)
+    dest = tmp_path / "asset.plan"
+    plan.save(dest)
+    with RuntimePlan.load(dest) as loaded:
+        assert loaded.meta == plan.meta
+        for name in COLUMNS:
+            assert _same(plan.columns[name], loaded.columns[name]), name
+        assert isinstance(loaded.default, memoryview)
+        assert loaded.modulation_table().to_items() == (asset.modulations or [])
+        assert loaded.to_bytes() == dest.read_bytes()
+
+
+def test_slot_defaults_and_mappings():
+    asset = _asset(REPO_ROOT / "docs" / "examples" / "0.7.3" / "SynestheticAsset_Example1.json")
+    plan = compile_asset(asset)
+    index = ParameterIndex.from_asset(asset)
+    assert plan.paths == index.paths
+    values = plan.new_buffer()
+    for p in asset.shader.input_parameters:
+        slot = index.slot(f"shader.{p.path}")
+        assert values[slot] == p.default
+        assert (plan.min[slot], plan.max[slot]) == (p.min, p.max)
+    assert list(plan.control_slot) == list(index.control_slots)
+    assert list(plan.mod_slot) == list(index.modulation_slots)
+    assert list(plan.rule_effect_slots(0)) == list(index.effect_slots)
+    assert plan.meta["rules"][0]["id"] == asset.rule_bundle.rules[0].id
+    # referenced-only slot (a rule's audio trigger) starts at zero
+    assert values[index.slot("audio.poly.trigger")] == 0.0
+
+
+def test_rejects_foreign_blob():
+    with pytest.raises(ValueError, match="magic"):
+        RuntimePlan.from_bytes(b"\0" * 64)
+
+
+def test_close_with_outstanding_slice(tmp_path):
+    plan = compile_asset(_asset(REPO_ROOT / "docs" / "examples" / "0.7.3" / "SynestheticAsset_Example1.json"))
+    dest = tmp_path / "asset.plan"
+    plan.save(dest)
+    loaded = RuntimePlan.load(dest)
+    held = loaded.rule_effect_slots(0)
+    expected = list(plan.rule_effect_slots(0))
+    loaded.close()  # must not raise BufferError
+    # the held view stays readable until it is dropped
+    assert list(held) == expected
+    loaded.close()
+    del held
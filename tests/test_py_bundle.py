@@ -0,0 +1,97 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "codegen"))
+import py_bundle  # noqa: E402
+
+SCHEMAS = REPO_ROOT / "jsonschema"
+ASSET = "synesthetic-asset.schema.json"
+GOLDENS = REPO_ROOT / "tests" / "fixtures" / "ts_bundle"
+
+
+def _refs(node, at=""):
+    if isinstance(node, dict):
+        for k, v in node.items():
+            if k == "$ref":
+                yield at, v
+            else:
+                yield from _refs(v, f"{at}/{k}")
+    elif isinstance(node, list):
+        for i, v in enumerate(node):
+            yield from _refs(v, f"{at}/{i}")
+
+
+def _resolve(doc, ref):
+    node = doc
+    for seg in ref[2:].split("/"):
+        node = node[int(seg)] if isinstance(node, list) else node[seg]
+    return node
+
+
+def test_asset_bundle_is_self_contained():
+    bundler = py_bundle.Bundler(SCHEMAS)
+    bundled = bundler.bundle(ASSET)
+    refs = dict(_refs(bundled))
+    assert refs and all(ref.startswith("#/") and "%24" not in ref for ref in refs.values())
+    for ref in refs.values():
+        _resolve(bundled, ref)
+    # the first $ref to a file inlines it; refs into it point beneath that location
+    modulation = json.loads((SCHEMAS / "modulation.schema.json").read_text())
+    assert bundled["properties"]["modulation"]["anyOf"][0]["$id"] == modulation["$id"]
+    assert refs["/properties/modulations/anyOf/0/items"] == "#/properties/modulation/anyOf/0/$defs/ModulationItem"
+    control = "/properties/control/anyOf/0/properties/control_parameters/items"
+    assert refs[f"{control}/properties/mappings/items"] == f"#{control}/$defs/Mapping"
+
+
+@pytest.mark.parametrize("name", sorted(p.name for p in SCHEMAS.glob("*.schema.json")))
+def test_matches_ts_bundle_output(name):
+    golden = GOLDENS / name
+    if not golden.exists():
+        pytest.fail(f"no ts_bundle.mjs output for {name}; run `make bundle-goldens` and commit it")
+    assert py_bundle.dump(py_bundle.Bundler(SCHEMAS).bundle(name)) == golden.read_text(encoding="utf-8")
+
+
+def test_single_file_schemas_are_unchanged_and_runs_do_not_leak():
+    bundler = py_bundle.Bundler(SCHEMAS)
+    bundler.bundle(ASSET)
+    for name in ("tone.schema.json", "control.schema.json"):
+        assert bundler.bundle(name) == json.loads((SCHEMAS / name).read_text())
+
+
+def test_def_only_ref_is_inlined_at_first_use(tmp_path):
+    base = "https://example.test/s/"
+    (tmp_path / "a.schema.json").write_text(json.dumps({
+        "$id": base + "a.schema.json",
+        "properties": {
+            "long_name": {"$ref": base + "b.schema.json#/$defs/B"},
+            "x": {"items": {"$ref": base + "b.schema.json#/$defs/B"}},
+        },
+    }))
+    (tmp_path / "b.schema.json").write_text(json.dumps({
+        "$id": base + "b.schema.json",
+        "$defs": {"B": {"properties": {"c": {"$ref": "#/$defs/C"}}}, "C": {"type": "string"}},
+    }))
+    bundled = py_bundle.Bundler(tmp_path).bundle("a.schema.json")
+    # shallowest use wins; C is only reachable through B, so it lands beneath B's first use
+    assert bundled["properties"]["long_name"]["properties"]["c"] == {"type": "string"}
+    assert bundled["properties"]["x"]["items"] == {"$ref": "#/properties/long_name"}
+
+
+@pytest.mark.parametrize(
+    "value, text",
+    [
+        (1.0, "1"),
+        (-2.0, "-2"),
+        (0.25, "0.25"),
+        (1e-5, "0.00001"),
+        (1.5e-7, "1.5e-7"),
+        (1e21, "1e+21"),
+        (123456789012345680000.0, "123456789012345680000"),
+    ],
+)
+def test_numbers_print_like_json_stringify(value, text):
+    assert py_bundle.dump({"n": value}) == '{\n  "n": ' + text + "\n}\n"
@@ -0,0 +1,87 @@
+import json
+import sys
+from array import array
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "python" / "src"))
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+import convert_legacy_rule_bundles  # noqa: E402
+from synesthetic_schemas.runtime import compile_asset  # noqa: E402
+from synesthetic_schemas.runtime.curves import curve  # noqa: E402
+from synesthetic_schemas.runtime.rules import RuleEngine  # noqa: E402
+from synesthetic_schemas.synesthetic_asset import SynestheticAsset  # noqa: E402
+
+EXAMPLE = REPO_ROOT / "docs" / "examples" / "0.7.3" / "SynestheticAsset_Example1.json"
+
+
+def _engine(rules, n_slots=4):
+    slots, offsets = array("I"), array("I", [0])
+    for rule in rules:
+        for _ in rule.get("effects") or ():
+            slots.append(len(slots) % n_slots)
+        offsets.append(len(slots))
+    return RuleEngine(rules, slots, offsets)
+
+
+def test_converted_bundle_end_to_end():
+    data = json.loads(EXAMPLE.read_text())
+    asset = SynestheticAsset.model_validate({k: v for k, v in data.items() if not k.startswith("$")})
+    plan = compile_asset(asset)
+    engine = RuleEngine.from_plan(plan)
+    values = plan.new_buffer()
+    r = plan.paths.index("shader.u_r")
+    h = plan.paths.index("haptic.intensity")
+    before = values[r]
+
+    fired = engine.dispatch("grid_cell", {"grid.pressure": 0.5, "grid.note": "C4"}, values, now_ms=0)
+    assert [(t.channel, t.note, t.duration, t.velocity) for t in fired] == [("audioTrigger", "C4", "8n", 0.5)]
+    assert values[h] == 0.5
+    assert values[r] == pytest.approx(before + 0.05)
+
+    # within the 100 ms cooldown nothing fires
+    assert engine.dispatch("grid_cell", {"grid.pressure": 0.9}, values, now_ms=50) == []
+    assert values[h] == 0.5
+    # other trigger types / signals do not touch the rule
+    assert engine.affected("key_down", ["grid.pressure"]) == []
+    assert engine.affected("grid_cell", ["mouse.x"]) == []
+    assert RuleEngine.from_asset(asset).affected("grid_cell", ["grid.pressure"]) == [engine._rules[0].id]
+
+
+def test_threshold_and_curve():
+    rules = [convert_legacy_rule_bundles.convert({"type": "sdfGrid", "curve": ["exp"], "threshold": [0.2]})["rules"][0]]
+    engine = _engine(rules)
+    values = array("d", [0.0] * 4)
+    assert engine.dispatch("grid_cell", {"grid.pressure": 0.1, "grid.note": "C4"}, values) == []
+    (t,) = engine.dispatch("grid_cell", {"grid.pressure": 0.5, "grid.note": "C4"}, values)
+    assert t.velocity == pytest.approx(curve("exp")(0.5))
+
+
+def test_dispatch_by_source_and_constants():
+    rules = [
+        {"id": "a", "trigger": {"type": "key"}, "effects": [{"op": "add", "target": "x", "value": {"source": "k.a"}}]},
+        {"id": "b", "trigger": {"type": "key"}, "effects": [{"op": "set", "target": "y", "value": {"source": "k.b"}}]},
+        {"id": "c", "trigger": {"type": "key"}, "effects": [{"op": "set", "target": "z", "value": 2}]},
+        {"id": "d", "trigger": {"type": "wheel"}, "effects": [{"op": "add", "target": "x", "value": {"source": "k.a"}}]},
+        {"id": "e", "effects": [{"op": "set", "target": "x", "value": 9}]},  # no trigger: never dispatched
+    ]
+    engine = _engine(rules)
+    assert engine.trigger_types() == ["key", "wheel"]
+    assert engine.affected("key", ["k.b"]) == ["b", "c"]
+    assert engine.affected("key", ["k.a", "k.b"]) == ["a", "b", "c"]
+    values = array("d", [0.0] * 4)
+    engine.dispatch("key", {"k.a": 1.5}, values)
+    assert list(values) == [1.5, 0.0, 2.0, 0.0]
+
+
+def test_rejects_unknown_op_and_curve():
+    bad_op = [{"id": "x", "trigger": {"type": "t"}, "effects": [{"op": "explode", "target": "x", "value": 1}]}]
+    with pytest.raises(ValueError, match="unsupported op"):
+        _engine(bad_op)
+    bad_curve = [
+        {"id": "x", "trigger": {"type": "t"}, "effects": [{"op": "set", "target": "x", "value": {"source": "s", "curve": "wobbly"}}]}
+    ]
+    with pytest.raises(ValueError, match="unknown curve"):
+        _engine(bad_curve)
@@ -0,0 +1,93 @@
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+import scripts.lib.schema_graph as schema_graph  # noqa: E402
+import scripts.schema_lint as schema_lint  # noqa: E402
+from scripts.lib.schema_graph import SchemaGraph  # noqa: E402
+
+ASSET = "synesthetic-asset.schema.json"
+
+
+@pytest.fixture
+def schemas(tmp_path):
+    shutil.copytree(REPO_ROOT / "jsonschema", tmp_path / "jsonschema")
+    return tmp_path / "jsonschema"
+
+
+def _walks(monkeypatch):
+    calls = []
+    real = schema_graph._entry
+    monkeypatch.setattr(
+        schema_graph, "_entry", lambda raw, sig, digest: calls.append(digest) or real(raw, sig, digest)
+    )
+    return calls
+
+
+def test_graph_edges(schemas, tmp_path):
+    graph = SchemaGraph(schemas, tmp_path / "graph.json")
+    assert graph.files == sorted(p.name for p in schemas.glob("*.schema.json"))
+    for name in graph.files:
+        assert graph.ids[graph.id_of(name)] == name
+    assert "control-bundle.schema.json" in graph.dependencies(ASSET)
+    assert graph.dependents("control.schema.json") == ["control-bundle.schema.json"]
+    assert graph.dependents("control.schema.json", transitive=True) == ["control-bundle.schema.json", ASSET]
+    assert graph.store()[graph.id_of(ASSET)] == json.loads((schemas / ASSET).read_text())
+    # every absolute $ref resolves to a file, and $defs usage counts internal refs
+    for name in graph.files:
+        assert graph.broken(name) == [] and graph.missing(name) == []
+    control = "control.schema.json"
+    internal = [r for r in graph.refs(control) if r.kind == "internal"]
+    assert internal
+    assert sum(graph.def_usage[(control, d)] for d in graph.defs(control)) == len(internal)
+
+
+def test_incremental_refresh(schemas, tmp_path, monkeypatch):
+    cache = tmp_path / "graph.json"
+    SchemaGraph(schemas, cache)
+    calls = _walks(monkeypatch)
+
+    graph = SchemaGraph(schemas, cache)
+    assert calls == []
+
+    # touched but unchanged: re-hashed, not re-walked
+    os.utime(schemas / "rule.schema.json", ns=(1, 1))
+    graph.refresh()
+    assert calls == []
+
+    target = schemas / "control.schema.json"
+    data = json.loads(target.read_text())
+    data["$defs"]["Extra"] = {"$ref": "#/$defs/Missing"}
+    target.write_text(json.dumps(data))
+    graph.refresh()
+    assert len(calls) == 1
+    assert graph.broken("control.schema.json") == ["#/$defs/Missing"]
+    assert graph.def_usage[("control.schema.json", "Missing")] == 1
+    assert graph.document("control.schema.json")["$defs"]["Extra"]
+
+    (schemas / "rule.schema.json").unlink()
+    graph.refresh()
+    assert "rule.schema.json" not in graph.files
+    # a fresh process sees the persisted state
+    assert SchemaGraph(schemas, cache).broken("control.schema.json") == ["#/$defs/Missing"]
+    assert len(calls) == 1
+
+
+def test_lint_reports_from_graph(schemas, tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(schema_lint, "SCHEMAS", schemas)
+    monkeypatch.setattr(schema_lint, "SchemaGraph", lambda d: SchemaGraph(d, tmp_path / "graph.json"))
+    assert schema_lint.lint() == 0
+    data = json.loads((schemas / ASSET).read_text())
+    data["properties"]["broken"] = {"$ref": "https://schemas.synesthetic.dev/0.7.3/nope.schema.json"}
+    (schemas / ASSET).write_text(json.dumps(data))
+    (schemas / "bad.schema.json").write_text("{")
+    assert schema_lint.lint() == 1
+    out = capsys.readouterr().out
+    assert "missing absolute $ref target in store for synesthetic-asset.schema.json" in out
+    assert "invalid JSON in bad.schema.json" in out
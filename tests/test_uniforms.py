@@ -0,0 +1,105 @@
+import json
+import struct
+import sys
+from array import array
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "python" / "src"))
+from synesthetic_schemas.runtime import UniformLayout, compile_asset  # noqa: E402
+from synesthetic_schemas.synesthetic_asset import SynestheticAsset  # noqa: E402
+
+EXAMPLE = REPO_ROOT / "docs" / "examples" / "0.7.3" / "SynestheticAsset_Example1.json"
+
+
+def _uniform(name, kind, default=0, stage="fragment"):
+    return {"name": name, "type": kind, "default": default, "stage": stage}
+
+
+def test_std140_offsets():
+    layout = UniformLayout(
+        [
+            _uniform("a", "float"),
+            _uniform("b", "vec3"),
+            _uniform("c", "float"),  # packs into the tail of b
+            _uniform("d", "vec2"),
+            _uniform("e", "int"),
+            _uniform("f", "mat3", 1.0),
+            _uniform("g", "vec4"),
+            _uniform("tex", "sampler2D", None),
+            _uniform("h", "mat2"),
+        ]
+    )
+    offsets = {f.name: (f.offset, f.size) for f in layout.fields}
+    assert offsets == {
+        "a": (0, 4),
+        "b": (16, 12),
+        "c": (28, 4),
+        "d": (32, 8),
+        "e": (40, 4),
+        "f": (48, 48),
+        "g": (96, 16),
+        "h": (112, 32),
+    }
+    assert layout.skipped == ["tex"]
+    assert layout.size == 144
+    buf = layout.new_buffer()
+    assert len(buf) == 144
+    # mat3(1.0): identity, one 16-byte column each
+    assert [struct.unpack_from("<3f", buf, 48 + 16 * c) for c in range(3)] == [
+        (1.0, 0.0, 0.0),
+        (0.0, 1.0, 0.0),
+        (0.0, 0.0, 1.0),
+    ]
+
+
+def test_defaults_and_set():
+    layout = UniformLayout(
+        [_uniform("bg", "vec3", "#ff8000"), _uniform("res", "vec2", [800, 600]), _uniform("n", "int", 5)]
+    )
+    buf = layout.new_buffer()
+    assert struct.unpack_from("<3f", buf, 0) == pytest.approx((1.0, 128 / 255, 0.0))
+    assert struct.unpack_from("<2fi", buf, 16) == (800.0, 600.0, 5)
+    layout.set("res", [1920, 1080])
+    layout.write(buf)
+    assert struct.unpack_from("<2f", buf, 16) == (1920.0, 1080.0)
+    with pytest.raises(ValueError, match="does not fit"):
+        layout.set("res", [1, 2, 3])
+    with pytest.raises(ValueError, match="unsupported type"):
+        UniformLayout([_uniform("x", "dvec2")])
+
+
+def test_asset_binding_writes_in_place():
+    data = json.loads(EXAMPLE.read_text())
+    asset = SynestheticAsset.model_validate({k: v for k, v in data.items() if not k.startswith("$")})
+    plan = compile_asset(asset)
+    layout = UniformLayout.from_asset(asset)
+    bound = {f.name: f.slot for f in layout.fields if f.slot is not None}
+    assert bound == {n: plan.paths.index(f"shader.{n}") for n in ("u_px", "u_py", "u_r")}
+
+    values = plan.new_buffer()
+    values[bound["u_r"]] = 0.75
+    block = bytearray(16 + layout.size)
+    view = memoryview(block)
+    layout.set("u_time", 2.0)
+    layout.write(view, values, offset=16)
+    assert block[:16] == bytes(16)
+    r = layout.field("u_r")
+    assert struct.unpack_from("<f", block, 16 + r.offset) == (0.75,)
+    assert struct.unpack_from("<f", block, 16) == (2.0,)
+    # slot values are read on every write
+    values[bound["u_r"]] = 0.25
+    layout.write(view, values, offset=16)
+    assert struct.unpack_from("<f", block, 16 + r.offset) == (0.25,)
+
+
+def test_integer_binding():
+    layout = UniformLayout([_uniform("n", "int", 1), _uniform("on", "bool", False)], {"n": 0, "on": 1})
+    buf = layout.new_buffer()
+    layout.write(buf, array("d", [7.0, 1.0]))
+    assert struct.unpack_from("<iI", buf, 0) == (7, 1)
+    # NaN marks a slot with no value (RuntimePlan columns); integer members pack it as 0
+    layout.write(buf, array("d", [float("nan"), float("nan")]))
+    assert struct.unpack_from("<iI", buf, 0) == (0, 0)
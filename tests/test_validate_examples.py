@@ -0,0 +1,166 @@
+import io
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+import validate_examples  # noqa: E402
+
+EXAMPLES = REPO_ROOT / "docs" / "examples" / "0.7.3"
+
+
+@pytest.fixture
+def mixed_dir(tmp_path):
+    """Valid examples plus a file that is not JSON and one that fails the schema."""
+    d = tmp_path / "examples"
+    d.mkdir()
+    for p in sorted(EXAMPLES.glob("*.json")):
+        shutil.copy(p, d / p.name)
+    (d / "Broken_Example.json").write_text("{not json")
+    data = json.loads((EXAMPLES / "SynestheticAsset_Example1.json").read_text())
+    data["modulations"][0]["frequency"] = "fast"
+    (d / "SynestheticAsset_Invalid.json").write_text(json.dumps(data))
+    return d
+
+
+def _run(monkeypatch, capsys, *args):
+    """main() with argv; returns (exit code, stdout, stderr)."""
+    monkeypatch.setattr(sys, "argv", ["validate_examples.py", *args])
+    code = validate_examples.main()
+    captured = capsys.readouterr()
+    return code, captured.out, captured.err
+
+
+def test_jobs_output_matches_serial(mixed_dir, monkeypatch, capsys):
+    code, out, _ = _run(monkeypatch, capsys, "--dir", str(mixed_dir), "--strict", "--no-cache")
+    assert code == 1
+    assert "Broken_Example.json: invalid JSON" in out
+    assert "SynestheticAsset_Invalid.json: JSON Schema validation failed" in out
+    for jobs in ("2", "3"):
+        args = ("--dir", str(mixed_dir), "--strict", "--no-cache", "--jobs", jobs)
+        assert _run(monkeypatch, capsys, *args)[:2] == (code, out)
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    d = tmp_path / "cache"
+    monkeypatch.setattr(validate_examples, "RESULT_CACHE_DIR", d)
+    return d
+
+
+def _entries(cache_dir):
+    return sorted(cache_dir.glob("*/*.json"))
+
+
+def _count(d):
+    return len(list(d.glob("*.json")))
+
+
+def test_cache_hit_on_second_run(mixed_dir, cache_dir, monkeypatch, capsys):
+    n = _count(mixed_dir)
+    first = _run(monkeypatch, capsys, "--dir", str(mixed_dir), "--strict")
+    assert f"result cache: 0 hit(s), {n} miss(es)" in first[2]
+    assert len(_entries(cache_dir)) == n
+
+    calls = []
+    real = validate_examples.validate_file
+    monkeypatch.setattr(validate_examples, "validate_file", lambda f, **kw: calls.append(f) or real(f, **kw))
+    second = _run(monkeypatch, capsys, "--dir", str(mixed_dir), "--strict")
+    assert f"result cache: {n} hit(s), 0 miss(es)" in second[2]
+    assert calls == []
+    assert second[:2] == first[:2]
+
+
+def test_cache_misses_on_changed_bytes_and_settings(mixed_dir, cache_dir, monkeypatch, capsys):
+    n = _count(mixed_dir)
+    _run(monkeypatch, capsys, "--dir", str(mixed_dir), "--strict")
+    target = mixed_dir / "Tone_Example.json"
+    target.write_bytes(target.read_bytes() + b"\n")
+    assert f"{n - 1} hit(s), 1 miss(es)" in _run(monkeypatch, capsys, "--dir", str(mixed_dir), "--strict")[2]
+
+    # strict/level are part of the key
+    assert f"0 hit(s), {n} miss(es)" in _run(monkeypatch, capsys, "--dir", str(mixed_dir))[2]
+    assert f"0 hit(s), {n} miss(es)" in _run(monkeypatch, capsys, "--dir", str(mixed_dir), "--strict", "--level", "schema")[2]
+
+    # so is the schema set
+    monkeypatch.setattr(validate_examples, "_schema_set_digest", lambda: "edited")
+    assert f"0 hit(s), {n} miss(es)" in _run(monkeypatch, capsys, "--dir", str(mixed_dir), "--strict")[2]
+
+
+def test_cache_evicts_least_recently_used(mixed_dir, cache_dir, monkeypatch, capsys):
+    _run(monkeypatch, capsys, "--dir", str(mixed_dir), "--strict")
+    for i, cp in enumerate(_entries(cache_dir)):
+        os.utime(cp, ns=(i * 10**9, i * 10**9))  # all older than the next hit
+    keep = mixed_dir / "Haptic_Example.json"
+    assert "1 hit(s), 0 miss(es)" in _run(monkeypatch, capsys, "--file", str(keep), "--strict", "--cache-max-entries", "3")[2]
+    assert len(_entries(cache_dir)) == 3
+    # the entry just read survived; the oldest ones went
+    assert "1 hit(s), 0 miss(es)" in _run(monkeypatch, capsys, "--file", str(keep), "--strict")[2]
+
+
+def test_no_cache_neither_reads_nor_writes(mixed_dir, cache_dir, monkeypatch, capsys):
+    code, out, err = _run(monkeypatch, capsys, "--dir", str(mixed_dir), "--strict", "--no-cache")
+    assert not cache_dir.exists()
+    assert "result cache" not in err
+
+    _run(monkeypatch, capsys, "--dir", str(mixed_dir), "--strict")
+    for cp in _entries(cache_dir):
+        cp.write_text(json.dumps({"errors": ["stale"]}))
+    before = {cp: cp.read_bytes() for cp in _entries(cache_dir)}
+    assert _run(monkeypatch, capsys, "--dir", str(mixed_dir), "--strict", "--no-cache")[:2] == (code, out)
+    assert {cp: cp.read_bytes() for cp in _entries(cache_dir)} == before
+    # without --no-cache the planted entries are what gets replayed
+    assert "stale" in _run(monkeypatch, capsys, "--dir", str(mixed_dir), "--strict")[1]
+
+
+def _ndjson(path, records):
+    path.write_text("".join(r + "\n" for r in records))
+    return str(path)
+
+
+def _rows(path, jobs=1):
+    out = io.StringIO()
+    counts = validate_examples.validate_ndjson(path, out, jobs=jobs)
+    return counts, [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def test_ndjson_rows_and_line_numbers(tmp_path):
+    good = json.dumps(json.loads((EXAMPLES / "Haptic_Example.json").read_text()))
+    bad = json.loads(good)
+    bad["$schema"] = bad["$schema"].replace("haptic", "no-such")
+    path = _ndjson(tmp_path / "in.ndjson", [good, "", "{not json", good, "   ", json.dumps(bad)])
+
+    (total, failed), rows = _rows(path)
+    assert (total, failed) == (4, 2)
+    assert [r["line"] for r in rows] == [1, 3, 4, 6]  # 1-based, blank lines skipped but counted
+    assert [r["ok"] for r in rows] == [True, False, True, False]
+    for r in rows:
+        assert set(r) == {"line", "ok", "schema", "errors", "ms"}
+        assert isinstance(r["ms"], float) and r["ms"] >= 0
+        assert all(set(e) == {"stage", "pointer", "message"} for e in r["errors"])
+    assert rows[0]["schema"] == "haptic.schema.json" and rows[0]["errors"] == []
+    assert rows[1]["schema"] is None and rows[1]["errors"][0]["stage"] == "parse"
+    assert rows[3]["errors"][0]["stage"] == "dispatch"
+
+
+def test_ndjson_jobs_keep_input_order_across_windows(tmp_path, monkeypatch):
+    records = []
+    for p in sorted(EXAMPLES.glob("*.json")):
+        records.append(json.dumps(json.loads(p.read_text())))
+        records.append("[]" if len(records) % 3 else "")
+    path = _ndjson(tmp_path / "in.ndjson", records)
+    monkeypatch.setattr(validate_examples, "NDJSON_BATCH_PER_JOB", 2)  # windows of 4 records
+
+    serial_counts, serial = _rows(path)
+    counts, parallel = _rows(path, jobs=2)
+    assert counts == serial_counts and serial_counts[0] > 8
+    for rows in (serial, parallel):
+        for r in rows:
+            del r["ms"]
+    assert parallel == serial
+    assert [r["line"] for r in parallel] == sorted(r["line"] for r in parallel)
@@ -0,0 +1,103 @@
+import json
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "python" / "src"))
+from synesthetic_schemas.validation import AssetValidator  # noqa: E402
+
+EXAMPLES = REPO_ROOT / "docs" / "examples" / "0.7.3"
+
+
+def _examples():
+    return [json.loads(p.read_text()) for p in sorted(EXAMPLES.glob("*.json"))]
+
+
+def test_examples_validate_clean_with_roundtrip():
+    v = AssetValidator(level="roundtrip")
+    results = list(v.validate_many(_examples()))
+    assert results and all(r.ok for r in results), [r.errors for r in results if not r.ok]
+
+
+def test_structured_errors_carry_pointers_and_stages():
+    v = AssetValidator()
+    doc = {"$schemaRef": "jsonschema/shader.schema.json", "name": 3, "vertex_shader": "v", "fragment_shader": "f"}
+    r = v.validate(doc)
+    assert not r.ok
+    assert r.schema == "shader.schema.json"
+    assert ("schema", "/name") in {(e.stage, e.pointer) for e in r.errors}
+    assert ("model", "/name") in {(e.stage, e.pointer) for e in r.errors}
+
+
+def test_default_schema_and_unknown_dispatch():
+    v = AssetValidator(default_schema="shader.schema.json")
+    assert v.validate({"name": "s", "vertex_shader": "v", "fragment_shader": "f"}).ok
+    r = v.validate({"$schema": "nope.schema.json"})
+    assert r.schema is None and r.errors[0].stage == "dispatch"
+
+
+def test_schema_level_skips_model_stage():
+    v = AssetValidator(level="schema")
+    doc = {"$schemaRef": "jsonschema/shader.schema.json", "name": 3, "vertex_shader": "v", "fragment_shader": "f"}
+    assert {e.stage for e in v.validate(doc).errors} == {"schema"}
+
+
+def test_roundtrip_diff_prunes_defaults_and_reports_paths():
+    from synesthetic_schemas.validation import roundtrip_diff
+
+    class Dumped:
+        def __init__(self, out):
+            self.out = out
+
+        def model_dump(self, **_):
+            return self.out
+
+    data = {"a": {"axis": "mouse.x", "sensitivity": 1, "scale": 1.0}, "n": 1, "z": None}
+    assert roundtrip_diff(data, Dumped({"a": {"axis": "mouse.x", "sensitivity": 1.0}, "n": 1.0})) == []
+    assert roundtrip_diff(data, Dumped({"a": {"axis": "mouse.y", "sensitivity": 1}, "n": 2, "x": 0})) == [
+        (("x",), "added in output"),
+        (("a", "axis"), "'mouse.x' != 'mouse.y'"),
+        (("n",), "1.0 != 2.0"),
+    ]
+
+
+def test_validate_json_matches_dict_path_on_examples():
+    full = AssetValidator(level="roundtrip")
+    models_only = AssetValidator(level="model", json_schema=False)
+    for p in sorted(EXAMPLES.glob("*.json")):
+        raw = p.read_bytes()
+        assert full.validate_json(raw) == full.validate(json.loads(raw)), p.name
+        r = models_only.validate_json(raw)
+        assert r.ok and r.schema == full.schema_for(json.loads(raw)), p.name
+
+
+def test_validate_json_models_only_errors():
+    v = AssetValidator(level="model", json_schema=False)
+    r = v.validate_json(b'{"$schema": "jsonschema/rule.schema.json", "id": 3, "x": 1}')
+    assert r.schema == "rule.schema.json"
+    assert {(e.stage, e.pointer) for e in r.errors} == {("model", "/id"), ("model", "/x")}
+    assert v.validate_json(b"{bad").errors[0].stage == "parse"
+    assert v.validate_json(b"[1]").errors[0].stage == "dispatch"
+    assert v.validate_json(b'{"id": "r"}', schema="rule.schema.json").ok
+
+
+def test_json_schema_off_requires_model_level():
+    import pytest
+
+    with pytest.raises(ValueError):
+        AssetValidator(level="schema", json_schema=False)
+
+
+def test_packaged_schemas_match_jsonschema_and_are_used_without_checkout(monkeypatch, tmp_path):
+    import synesthetic_schemas.validation as validation
+
+    packaged = REPO_ROOT / "python" / "src" / "synesthetic_schemas" / "schemas"
+    source = REPO_ROOT / "jsonschema"
+    assert {p.name: p.read_bytes() for p in packaged.glob("*.schema.json")} == {
+        p.name: p.read_bytes() for p in source.glob("*.schema.json")
+    }
+    # an installed package has no checkout next to it: fall back to the package data
+    monkeypatch.delenv(validation.SCHEMA_DIR_ENV, raising=False)
+    monkeypatch.setattr(validation, "__file__", str(tmp_path / "site-packages" / "synesthetic_schemas" / "validation.py"))
+    assert validation.default_schema_dir() == packaged
+    assert AssetValidator(level="schema").validate(_examples()[0]).ok